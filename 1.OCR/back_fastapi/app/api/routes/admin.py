@@ -0,0 +1,59 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse, Response
+
+from app.core.profiler import MODE_SAMPLING, profiler
+from app.core.security import require_admin
+
+# 모든 관리자 API는 X-Admin-Token 헤더 필요
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+@router.post("/profile/start")
+async def start_profile(
+    mode: Literal["sampling", "cprofile"] = Query(MODE_SAMPLING, description="sampling: 스택 샘플링 (collapsed stack) / cprofile: 결정적 프로파일링 (pstats)"),
+    requests: int = Query(0, ge=0, description="이 수만큼 요청이 끝나면 종료 (0 = 시간으로만 종료)"),
+    seconds: float = Query(None, gt=0, description="최대 실행 시간 (초, 기본 PROFILER_DEFAULT_SECONDS)"),
+    interval_ms: float = Query(None, gt=0, description="sampling 모드 샘플 간격 (ms)"),
+    stall_threshold_ms: float = Query(None, gt=0, description="이벤트 루프 멈춤으로 기록할 최소 지연 (ms)"),
+):
+    """프로파일링 세션 시작 (다음 N개 요청 또는 T초 동안, 이 워커 프로세스만)"""
+    session = profiler.start(mode, requests, seconds, interval_ms, stall_threshold_ms)
+    return session.snapshot()
+
+@router.post("/profile/stop")
+async def stop_profile():
+    """실행 중인 프로파일링 세션을 바로 종료"""
+    session = profiler.stop("manual")
+    return session.snapshot() if session is not None else {"running": False}
+
+@router.get("/profile")
+async def get_profile_status():
+    """프로파일링 세션 상태와 이벤트 루프 멈춤 기록 (스택 포함) 조회"""
+    session = profiler.session
+    return session.snapshot() if session is not None else {"running": False}
+
+@router.get("/profile/result")
+async def get_profile_result(
+    format: Literal["collapsed", "pstats", "text"] = Query("collapsed", description="collapsed: sampling 결과 / pstats, text: cprofile 결과"),
+    limit: int = Query(50, ge=1, le=1000, description="text 형식에서 출력할 함수 수"),
+):
+    """
+    종료된 세션의 프로파일 결과 다운로드
+
+    - collapsed: flamegraph.pl, speedscope, inferno 입력 형식 ('스레드;프레임;... 샘플수')
+    - pstats: python -m pstats, snakeviz, flameprof 입력 파일
+    - text: 누적 시간 상위 함수 목록
+    """
+    if format == "collapsed":
+        return PlainTextResponse(
+            profiler.collapsed(),
+            headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'}
+        )
+    if format == "pstats":
+        return Response(
+            profiler.pstats_bytes(),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": 'attachment; filename="profile.pstats"'}
+        )
+    return PlainTextResponse(profiler.pstats_text(limit))
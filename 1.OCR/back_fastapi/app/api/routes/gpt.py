@@ -1,12 +1,15 @@
 from fastapi import APIRouter, HTTPException
 from typing import List
+import asyncio
 
 from app.services.gpt_service import GPTService
 from app.models.request import GPTRequest
 from app.models.response import GPTResponse
 from app.config.settings import settings
+from app.core.responses import FastJSONResponse
+from app.services.title_index import title_index
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 gpt_service = GPTService()
 
 @router.post("/analyze", response_model=GPTResponse)
@@ -46,6 +49,21 @@ async def extract_book_title(request: GPTRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"책 제목 추출 중 오류가 발생했습니다: {str(e)}")
 
+@router.get("/title-index/search")
+async def search_title_index(q: str, top_k: int = 5):
+    """로컬 제목 인덱스 검색 (OCR 텍스트 보정 확인용)"""
+    return {
+        "query": q,
+        "results": [{"title": title, "score": score} for title, score in title_index.search(q, top_k)],
+        "index_size": len(title_index)
+    }
+
+@router.post("/title-index/refresh")
+async def refresh_title_index():
+    """도서 목록 파일이 바뀌었으면 새 제목만 인덱스에 추가"""
+    added = await asyncio.to_thread(title_index.refresh)
+    return {"added": added, "index_size": len(title_index)}
+
 @router.post("/summarize", response_model=GPTResponse)
 async def summarize_text(request: GPTRequest):
     """텍스트 요약"""
@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from app.core.metrics import metrics
+
 router = APIRouter()
 
 @router.get("/health")
@@ -8,4 +10,9 @@ async def health_check():
     return {
         "status": "healthy",
         "message": "서버가 정상적으로 실행 중입니다."
-    } 
\ No newline at end of file
+    } 
+
+@router.get("/metrics")
+async def get_metrics():
+    """서버 내부 메트릭 조회 엔드포인트 (OCR 배치 크기 등, 워커 프로세스별 값)"""
+    return metrics.snapshot()
\ No newline at end of file
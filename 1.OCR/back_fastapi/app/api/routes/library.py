@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Request, Response
+
+from app.services.library_service import library_service
+
+router = APIRouter()
+
+
+@router.get("/{endpoint}")
+async def proxy_library_api(endpoint: str, request: Request):
+    """
+    도서관 정보나루 API 프록시 (srchBooks, srchDtlList, libSrch, libSrchByBook, loanItemSrch)
+
+    쿼리 파라미터는 그대로 전달하며 (같은 이름이 여러 번 오면 모두 전달) authKey는 서버 설정값을 사용합니다.
+    응답 헤더 X-Cache로 캐시 상태(HIT / STALE / MISS)를 확인할 수 있습니다.
+    """
+    body, content_type, cache_status = await library_service.fetch(endpoint, request.query_params.multi_items())
+    return Response(content=body, media_type=content_type, headers={"X-Cache": cache_status})
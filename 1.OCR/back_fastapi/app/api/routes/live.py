@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+import cv2
+import numpy as np
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from app.config.settings import settings
+from app.services.frame_gate import FrameGate
+from app.services.ocr_scheduler import ocr_scheduler
+from app.services.ocr_service import OCRService
+
+router = APIRouter()
+ocr_service = OCRService()
+
+
+def _recognize_frame(frame: np.ndarray) -> list:
+    """안정된 프레임 OCR (OCR 스케줄러 작업 스레드에서 실행, fallback 전처리 없이 1회)"""
+    return ocr_service._read_text(ocr_service._resize_image(frame))
+
+
+@router.websocket("/live")
+async def live_camera_ocr(websocket: WebSocket):
+    """
+    실시간 카메라 OCR (WebSocket)
+
+    클라이언트는 저해상도 JPEG/PNG 프레임을 바이너리 메시지로 계속 전송합니다.
+    서버는 프레임마다 움직임/선명도 상태({"type": "status", ...})를 보내고,
+    표지가 몇 프레임 연속으로 멈춰 있고 선명할 때만 OCR을 실행하여
+    결과({"type": "result", "result": OCRResponse})를 같은 소켓으로 보냅니다.
+    """
+    await websocket.accept()
+    gate = FrameGate()
+    send_lock = asyncio.Lock()
+    ocr_task = None
+
+    async def send(message: dict):
+        # 프레임 상태 전송과 OCR 결과 전송이 겹치지 않도록 직렬화
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def run_ocr(frame: np.ndarray):
+        start_time = time.time()
+        try:
+            results = await ocr_scheduler.run(_recognize_frame, frame)
+            if not results:
+                # 텍스트가 없으면 같은 정지 구간에서도 다시 시도
+                gate.rearm()
+            response = ocr_service._build_response("live-frame", results, "")
+            response.processing_time_ms = (time.time() - start_time) * 1000
+            await send({"type": "result", "result": response.model_dump()})
+        except Exception as e:
+            print(f"❌ 실시간 OCR 실패: {e}")
+            await send({"type": "error", "message": f"OCR 처리 중 오류가 발생했습니다: {str(e)}"})
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            data = message.get("bytes")
+            if not data:
+                await send({"type": "error", "message": "프레임은 바이너리 이미지 메시지로 보내야 합니다."})
+                continue
+            if len(data) > settings.OCR_LIVE_MAX_FRAME_BYTES:
+                await send({"type": "error", "message": "프레임 크기가 너무 큽니다. 저해상도 프레임을 보내주세요."})
+                continue
+
+            frame = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+            if frame is None:
+                await send({"type": "error", "message": "프레임 이미지를 디코딩할 수 없습니다."})
+                continue
+
+            # 이전 OCR이 진행 중이면 측정만 하고 프레임은 버림
+            busy = ocr_task is not None and not ocr_task.done()
+            state = gate.update(frame, allow_fire=not busy)
+            await send({"type": "status", "busy": busy, **state})
+
+            if state["ready"]:
+                ocr_task = asyncio.create_task(run_ocr(frame))
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if ocr_task is not None and not ocr_task.done():
+            ocr_task.cancel()
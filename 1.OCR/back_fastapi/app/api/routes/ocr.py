@@ -1,21 +1,66 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+import asyncio
 import os
-from typing import List
+import time
+from typing import List, Optional
 
 from app.services.ocr_service import OCRService
-from app.models.request import OCRRequest, CombinedRequest
-from app.models.response import OCRResponse, CombinedResponse
+from app.models.request import OCRRequest, BatchOCRRequest, CombinedRequest
+from app.models.response import OCRResponse, BatchOCRResponse, CombinedResponse
 from app.config.settings import settings
+from app.core.responses import BoxFormat, FastJSONResponse, apply_box_format, result_cache_control
 from app.services.gpt_service import GPTService
+from app.services.document_service import DocumentService
+from app.services.library_service import library_service
+from app.services.ocr_scheduler import LANE_BULK, LANE_INTERACTIVE, ocr_lane, ocr_scheduler
+from app.services.distributed_queue import distributed_queue
+from app.services import reader_registry
+from app.services.storage import content_type, result_storage
+from app.core.exceptions import DeadlineExceededException, LibraryAPIException
+from app.core.deadline import check_deadline, request_deadline
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 ocr_service = OCRService()
 gpt_service = GPTService()
+document_service = DocumentService(ocr_service)
 
-@router.post("/extract", response_model=OCRResponse)
-async def extract_text_from_image(file: UploadFile = File(...)):
+def require_ocr_capacity(lane: str):
+    """
+    라우트 의존성 생성: 레인의 OCR 대기 지연이 계속 목표를 넘는 과부하 상태면 작업 시작 전에 503 + Retry-After로 거절
+    (bulk 작업 대기가 길어져도 interactive 요청은 거절하지 않도록 라우트의 레인 기준으로 확인)
+    """
+    def dependency():
+        ocr_scheduler.admit(lane)
+        if distributed_queue.enabled:
+            distributed_queue.admit()
+
+    return dependency
+
+interactive_capacity = require_ocr_capacity(LANE_INTERACTIVE)
+bulk_capacity = require_ocr_capacity(LANE_BULK)
+
+# 라우트별 기본 마감 시간 (헤더 X-Request-Timeout-Ms로 변경 가능), 연결이 끊기면 남은 작업 중단
+interactive_deadline = request_deadline(settings.OCR_REQUEST_DEADLINE_MS)
+bulk_deadline = request_deadline(settings.BULK_REQUEST_DEADLINE_MS)
+
+def use_languages(languages: Optional[List[str]]):
+    """요청 인식 언어 검증 후 이 요청의 OCR 리더 언어로 설정 (None이면 기본 언어)"""
+    if not languages:
+        return
+    try:
+        reader_registry.ocr_languages.set(reader_registry.validate_languages(languages))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/extract", response_model=OCRResponse, dependencies=[Depends(interactive_capacity), Depends(interactive_deadline)])
+async def extract_text_from_image(
+    file: UploadFile = File(...),
+    box_format: BoxFormat = Query("full", description="바운딩 박스 형식 (full / int16 / columnar / none)"),
+    languages: Optional[List[str]] = Query(None, description="인식 언어 (예: languages=en, 기본: ko, en)")
+):
     """이미지에서 텍스트 추출"""
+    use_languages(languages)
     try:
         # 파일 확장자 검증
         file_extension = os.path.splitext(file.filename)[1].lower()
@@ -34,14 +79,20 @@ async def extract_text_from_image(file: UploadFile = File(...)):
         
         # OCR 처리
         result = await ocr_service.extract_text(file)
-        return result
+        return apply_box_format(result, box_format)
         
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OCR 처리 중 오류가 발생했습니다: {str(e)}")
 
-@router.post("/batch-extract", response_model=List[OCRResponse])
-async def extract_text_from_multiple_images(files: List[UploadFile] = File(...)):
+@router.post("/batch-extract", response_model=List[OCRResponse], dependencies=[Depends(bulk_capacity), Depends(bulk_deadline)])
+async def extract_text_from_multiple_images(
+    files: List[UploadFile] = File(...),
+    box_format: BoxFormat = Query("full", description="바운딩 박스 형식 (full / int16 / columnar / none)")
+):
     """여러 이미지에서 텍스트 추출"""
+    ocr_lane.set(LANE_BULK)
     try:
         results = []
         for file in files:
@@ -55,56 +106,196 @@ async def extract_text_from_multiple_images(files: List[UploadFile] = File(...))
             
             # OCR 처리
             result = await ocr_service.extract_text(file)
-            results.append(result)
+            results.append(apply_box_format(result, box_format))
         
         return results
         
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"배치 OCR 처리 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/extract-url", response_model=OCRResponse, dependencies=[Depends(interactive_capacity), Depends(interactive_deadline)])
+async def extract_text_from_url(
+    request: OCRRequest,
+    box_format: BoxFormat = Query("full", description="바운딩 박스 형식 (full / int16 / columnar / none)")
+):
+    """URL 이미지에서 텍스트 추출"""
+    if not request.image_url:
+        raise HTTPException(status_code=400, detail="image_url이 필요합니다.")
+    use_languages(request.languages)
+    
+    try:
+        result = await ocr_service.extract_text_from_url(request.image_url)
+        return apply_box_format(result, box_format)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"URL OCR 처리 중 오류가 발생했습니다: {str(e)}")
+
+@router.post("/batch-extract-url", response_model=BatchOCRResponse, dependencies=[Depends(bulk_capacity), Depends(bulk_deadline)])
+async def extract_text_from_multiple_urls(
+    request: BatchOCRRequest,
+    box_format: BoxFormat = Query("full", description="바운딩 박스 형식 (full / int16 / columnar / none)")
+):
+    """
+    여러 URL 이미지에서 텍스트 추출
+    
+    모든 URL을 동시에 다운로드하고(호스트별 동시성 제한), 다운로드가 끝난 이미지부터 OCR하여
+    앞선 이미지의 OCR과 나머지 다운로드가 겹쳐서 진행됩니다.
+    실패한 URL은 error_message가 채워진 결과로 같은 순서에 포함됩니다.
+    """
+    ocr_lane.set(LANE_BULK)
+    if len(request.image_urls) > settings.OCR_URL_BATCH_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"URL이 너무 많습니다. 최대 개수: {settings.OCR_URL_BATCH_MAX}"
+        )
+    
+    outcomes = await asyncio.gather(
+        *(ocr_service.extract_text_from_url(url) for url in request.image_urls),
+        return_exceptions=True
+    )
+    
+    results = []
+    for url, outcome in zip(request.image_urls, outcomes):
+        if isinstance(outcome, OCRResponse):
+            results.append(apply_box_format(outcome, box_format))
+            continue
+        
+        detail = outcome.detail if isinstance(outcome, HTTPException) else str(outcome)
+        results.append(OCRResponse(
+            original_filename=url,
+            extracted_text="",
+            confidence_scores=[],
+            bounding_boxes=[],
+            result_image_url="",
+            total_text_count=0,
+            error_message=detail
+        ))
+    
+    failed_files = sum(1 for result in results if result.error_message)
+    return BatchOCRResponse(
+        results=results,
+        total_files=len(results),
+        successful_files=len(results) - failed_files,
+        failed_files=failed_files
+    )
+
+@router.post("/extract-document", dependencies=[Depends(bulk_capacity), Depends(bulk_deadline)])
+async def extract_text_from_document(file: UploadFile = File(...)):
+    """
+    다중 페이지 문서(TIFF/PDF) 페이지별 텍스트 추출
+    
+    페이지를 하나씩 디코딩하여 OCR하고, 페이지 결과를 NDJSON(한 줄에 한 페이지)으로 스트리밍합니다.
+    마지막 줄은 {"done": true, ...} 요약입니다.
+    """
+    ocr_lane.set(LANE_BULK)
+    # 파일 확장자 검증
+    file_extension = os.path.splitext(file.filename)[1].lower()
+    if file_extension not in settings.ALLOWED_DOCUMENT_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 문서 형식입니다. 지원 형식: {settings.ALLOWED_DOCUMENT_EXTENSIONS}"
+        )
+    
+    # 파일 크기 검증
+    if file.size > settings.MAX_DOCUMENT_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"문서 크기가 너무 큽니다. 최대 크기: {settings.MAX_DOCUMENT_SIZE // (1024*1024)}MB"
+        )
+    
+    # 압축된 문서 내용만 메모리에 두고, 페이지 디코딩은 스트리밍 중에 한 페이지씩 수행
+    contents = await file.read()
+    return StreamingResponse(
+        document_service.stream_pages(contents, file.filename),
+        media_type="application/x-ndjson"
+    )
+
 @router.get("/result/{filename}")
-async def get_result_image(filename: str):
-    """처리된 결과 이미지 반환"""
-    file_path = os.path.join(settings.RESULTS_DIR, filename)
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="결과 이미지를 찾을 수 없습니다.")
+async def get_result_image(filename: str, request: Request):
+    """
+    처리된 결과 이미지 반환 (파일명이 내용 해시이므로 ETag로 사용하고 장기 캐시 허용)
+    
+    S3 결과 저장소의 proxy URL 방식에서는 어느 노드든 저장소에서 읽어 전달합니다.
+    """
+    filename = os.path.basename(filename)
+    etag = f'"{filename}"'
+    headers = {"ETag": etag, "Cache-Control": result_cache_control()}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    
+    file_path = result_storage.local_path(filename)
+    if file_path is not None:
+        return FileResponse(file_path, headers=headers)
     
-    return FileResponse(file_path)
+    data = await asyncio.to_thread(result_storage.get, filename)
+    if data is None:
+        raise HTTPException(status_code=404, detail="결과 이미지를 찾을 수 없습니다.")
+    return Response(data, media_type=content_type(filename), headers=headers)
 
-@router.post("/extract-and-analyze", response_model=CombinedResponse)
+@router.post("/extract-and-analyze", response_model=CombinedResponse, dependencies=[Depends(interactive_capacity), Depends(interactive_deadline)])
 async def extract_and_analyze_file(
     file: UploadFile = File(...),
     mode: str = "prod",
-    gpt_prompt: str = "책 제목 추출"
+    gpt_prompt: str = "책 제목 추출",
+    box_format: BoxFormat = Query("full", description="바운딩 박스 형식 (full / int16 / columnar / none)"),
+    resolve_isbn: bool = Query(False, description="추출한 제목을 도서 검색으로 ISBN 후보까지 변환"),
+    isbn_top_k: int = Query(5, ge=1, le=20, description="반환할 ISBN 후보 수"),
+    languages: Optional[List[str]] = Query(None, description="인식 언어 (예: languages=en, 기본: ko, en)")
 ):
     """OCR + GPT 통합 엔드포인트 (파일 업로드 방식)"""
+    use_languages(languages)
     try:
         # OCR 처리
         ocr_result = await ocr_service.extract_text(file)
         
-        # GPT 책 제목 추출
-        gpt_result = await gpt_service.extract_book_title(ocr_result.extracted_text)
+        # GPT 책 제목 추출 (요청이 이미 마감/취소되었으면 호출하지 않음)
+        check_deadline("gpt")
+        gpt_result = await gpt_service.extract_book_title(ocr_result.extracted_text, ocr_result)
         
         # 총 처리 시간 계산
         total_processing_time_ms = (ocr_result.processing_time_ms or 0) + (gpt_result.response_time_ms or 0)
         
+        # 제목 → ISBN 후보 (클라이언트의 별도 검색 왕복 대신 같은 요청에서 처리)
+        book_matches = None
+        isbn_resolution_ms = None
+        if resolve_isbn and gpt_result.gpt_response and not gpt_result.error_message:
+            check_deadline("isbn")
+            start_time = time.time()
+            title = gpt_result.gpt_response.replace("추정:", "").strip()
+            try:
+                book_matches = await library_service.resolve_title(title, top_k=isbn_top_k)
+            except LibraryAPIException as e:
+                print(f"⚠️ ISBN 검색 건너뜀: {e.detail}")
+                book_matches = []
+            isbn_resolution_ms = (time.time() - start_time) * 1000
+            total_processing_time_ms += isbn_resolution_ms
+        
         return CombinedResponse(
-            ocr_result=ocr_result,
+            ocr_result=apply_box_format(ocr_result, box_format),
             gpt_result=gpt_result,
-            total_processing_time_ms=total_processing_time_ms
+            total_processing_time_ms=total_processing_time_ms,
+            book_matches=book_matches,
+            isbn_resolution_ms=isbn_resolution_ms
         )
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OCR+GPT 통합 처리 중 오류: {str(e)}")
 
-@router.post("/extract-and-analyze-test", response_model=CombinedResponse)
+@router.post("/extract-and-analyze-test", response_model=CombinedResponse, dependencies=[Depends(bulk_capacity), Depends(bulk_deadline)])
 async def extract_and_analyze_test(request: CombinedRequest):
     """OCR + GPT 통합 엔드포인트 (테스트 모드 - JSON 요청)"""
+    ocr_lane.set(LANE_BULK)
     try:
         # OCR 처리
         ocr_result = await ocr_service.extract_text_with_mode(image_path=request.image_url, mode="test")
         
-        # GPT 책 제목 추출
-        gpt_result = await gpt_service.extract_book_title(ocr_result.extracted_text)
+        # GPT 책 제목 추출 (요청이 이미 마감/취소되었으면 호출하지 않음)
+        check_deadline("gpt")
+        gpt_result = await gpt_service.extract_book_title(ocr_result.extracted_text, ocr_result)
         
         # 총 처리 시간 계산
         total_processing_time_ms = (ocr_result.processing_time_ms or 0) + (gpt_result.response_time_ms or 0)
@@ -114,5 +305,7 @@ async def extract_and_analyze_test(request: CombinedRequest):
             gpt_result=gpt_result,
             total_processing_time_ms=total_processing_time_ms
         )
+    except DeadlineExceededException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OCR+GPT 통합 처리 중 오류: {str(e)}") 
\ No newline at end of file
@@ -8,6 +8,7 @@
 - API 및 서버 설정
 - CORS 설정 (프론트엔드 연동용)
 - OpenAI API 설정
+- 도서관 정보나루 API 설정
 - EasyOCR 설정
 - 파일 업로드 설정
 - 보안 설정
@@ -49,18 +50,173 @@ class Settings:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")  # OpenAI API 키 (.env에서 로드)
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")  # 사용할 GPT 모델
     
+    # ==================== 프롬프트 구성 설정 ====================
+    # OCR 텍스트를 신뢰도/글자 크기로 정리하고 중복을 제거한 뒤 프롬프트 종류별 토큰 예산 안으로 줄여서 전송
+    PROMPT_COMPACTION: bool = os.getenv("PROMPT_COMPACTION", "true").lower() == "true"  # OCR 텍스트 압축 사용 여부
+    PROMPT_BUDGET_BOOK_TITLE: int = int(os.getenv("PROMPT_BUDGET_BOOK_TITLE", "256"))  # 책 제목 추출 프롬프트의 OCR 텍스트 토큰 예산
+    PROMPT_MIN_CONFIDENCE: float = float(os.getenv("PROMPT_MIN_CONFIDENCE", "0.2"))  # 프롬프트에 넣을 최소 OCR 신뢰도
+    PROMPT_MIN_RELATIVE_HEIGHT: float = float(os.getenv("PROMPT_MIN_RELATIVE_HEIGHT", "0.2"))  # 가장 큰 글자 대비 최소 글자 높이 비율
+
+    # ==================== 제목 인덱스 설정 ====================
+    # 로컬 도서 목록에서 OCR 텍스트와 가장 가까운 제목을 찾아 GPT 호출 없이 제목 보정
+    TITLE_INDEX_PATH: str = os.getenv("TITLE_INDEX_PATH", "")  # 도서 목록 CSV 또는 SQLite 파일 (비우면 사용 안 함)
+    TITLE_INDEX_SQLITE_QUERY: str = os.getenv("TITLE_INDEX_SQLITE_QUERY", "SELECT title FROM books")  # SQLite 제목 조회 쿼리
+    TITLE_INDEX_NGRAM: int = int(os.getenv("TITLE_INDEX_NGRAM", "3"))  # 자모 n-gram 길이
+    TITLE_INDEX_ACCEPT_SCORE: float = float(os.getenv("TITLE_INDEX_ACCEPT_SCORE", "0.6"))  # 이 점수 이상이면 GPT 호출 생략 (또는 GPT 힌트)
+    TITLE_INDEX_MAX_SPAN_WORDS: int = int(os.getenv("TITLE_INDEX_MAX_SPAN_WORDS", "6"))  # OCR 텍스트에서 비교할 최대 연속 단어 수
+    TITLE_INDEX_MIN_SPAN_CHARS: int = int(os.getenv("TITLE_INDEX_MIN_SPAN_CHARS", "4"))  # 비교할 OCR 구간의 최소 글자 수 (공백/기호 제외)
+    TITLE_INDEX_MIN_COVERAGE: float = float(os.getenv("TITLE_INDEX_MIN_COVERAGE", "0.6"))  # GPT를 생략하려면 일치 구간이 가장 큰 글씨 줄에서 차지해야 하는 최소 비율
+    TITLE_INDEX_COMPACT_THRESHOLD: int = int(os.getenv("TITLE_INDEX_COMPACT_THRESHOLD", "1000"))  # 증분 추가분 병합 기준 개수
+    
+    # ==================== 도서관 정보나루 API 설정 ====================
+    # 프론트엔드 대신 서버가 data4library API를 호출하고 응답을 공유 캐시에 보관
+    LIBRARY_API_KEY: str = os.getenv("LIBRARY_API_KEY", "")  # 정보나루 인증키 (.env에서 로드)
+    LIBRARY_API_BASE_URL: str = os.getenv("LIBRARY_API_BASE_URL", "http://data4library.kr/api")  # 정보나루 API 주소 (테스트 시 로컬 대체 서버)
+    LIBRARY_API_TIMEOUT: float = float(os.getenv("LIBRARY_API_TIMEOUT", "15"))  # 원본 API 타임아웃 (초)
+    LIBRARY_MAX_CONCURRENCY: int = int(os.getenv("LIBRARY_MAX_CONCURRENCY", "8"))  # 워커당 원본 API 동시 호출 수
+    LIBRARY_CACHE_TTL: int = int(os.getenv("LIBRARY_CACHE_TTL", "3600"))  # 캐시 신선 유지 시간 (초)
+    LIBRARY_CACHE_STALE_TTL: int = int(os.getenv("LIBRARY_CACHE_STALE_TTL", "86400"))  # TTL 이후 오래된 응답을 제공하며 갱신하는 시간 (초)
+    LIBRARY_CACHE_MAX_ENTRIES: int = int(os.getenv("LIBRARY_CACHE_MAX_ENTRIES", "2000"))  # 캐시 최대 항목 수
+    LIBRARY_RESOLVE_DEADLINE_MS: float = float(os.getenv("LIBRARY_RESOLVE_DEADLINE_MS", "1500"))  # 제목 → ISBN 검색 마감 시간 (ms)
+    LIBRARY_RESOLVE_MAX_QUERIES: int = int(os.getenv("LIBRARY_RESOLVE_MAX_QUERIES", "3"))  # 제목당 동시 검색어 수
+    
     # ==================== EasyOCR 설정 ====================
     OCR_LANGUAGES: list = ["ko", "en"]  # OCR에서 인식할 언어 (한국어, 영어)
+    # 언어 조합별 리더 풀: 요청에서 languages를 지정하면 해당 조합의 리더를 처음 사용할 때 생성
+    OCR_ALLOWED_LANGUAGES: list = os.getenv("OCR_ALLOWED_LANGUAGES", "ko,en,ja,ch_sim").split(",")  # 요청에서 지정할 수 있는 언어
+    OCR_READER_POOL_MAX_READERS: int = int(os.getenv("OCR_READER_POOL_MAX_READERS", "3"))  # 워커당 최대 리더 수
+    OCR_READER_POOL_MAX_MB: float = float(os.getenv("OCR_READER_POOL_MAX_MB", "512"))  # 워커당 인식기 메모리 예산 (MB)
+    OCR_READER_ESTIMATED_MB: float = float(os.getenv("OCR_READER_ESTIMATED_MB", "60"))  # 크기를 잴 수 없는 인식기(ONNX 등)의 추정 크기 (MB)
+    # 2단계 OCR: 축소 이미지(1024px)에서 텍스트 영역을 검출하고 원본 해상도 크롭으로 인식
+    OCR_TWO_PASS: bool = os.getenv("OCR_TWO_PASS", "false").lower() == "true"  # 2단계(coarse-to-fine) OCR 사용 여부
+    OCR_TWO_PASS_MAX_SIZE: int = int(os.getenv("OCR_TWO_PASS_MAX_SIZE", "3072"))  # 인식 단계 원본 이미지 최대 크기 (긴 변 px)
+    OCR_FUSION_IOU_THRESHOLD: float = float(os.getenv("OCR_FUSION_IOU_THRESHOLD", "0.5"))  # 전처리 변형 결과 융합 시 같은 영역으로 볼 IoU
+    # 적응형 fallback: 채택 이력이 좋은 전처리 변형부터 시도 (기본은 모든 변형 결과를 융합하여 재현율 유지)
+    OCR_ADAPTIVE_STRATEGY: bool = os.getenv("OCR_ADAPTIVE_STRATEGY", "true").lower() == "true"  # 적응형 전처리 선택 사용 여부
+    OCR_STRATEGY_EARLY_STOP: bool = os.getenv("OCR_STRATEGY_EARLY_STOP", "false").lower() == "true"  # 새 변형이 새 텍스트를 더하지 못하면 나머지 변형 생략 (재현율 측정 후 사용)
+    OCR_STRATEGY_ACCEPT_CONFIDENCE: float = float(os.getenv("OCR_STRATEGY_ACCEPT_CONFIDENCE", "0.5"))  # 변형 결과를 채택으로 볼 최소 신뢰도
+    OCR_STRATEGY_STATE_PATH: str = os.getenv("OCR_STRATEGY_STATE_PATH", "models/ocr_strategy.json")  # 변형별 채택 이력 저장 경로
+    OCR_STRATEGY_SAVE_EVERY: int = int(os.getenv("OCR_STRATEGY_SAVE_EVERY", "20"))  # 이 건수만큼 기록하면 저장
+    OCR_STRATEGY_SAVE_INTERVAL: float = float(os.getenv("OCR_STRATEGY_SAVE_INTERVAL", "30"))  # 마지막 저장 후 이 시간(초)이 지나면 저장
+
+    # ==================== 멀티 워커 설정 ====================
+    # gunicorn.conf.py로 실행할 때 사용하는 설정
+    # preload 모드에서는 마스터가 fork 전에 EasyOCR 모델을 로딩하여 워커들이 메모리를 공유
+    OCR_WORKERS: int = int(os.getenv("OCR_WORKERS", "1"))  # 워커 프로세스 수
+    OCR_PRELOAD_MODELS: bool = os.getenv("OCR_PRELOAD_MODELS", "true").lower() == "true"  # fork 전 모델 선로딩 여부
+    OCR_MMAP_WEIGHTS: bool = os.getenv("OCR_MMAP_WEIGHTS", "true").lower() == "true"  # 가중치 파일 mmap 로딩 여부
+    OCR_TORCH_THREADS: int = int(os.getenv("OCR_TORCH_THREADS", "0"))  # 워커당 torch 스레드 수 (0 = 코어 수 / 워커 수)
+    OCR_PIN_CORES: bool = os.getenv("OCR_PIN_CORES", "false").lower() == "true"  # 워커별로 겹치지 않는 코어 집합에 고정 (Linux)
+
+    # ==================== 스레드 예산 설정 ====================
+    # 워커의 스레드 예산을 진행 중인 OCR 작업 수로 나누어 torch/OpenCV 스레드 수를 배정
+    OCR_MAX_CONCURRENT_JOBS: int = int(os.getenv("OCR_MAX_CONCURRENT_JOBS", "0"))  # 워커당 동시 OCR 작업 수 (0 = 스레드 예산 / 작업당 최소 스레드)
+    OCR_MIN_THREADS_PER_JOB: int = int(os.getenv("OCR_MIN_THREADS_PER_JOB", "2"))  # 작업당 최소 스레드 수
+    OCR_LANE_INTERACTIVE_WEIGHT: float = float(os.getenv("OCR_LANE_INTERACTIVE_WEIGHT", "4"))  # interactive 레인 가중치 (단일 업로드, 실시간 카메라)
+    OCR_LANE_BULK_WEIGHT: float = float(os.getenv("OCR_LANE_BULK_WEIGHT", "1"))  # bulk 레인 가중치 (일괄 처리, 최소 보장 비율 = bulk / 전체)
+
+    # ==================== 과부하 차단 설정 ====================
+    # OCR 작업 대기 시간이 목표를 일정 시간 이상 계속 넘으면 새 요청을 503 + Retry-After로 바로 거절
+    OCR_ADMISSION_CONTROL: bool = os.getenv("OCR_ADMISSION_CONTROL", "true").lower() == "true"  # 대기 지연 기반 수락 제어 사용 여부
+    OCR_ADMISSION_TARGET_MS: float = float(os.getenv("OCR_ADMISSION_TARGET_MS", "2000"))  # 목표 대기 시간 (ms)
+    OCR_ADMISSION_INTERVAL_MS: float = float(os.getenv("OCR_ADMISSION_INTERVAL_MS", "5000"))  # 목표 초과가 이 시간 이상 계속되면 차단 (ms)
+
+    # ==================== 요청 마감 시간 설정 ====================
+    # 마감 시간이 지나거나 클라이언트 연결이 끊기면 남은 OCR 변형, 결과 이미지 생성, GPT 호출을 중단
+    REQUEST_DEADLINE_HEADER: str = os.getenv("REQUEST_DEADLINE_HEADER", "X-Request-Timeout-Ms")  # 클라이언트가 남은 시간(ms)을 보내는 헤더
+    OCR_REQUEST_DEADLINE_MS: float = float(os.getenv("OCR_REQUEST_DEADLINE_MS", "55000"))  # 단일 요청 기본 마감 시간 (프론트엔드 60초 제한보다 짧게)
+    BULK_REQUEST_DEADLINE_MS: float = float(os.getenv("BULK_REQUEST_DEADLINE_MS", "300000"))  # 일괄 처리 요청 기본 마감 시간
+    REQUEST_DEADLINE_MAX_MS: float = float(os.getenv("REQUEST_DEADLINE_MAX_MS", "600000"))  # 헤더로 요청할 수 있는 최대 마감 시간
+    REQUEST_DISCONNECT_POLL_INTERVAL: float = float(os.getenv("REQUEST_DISCONNECT_POLL_INTERVAL", "0.5"))  # 연결 끊김 확인 주기 (초)
+
+    # ==================== 분산 작업 큐 설정 ====================
+    # redis: API 노드는 OCR 작업을 Redis Stream에 넣고 워커 노드(python -m app.tools.ocr_worker)가 처리 (redis 패키지 필요)
+    OCR_QUEUE_BACKEND: str = os.getenv("OCR_QUEUE_BACKEND", "local")  # OCR 작업 실행 위치 (local / redis)
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")  # Redis 주소
+    OCR_QUEUE_STREAM: str = os.getenv("OCR_QUEUE_STREAM", "ocr:jobs")  # 작업 스트림 이름
+    OCR_QUEUE_GROUP: str = os.getenv("OCR_QUEUE_GROUP", "ocr-workers")  # 워커 컨슈머 그룹 이름
+    OCR_QUEUE_MAXLEN: int = int(os.getenv("OCR_QUEUE_MAXLEN", "10000"))  # 스트림 최대 길이 (근사 trim)
+    OCR_QUEUE_BLOCK_MS: int = int(os.getenv("OCR_QUEUE_BLOCK_MS", "5000"))  # 작업/응답 대기 한 번의 최대 시간 (ms)
+    OCR_QUEUE_CLAIM_IDLE_MS: int = int(os.getenv("OCR_QUEUE_CLAIM_IDLE_MS", "60000"))  # 이 시간 넘게 ACK되지 않은 작업은 다른 워커가 재처리 (ms)
+    OCR_QUEUE_MAX_DELIVERIES: int = int(os.getenv("OCR_QUEUE_MAX_DELIVERIES", "3"))  # 최대 전달 횟수 (넘으면 실패 응답 후 dead-letter)
+    OCR_QUEUE_RESULT_TIMEOUT: float = float(os.getenv("OCR_QUEUE_RESULT_TIMEOUT", "60"))  # 마감 시간이 없는 요청의 결과 대기 시간 (초)
+    OCR_QUEUE_PAYLOAD_TTL: int = int(os.getenv("OCR_QUEUE_PAYLOAD_TTL", "600"))  # 작업 이미지/응답 스트림 만료 시간 (초)
+    OCR_QUEUE_MAX_INFLIGHT: int = int(os.getenv("OCR_QUEUE_MAX_INFLIGHT", "200"))  # API 노드당 결과를 기다리는 최대 작업 수 (넘으면 503)
+
+    # ==================== 인식 마이크로 배칭 설정 ====================
+    # 동시에 진행 중인 요청들의 텍스트 크롭을 모아 인식기 forward 한 번으로 처리
+    OCR_BATCHING: bool = os.getenv("OCR_BATCHING", "false").lower() == "true"  # 요청 간 인식 배칭 사용 여부
+    OCR_BATCH_MAX_SIZE: int = int(os.getenv("OCR_BATCH_MAX_SIZE", "64"))  # 배치 하나의 최대 크롭 수
+    OCR_BATCH_MAX_WAIT_MS: float = float(os.getenv("OCR_BATCH_MAX_WAIT_MS", "5"))  # 다른 요청의 크롭을 기다리는 최대 시간 (ms)
+
+    # ==================== 추론 백엔드 설정 ====================
+    # torch: EasyOCR 기본 PyTorch 실행 / onnx: ONNX Runtime 실행 (CPU 최적화)
+    OCR_BACKEND: str = os.getenv("OCR_BACKEND", "torch")  # 추론 백엔드 (torch / onnx)
+    OCR_ONNX_DIR: str = os.getenv("OCR_ONNX_DIR", "models/onnx")  # ONNX 모델 저장 경로
+    OCR_ONNX_QUANTIZE: bool = os.getenv("OCR_ONNX_QUANTIZE", "true").lower() == "true"  # 인식기 int8 동적 양자화 사용 여부
+    OCR_ONNX_QUANTIZE_DETECTOR: bool = os.getenv("OCR_ONNX_QUANTIZE_DETECTOR", "false").lower() == "true"  # 검출기(CRAFT)도 int8 양자화할지 여부
+    OCR_ONNX_AUTO_EXPORT: bool = os.getenv("OCR_ONNX_AUTO_EXPORT", "true").lower() == "true"  # 모델 파일이 없으면 시작 시 자동 변환
     
     # ==================== 파일 업로드 설정 ====================
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 최대 파일 크기 (10MB)
     ALLOWED_EXTENSIONS: list = [".jpg", ".jpeg", ".png", ".bmp", ".tiff"]  # 허용된 이미지 형식
+    ALLOWED_DOCUMENT_EXTENSIONS: list = [".tif", ".tiff", ".pdf"]  # 다중 페이지 문서 형식
+    MAX_DOCUMENT_SIZE: int = int(os.getenv("MAX_DOCUMENT_SIZE", str(50 * 1024 * 1024)))  # 최대 문서 크기 (50MB)
+    OCR_DOCUMENT_PAGE_CONCURRENCY: int = int(os.getenv("OCR_DOCUMENT_PAGE_CONCURRENCY", "2"))  # 문서당 동시 OCR 페이지 수
+    OCR_PDF_DPI: int = int(os.getenv("OCR_PDF_DPI", "150"))  # PDF 페이지 렌더링 해상도
     UPLOAD_DIR: str = "app/static/uploads"   # 업로드된 파일 저장 경로
     RESULTS_DIR: str = "app/static/results"  # OCR 결과 이미지 저장 경로
+    OCR_RESULT_IMAGE_FORMAT: str = os.getenv("OCR_RESULT_IMAGE_FORMAT", "jpg")  # 결과 이미지 형식 (jpg / webp)
+    OCR_RESULT_IMAGE_QUALITY: int = int(os.getenv("OCR_RESULT_IMAGE_QUALITY", "85"))  # 결과 이미지 인코딩 품질 (0~100)
+    OCR_RESULT_THUMBNAILS: bool = os.getenv("OCR_RESULT_THUMBNAILS", "true").lower() == "true"  # 결과 이미지 썸네일 생성 여부
+    OCR_THUMBNAIL_SIZE: int = int(os.getenv("OCR_THUMBNAIL_SIZE", "320"))  # 썸네일 최대 크기 (긴 변 px)
+    RESULT_CACHE_MAX_AGE: int = 365 * 24 * 60 * 60  # 결과 이미지 캐시 유지 시간 (내용 해시 파일명이므로 1년)
+    
+    # ==================== URL 이미지 수집 설정 ====================
+    # 워커당 하나의 HTTP 연결 풀을 공유하고 ETag/Last-Modified 기반 디스크 캐시 사용
+    OCR_URL_MAX_BYTES: int = int(os.getenv("OCR_URL_MAX_BYTES", str(10 * 1024 * 1024)))  # URL 이미지 최대 크기 (10MB)
+    OCR_URL_TIMEOUT: float = float(os.getenv("OCR_URL_TIMEOUT", "10"))  # 다운로드 타임아웃 (초)
+    OCR_URL_MAX_CONNECTIONS: int = int(os.getenv("OCR_URL_MAX_CONNECTIONS", "20"))  # 연결 풀 최대 연결 수
+    OCR_URL_PER_HOST_CONCURRENCY: int = int(os.getenv("OCR_URL_PER_HOST_CONCURRENCY", "4"))  # 호스트별 동시 다운로드 수
+    OCR_URL_CACHE_DIR: str = os.getenv("OCR_URL_CACHE_DIR", "cache/url")  # URL 이미지 디스크 캐시 경로
+    OCR_URL_CACHE_MAX_FILES: int = int(os.getenv("OCR_URL_CACHE_MAX_FILES", "500"))  # 캐시 최대 항목 수
+    OCR_URL_BATCH_MAX: int = int(os.getenv("OCR_URL_BATCH_MAX", "50"))  # 배치 URL 요청당 최대 URL 수
+    OCR_URL_MAX_REDIRECTS: int = int(os.getenv("OCR_URL_MAX_REDIRECTS", "5"))  # 따라갈 최대 리다이렉트 수
+    OCR_URL_ALLOW_PRIVATE: bool = os.getenv("OCR_URL_ALLOW_PRIVATE", "false").lower() == "true"  # 내부 네트워크 주소 허용 (로컬 테스트용)
+    
+    # ==================== 실시간 카메라 OCR 설정 ====================
+    # WebSocket으로 받은 프레임이 연속으로 멈춰 있고 선명할 때만 OCR 실행
+    OCR_LIVE_MOTION_THRESHOLD: float = float(os.getenv("OCR_LIVE_MOTION_THRESHOLD", "6.0"))  # 정지로 볼 최대 평균 프레임 차이 (0~255)
+    OCR_LIVE_SHARPNESS_THRESHOLD: float = float(os.getenv("OCR_LIVE_SHARPNESS_THRESHOLD", "100.0"))  # 선명하다고 볼 최소 라플라시안 분산
+    OCR_LIVE_STABLE_FRAMES: int = int(os.getenv("OCR_LIVE_STABLE_FRAMES", "3"))  # OCR 실행 전 연속 안정 프레임 수
+    OCR_LIVE_MAX_FRAME_BYTES: int = 512 * 1024  # 프레임 메시지 최대 크기 (512KB)
+
+    # ==================== 결과 저장소 설정 ====================
+    # local: 노드 로컬 디렉토리(RESULTS_DIR) / s3: S3 호환 오브젝트 스토리지 (여러 노드 공유, boto3 필요)
+    RESULT_STORAGE_BACKEND: str = os.getenv("RESULT_STORAGE_BACKEND", "local")  # 결과 저장소 (local / s3)
+    RESULT_STORAGE_URL_MODE: str = os.getenv("RESULT_STORAGE_URL_MODE", "presigned")  # S3 결과 URL 방식 (presigned / proxy / public)
+    S3_BUCKET: str = os.getenv("S3_BUCKET", "")  # 결과 저장 버킷
+    S3_PREFIX: str = os.getenv("S3_PREFIX", "ocr-results/")  # 객체 키 접두사
+    S3_ENDPOINT_URL: str = os.getenv("S3_ENDPOINT_URL", "")  # S3 호환 서버 주소 (MinIO, moto_server 등, 비어 있으면 AWS)
+    S3_REGION: str = os.getenv("S3_REGION", "")  # 리전 (비어 있으면 boto3 기본값)
+    S3_ACCESS_KEY_ID: str = os.getenv("S3_ACCESS_KEY_ID", "")  # 접근 키 (비어 있으면 boto3 기본 자격 증명 체인)
+    S3_SECRET_ACCESS_KEY: str = os.getenv("S3_SECRET_ACCESS_KEY", "")  # 비밀 키
+    S3_PRESIGN_EXPIRES: int = int(os.getenv("S3_PRESIGN_EXPIRES", "3600"))  # 서명 URL 유효 시간 (초)
+    S3_PUBLIC_BASE_URL: str = os.getenv("S3_PUBLIC_BASE_URL", "")  # public URL 방식의 공개 버킷/CDN 주소
     
     # ==================== 보안 설정 ====================
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here")  # JWT 토큰 암호화 키
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 액세스 토큰 만료 시간 (8일)
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")  # 관리자 API 토큰 (X-Admin-Token 헤더, 비어 있으면 관리자 API 비활성화)
+
+    # ==================== 프로파일러 설정 ====================
+    # 관리자 API로 다음 N개 요청 또는 T초 동안만 프로파일링 (sampling: collapsed stack / cprofile: pstats)
+    PROFILER_DEFAULT_SECONDS: float = float(os.getenv("PROFILER_DEFAULT_SECONDS", "30"))  # 시간을 지정하지 않았을 때의 세션 길이 (초)
+    PROFILER_MAX_SECONDS: float = float(os.getenv("PROFILER_MAX_SECONDS", "300"))  # 세션 최대 길이 (초, 요청 수 조건과 관계없이 종료)
+    PROFILER_SAMPLE_INTERVAL_MS: float = float(os.getenv("PROFILER_SAMPLE_INTERVAL_MS", "5"))  # sampling 모드 기본 샘플 간격 (ms)
+    PROFILER_STALL_THRESHOLD_MS: float = float(os.getenv("PROFILER_STALL_THRESHOLD_MS", "100"))  # 이벤트 루프 멈춤으로 기록할 기본 최소 지연 (ms)
+    PROFILER_MAX_STALLS: int = int(os.getenv("PROFILER_MAX_STALLS", "100"))  # 세션당 보관할 루프 멈춤 기록 수
+    PROFILER_MAX_STACK_DEPTH: int = int(os.getenv("PROFILER_MAX_STACK_DEPTH", "64"))  # 수집할 최대 스택 깊이
 
 # 전역 설정 인스턴스 생성
 # 다른 모듈에서 from app.config.settings import settings로 사용
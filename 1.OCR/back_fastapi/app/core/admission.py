@@ -0,0 +1,100 @@
+"""
+OCR 작업 수락 제어 모듈 (CoDel 방식 대기 지연 기반 부하 차단)
+
+요청이 몰리면 OCR 작업 대기열이 계속 길어지고, 결국 모든 요청이 프론트엔드의 60초 제한에 걸려
+처리한 작업까지 버려지게 됩니다. 대기열 길이 대신 실제로 측정한 대기 시간(작업 제출 ~ 실행 시작)을 보고
+지연이 목표를 일정 시간 이상 계속 넘으면, 대기열에 쌓일 새 작업을 바로 거절(503 + Retry-After)합니다.
+
+동작 방식 (CoDel: Controlled Delay):
+- 작업이 실행을 시작할 때마다 대기 시간을 기록
+- 대기 시간이 목표(OCR_ADMISSION_TARGET_MS) 미만이면 정상 상태로 복귀
+- 목표 이상인 상태가 간격(OCR_ADMISSION_INTERVAL_MS) 동안 계속되면 차단 상태로 전환
+  (짧은 순간적인 몰림은 허용하고, 계속 쌓이는 대기열만 차단)
+- 차단 상태에서는 대기 중인 작업이 있을 때만 새 작업을 거절하므로 작업 스레드는 계속 일을 하여
+  처리량(goodput)은 유지되고, 대기 중인 작업이 없으면 차단 상태를 해제
+- Retry-After는 최근 대기 시간을 기준으로 계산
+"""
+
+import math
+import threading
+import time
+
+from app.config.settings import settings
+from app.core.exceptions import OverloadedException
+from app.core.metrics import metrics
+
+# 대기 시간 히스토그램 구간 (밀리초)
+QUEUE_DELAY_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class CoDelAdmission:
+    """
+    대기 지연 기반 작업 수락 제어기
+
+    Attributes:
+        name (str): 수락 제어 대상 이름 (레인 이름, 로그/메트릭 라벨)
+        target (float): 목표 대기 시간 (초)
+        interval (float): 목표 초과가 이 시간 동안 계속되면 차단 (초)
+    """
+
+    def __init__(self, target_ms: float = None, interval_ms: float = None, name: str = ""):
+        self.name = name
+        self.target = (target_ms or settings.OCR_ADMISSION_TARGET_MS) / 1000
+        self.interval = (interval_ms or settings.OCR_ADMISSION_INTERVAL_MS) / 1000
+        self._lock = threading.Lock()
+        self._first_above_time = None  # 목표 초과가 간격 동안 계속되면 차단할 시각
+        self._dropping = False
+        self._last_delay = 0.0
+
+    @property
+    def dropping(self) -> bool:
+        """현재 차단 상태 여부"""
+        return self._dropping
+
+    def record(self, queue_delay: float):
+        """
+        작업 실행 시작 시 대기 시간 기록 (작업 스레드에서 호출)
+
+        Args:
+            queue_delay (float): 작업 제출부터 실행 시작까지 걸린 시간 (초)
+        """
+        metrics.observe("ocr_queue_delay_ms", queue_delay * 1000, QUEUE_DELAY_BUCKETS_MS)
+        now = time.monotonic()
+        with self._lock:
+            self._last_delay = queue_delay
+            if queue_delay < self.target:
+                self._first_above_time = None
+                if self._dropping:
+                    print(f"✅ OCR 대기 지연 정상화 ({self.name} {queue_delay * 1000:.0f}ms), 작업 수락 재개")
+                self._dropping = False
+            elif self._first_above_time is None:
+                self._first_above_time = now + self.interval
+            elif now >= self._first_above_time and not self._dropping:
+                self._dropping = True
+                print(f"🚦 OCR 대기 지연 {queue_delay * 1000:.0f}ms가 {self.interval:.1f}초 이상 지속, 새 {self.name} 작업 거절 시작")
+
+    def check(self, waiting_jobs: int):
+        """
+        새 작업 수락 여부 확인 (거절 시 OverloadedException)
+
+        Args:
+            waiting_jobs (int): 실행을 기다리고 있는 작업 수
+        """
+        if not settings.OCR_ADMISSION_CONTROL:
+            return
+        with self._lock:
+            if not self._dropping:
+                return
+            if waiting_jobs == 0:
+                # 대기열이 비었으면 새 작업은 바로 실행되므로 차단 해제
+                self._dropping = False
+                self._first_above_time = None
+                return
+            retry_after = max(1, math.ceil(self._last_delay))
+
+        metrics.increment("ocr_admission_rejected")
+        if self.name:
+            metrics.increment(f"ocr_admission_rejected_{self.name}")
+        raise OverloadedException(
+            "OCR 서버가 혼잡합니다. 잠시 후 다시 시도해주세요.", retry_after=retry_after
+        )
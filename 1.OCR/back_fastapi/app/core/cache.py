@@ -0,0 +1,97 @@
+"""
+비동기 응답 캐시 모듈 (TTL + stale-while-revalidate + single-flight)
+
+외부 API 응답을 워커 프로세스 안에서 공유하기 위한 캐시입니다.
+
+동작 방식:
+- TTL 이내: 캐시 값을 바로 반환 (HIT)
+- TTL이 지났지만 stale 허용 시간 이내: 캐시 값을 바로 반환하고 백그라운드에서 갱신 (STALE)
+- 그 외: 원본을 호출하여 채움 (MISS)
+- 같은 키를 동시에 요청하면 원본 호출은 한 번만 하고 나머지는 그 결과를 함께 기다림 (single-flight)
+- 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+from app.core.metrics import metrics
+
+
+class AsyncTTLCache:
+    """
+    TTL / stale-while-revalidate / single-flight 비동기 캐시
+
+    Attributes:
+        name (str): 메트릭 이름 접두사
+        ttl (float): 신선한 상태로 보는 시간 (초)
+        stale_ttl (float): TTL 이후 오래된 값을 그대로 제공할 수 있는 추가 시간 (초)
+        max_entries (int): 최대 항목 수
+    """
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float = 0, max_entries: int = 1000):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (value, stored_at)
+        self._inflight = {}  # key -> asyncio.Future
+
+    async def get_or_load(self, key, loader) -> tuple:
+        """
+        캐시 조회, 없거나 만료되면 loader로 채움
+
+        Args:
+            key: 캐시 키 (해시 가능)
+            loader: 값을 만드는 인자 없는 async 함수
+
+        Returns:
+            tuple: (값, 캐시 상태 "HIT" / "STALE" / "MISS")
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                metrics.increment(f"{self.name}_cache_hit")
+                return value, "HIT"
+            if age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(key)
+                metrics.increment(f"{self.name}_cache_stale")
+                if key not in self._inflight:
+                    # 오래된 값을 먼저 돌려주고 갱신은 백그라운드에서 (실패해도 기존 값 유지)
+                    self._start_load(key, loader).add_done_callback(lambda f: f.exception())
+                return value, "STALE"
+
+        metrics.increment(f"{self.name}_cache_miss")
+        future = self._inflight.get(key) or self._start_load(key, loader)
+        # 먼저 시작한 요청이 취소되어도 원본 호출은 계속되도록 shield
+        return await asyncio.shield(future), "MISS"
+
+    def _start_load(self, key, loader) -> asyncio.Future:
+        """원본 호출 시작 (키당 하나만 진행)"""
+        async def load():
+            try:
+                value = await loader()
+                self._store(key, value)
+                return value
+            finally:
+                self._inflight.pop(key, None)
+
+        future = asyncio.ensure_future(load())
+        self._inflight[key] = future
+        return future
+
+    def _store(self, key, value):
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,170 @@
+"""
+요청 마감 시간 전파 및 연결 끊김 취소 모듈
+
+브라우저가 요청을 포기한 뒤에도 서버는 fallback 전처리 변형 전체, 결과 이미지 생성, GPT 호출까지
+끝까지 수행하여 아무도 읽지 않을 응답에 CPU를 씁니다. 요청마다 마감 시간을 정하고
+작업 단계 사이(checkpoint)에서 마감 시간 초과나 클라이언트 연결 끊김을 확인하여 남은 작업을 중단합니다.
+
+동작 방식:
+- 마감 시간은 요청 헤더(REQUEST_DEADLINE_HEADER, 남은 시간 밀리초) 또는 라우트별 기본값
+  (헤더 값은 REQUEST_DEADLINE_MAX_MS로 제한)
+- 라우트 의존성(request_deadline)이 마감 시간을 컨텍스트 변수(current_deadline)에 넣고
+  클라이언트 연결 끊김을 주기적으로 확인하는 감시 작업을 실행
+- OCR 스케줄러 대기, 전처리 변형 사이, 결과 이미지 생성 전, GPT 호출 전에 check_deadline()으로 확인
+  (OCR 작업 스레드에는 스케줄러가 컨텍스트를 복사하여 전달)
+- 중단 시 DeadlineExceededException(504)을 발생시키고 requests_cancelled 메트릭을 사유/단계별로 기록
+"""
+
+import asyncio
+import contextvars
+import time
+
+from fastapi import Request
+
+from app.config.settings import settings
+from app.core.exceptions import DeadlineExceededException
+from app.core.metrics import metrics
+
+# 중단 사유
+REASON_DEADLINE = "deadline"
+REASON_DISCONNECTED = "disconnected"
+
+# 현재 요청의 마감 시간 (없으면 None: 마감 시간 없이 실행)
+current_deadline = contextvars.ContextVar("current_deadline", default=None)
+
+
+class Deadline:
+    """
+    요청 하나의 마감 시간과 취소 상태
+
+    Attributes:
+        expires_at (float): 마감 시각 (time.monotonic 기준)
+        reason (str): 취소된 경우 사유 (deadline / disconnected)
+    """
+
+    def __init__(self, timeout_ms: float):
+        self.expires_at = time.monotonic() + timeout_ms / 1000
+        self.reason = None
+        self._cancelled = asyncio.Event()
+        self._counted = False
+
+    @classmethod
+    def from_header(cls, value: str, default_ms: float) -> "Deadline":
+        """요청 헤더 값(밀리초)으로 생성, 없거나 잘못된 값이면 기본값 사용"""
+        try:
+            timeout_ms = float(value) if value else default_ms
+        except ValueError:
+            timeout_ms = default_ms
+        if timeout_ms <= 0:
+            timeout_ms = default_ms
+        return cls(min(timeout_ms, settings.REQUEST_DEADLINE_MAX_MS))
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 0 이상)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def done(self) -> bool:
+        """마감 시간이 지났거나 취소되었는지 여부"""
+        return self.reason is not None or time.monotonic() >= self.expires_at
+
+    def cancel(self, reason: str = REASON_DISCONNECTED):
+        """요청 취소 (이벤트 루프에서 호출)"""
+        if self.reason is None:
+            self.reason = reason
+        self._cancelled.set()
+
+    def check(self, stage: str):
+        """
+        마감 시간 초과 또는 취소 여부 확인 (해당하면 DeadlineExceededException)
+
+        Args:
+            stage (str): 확인 위치 (queue / variant / render / gpt 등, 메트릭 라벨)
+        """
+        if not self.done:
+            return
+        reason = self.reason or REASON_DEADLINE
+        if not self._counted:
+            # 한 요청은 처음 중단된 단계에서 한 번만 기록
+            self._counted = True
+            metrics.increment("requests_cancelled")
+            metrics.increment(f"requests_cancelled_{reason}")
+            metrics.increment(f"requests_cancelled_at_{stage}")
+            print(f"🛑 요청 중단 ({reason}, 단계: {stage})")
+        detail = "클라이언트 연결이 끊어져 처리를 중단했습니다." if reason == REASON_DISCONNECTED else "요청 처리 마감 시간을 초과했습니다."
+        raise DeadlineExceededException(detail)
+
+    async def guard(self, awaitable, stage: str, on_discard=None):
+        """
+        대기 작업을 마감 시간/취소와 경쟁시켜 실행 (먼저 마감되면 대기 작업을 취소하고 예외 발생)
+
+        Args:
+            awaitable: 기다릴 코루틴 (OCR 스케줄러 슬롯 대기 등)
+            stage (str): 확인 위치 (메트릭 라벨)
+            on_discard: 호출한 쪽이 취소되었을 때 이미 완료된 대기 작업의 결과를 정리하는 함수
+                        (배정받은 슬롯 반환 등)
+        """
+        self.check(stage)
+        task = asyncio.ensure_future(awaitable)
+        cancelled = asyncio.ensure_future(self._cancelled.wait())
+        try:
+            await asyncio.wait({task, cancelled}, timeout=self.remaining(), return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            # 호출한 쪽이 취소되면 대기 작업도 취소하고 끝날 때까지 기다려 정리
+            task.cancel()
+            try:
+                await task
+            except BaseException:
+                pass
+            if on_discard is not None and task.done() and not task.cancelled() and task.exception() is None:
+                on_discard(task.result())
+            raise
+        finally:
+            cancelled.cancel()
+        if task.done():
+            return task.result()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        self.expires_at = min(self.expires_at, time.monotonic())
+        self.check(stage)
+
+
+def check_deadline(stage: str):
+    """현재 요청에 마감 시간이 있으면 확인 (없으면 아무것도 하지 않음)"""
+    deadline = current_deadline.get()
+    if deadline is not None:
+        deadline.check(stage)
+
+
+async def _watch_disconnect(request: Request, deadline: Deadline):
+    """클라이언트 연결 끊김을 주기적으로 확인하여 요청 취소"""
+    while not deadline.done:
+        if await request.is_disconnected():
+            deadline.cancel(REASON_DISCONNECTED)
+            return
+        await asyncio.sleep(settings.REQUEST_DISCONNECT_POLL_INTERVAL)
+
+
+def request_deadline(default_ms: float):
+    """
+    라우트 의존성 생성: 요청 마감 시간 설정 및 연결 끊김 감시
+
+    Args:
+        default_ms (float): 헤더가 없을 때의 마감 시간 (밀리초)
+
+    사용 예:
+        @router.post("/extract", dependencies=[Depends(request_deadline(settings.OCR_REQUEST_DEADLINE_MS))])
+    """
+    async def dependency(request: Request):
+        deadline = Deadline.from_header(request.headers.get(settings.REQUEST_DEADLINE_HEADER), default_ms)
+        current_deadline.set(deadline)
+        watcher = asyncio.ensure_future(_watch_disconnect(request, deadline))
+        try:
+            yield deadline
+        finally:
+            watcher.cancel()
+
+    return dependency
@@ -13,4 +13,34 @@ class GPTException(HTTPException):
 class FileValidationException(HTTPException):
     """파일 검증 관련 예외"""
     def __init__(self, detail: str):
-        super().__init__(status_code=400, detail=detail) 
\ No newline at end of file
+        super().__init__(status_code=400, detail=detail)
+
+class URLFetchException(HTTPException):
+    """URL 이미지 다운로드 관련 예외 (잘못된 URL 400, 크기 초과 413, 원격 서버 오류 502)"""
+    def __init__(self, detail: str, status_code: int = 502):
+        super().__init__(status_code=status_code, detail=detail)
+
+class LibraryAPIException(HTTPException):
+    """도서관 정보나루 API 프록시 관련 예외 (기본: 원본 API 오류 502)"""
+    def __init__(self, detail: str, status_code: int = 502):
+        super().__init__(status_code=status_code, detail=detail)
+
+class DeadlineExceededException(HTTPException):
+    """요청 마감 시간 초과 또는 클라이언트 연결 끊김으로 처리를 중단할 때의 예외"""
+    def __init__(self, detail: str):
+        super().__init__(status_code=504, detail=detail)
+
+class OverloadedException(HTTPException):
+    """서버 과부하로 작업을 거절할 때의 예외 (503 + Retry-After 헤더)"""
+    def __init__(self, detail: str, retry_after: int = 1):
+        super().__init__(status_code=503, detail=detail, headers={"Retry-After": str(retry_after)})
+
+class AdminAuthException(HTTPException):
+    """관리자 API 인증 실패 예외 (토큰 불일치 401, 관리자 API 비활성화 403)"""
+    def __init__(self, detail: str, status_code: int = 401):
+        super().__init__(status_code=status_code, detail=detail)
+
+class ProfilerException(HTTPException):
+    """프로파일링 세션 관련 예외 (이미 실행 중 409, 결과 없음 404, 잘못된 요청 400)"""
+    def __init__(self, detail: str, status_code: int = 400):
+        super().__init__(status_code=status_code, detail=detail) 
\ No newline at end of file
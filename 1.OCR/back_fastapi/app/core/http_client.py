@@ -0,0 +1,239 @@
+"""
+공유 비동기 HTTP 클라이언트 모듈 (URL 이미지 수집용)
+
+요청마다 HTTP 클라이언트를 새로 만들면 TCP/TLS 연결을 매번 다시 맺어야 하므로
+워커 프로세스당 하나의 httpx.AsyncClient 연결 풀을 공유합니다.
+
+주요 기능:
+- 연결 풀 공유 (OCR_URL_MAX_CONNECTIONS) 및 호스트별 동시 다운로드 수 제한
+  (호스트별 세마포어는 대기/사용 중인 요청이 없으면 삭제하므로 호스트 수만큼 쌓이지 않음)
+- 스트리밍 다운로드와 크기 제한 (Content-Length 확인 + 수신 중 누적 크기 확인)
+- 디스크 캐시: ETag/Last-Modified가 있는 응답을 저장하고 조건부 요청(304)으로 재검증
+- SSRF 방지: 호스트 주소를 조회하여 사설/루프백/링크 로컬 등 내부 주소로의 요청을 거절하고,
+  리다이렉트는 자동으로 따라가지 않고 매 단계 주소를 다시 확인하며 따라감 (OCR_URL_MAX_REDIRECTS회까지)
+  확인한 IP로 바로 연결하고 (Host 헤더, TLS SNI/인증서 확인은 원래 호스트 이름)
+  확인 후 연결 전에 DNS 응답이 내부 주소로 바뀌는 DNS rebinding을 막음
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import ipaddress
+import json
+import os
+import socket
+import tempfile
+from urllib.parse import urljoin, urlparse
+
+import httpx
+
+from app.config.settings import settings
+from app.core.exceptions import URLFetchException
+
+
+class HTTPFetcher:
+    """
+    URL 이미지 다운로더
+
+    Attributes:
+        max_bytes (int): 다운로드 최대 크기
+        cache_dir (str): 디스크 캐시 경로
+    """
+
+    def __init__(self, max_bytes: int = None, cache_dir: str = None):
+        self.max_bytes = max_bytes or settings.OCR_URL_MAX_BYTES
+        self.cache_dir = cache_dir or settings.OCR_URL_CACHE_DIR
+        self._client = None
+        self._host_limits = {}  # 호스트 -> [세마포어, 대기/사용 중인 요청 수]
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """연결 풀을 공유하는 AsyncClient (워커의 이벤트 루프에서 처음 사용할 때 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=settings.OCR_URL_TIMEOUT,
+                follow_redirects=False,  # 리다이렉트 대상 주소도 확인해야 하므로 fetch()에서 직접 따라감
+                limits=httpx.Limits(
+                    max_connections=settings.OCR_URL_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OCR_URL_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    @contextlib.asynccontextmanager
+    async def _host_slot(self, host: str):
+        """호스트별 동시 다운로드 수 제한 (마지막 요청이 끝나면 세마포어 삭제)"""
+        entry = self._host_limits.get(host)
+        if entry is None:
+            entry = self._host_limits[host] = [asyncio.Semaphore(settings.OCR_URL_PER_HOST_CONCURRENCY), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._host_limits[host]
+
+    async def fetch(self, url: str) -> bytes:
+        """
+        URL의 이미지를 다운로드 (캐시가 유효하면 캐시 사용)
+
+        Args:
+            url (str): http/https 이미지 URL
+
+        Returns:
+            bytes: 이미지 파일 내용
+        """
+        self._check_scheme(url)
+        # 캐시 파일 읽기/쓰기와 정리는 이벤트 루프를 막지 않도록 스레드에서 실행
+        cached = await asyncio.to_thread(self._read_cache, url)
+        headers = {}
+        if cached:
+            if cached["meta"].get("etag"):
+                headers["If-None-Match"] = cached["meta"]["etag"]
+            if cached["meta"].get("last_modified"):
+                headers["If-Modified-Since"] = cached["meta"]["last_modified"]
+
+        current_url = url
+        for _ in range(settings.OCR_URL_MAX_REDIRECTS + 1):
+            hostname, address = await self._check_url(current_url)
+            # 확인한 주소로 연결 (다시 DNS를 조회하지 않음), Host 헤더와 TLS 인증서 확인은 원래 호스트 이름
+            url_obj = httpx.URL(current_url)
+            request_url = url_obj.copy_with(host=address)
+            request_headers = {**headers, "Host": url_obj.netloc.decode("ascii")}
+            extensions = {"sni_hostname": hostname} if url_obj.scheme == "https" else {}
+            location = None
+            async with self._host_slot(hostname):
+                try:
+                    async with self.client.stream(
+                        "GET", request_url, headers=request_headers, extensions=extensions
+                    ) as response:
+                        if response.has_redirect_location:  # is_redirect는 304도 포함하므로 Location이 있는 응답만
+                            location = response.headers["Location"]
+                        elif response.status_code == 304 and cached:
+                            print(f"📦 URL 캐시 사용 (304): {url}")
+                            return cached["body"]
+                        elif response.status_code != 200:
+                            raise URLFetchException(f"이미지 다운로드 실패 (HTTP {response.status_code}): {url}")
+                        else:
+                            body = await self._read_body(response)
+                            meta = {
+                                "url": url,
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                            }
+                except httpx.HTTPError as e:
+                    raise URLFetchException(f"이미지 다운로드 실패: {url} ({e})")
+            if location is None:
+                break
+            current_url = urljoin(current_url, location)
+            self._check_scheme(current_url)
+        else:
+            raise URLFetchException(f"리다이렉트가 너무 많습니다 (최대 {settings.OCR_URL_MAX_REDIRECTS}회): {url}")
+
+        if meta["etag"] or meta["last_modified"]:
+            await asyncio.to_thread(self._write_cache, url, body, meta)
+        return body
+
+    async def _read_body(self, response: httpx.Response) -> bytes:
+        """응답 본문 수신 (Content-Length 확인 + 수신 중 누적 크기 확인)"""
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise URLFetchException(self._too_large_message(), status_code=413)
+
+        chunks = []
+        received = 0
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+            if received > self.max_bytes:
+                raise URLFetchException(self._too_large_message(), status_code=413)
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _check_scheme(url: str):
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise URLFetchException(f"지원하지 않는 URL입니다: {url}", status_code=400)
+
+    async def _check_url(self, url: str) -> tuple:
+        """
+        요청할 호스트의 모든 주소가 공인 주소인지 확인 (내부 주소면 URLFetchException 400)
+
+        OCR_URL_ALLOW_PRIVATE이면 주소 확인은 생략하지만 조회한 주소로 연결하는 것은 같습니다.
+
+        Returns:
+            tuple: (호스트 이름 (호스트별 동시성 제한 키), 연결할 IP 주소)
+        """
+        parsed = urlparse(url)
+        hostname = parsed.hostname
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        try:
+            addresses = await asyncio.get_running_loop().getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+        except socket.gaierror:
+            raise URLFetchException(f"호스트를 찾을 수 없습니다: {hostname}", status_code=400)
+        if not addresses:
+            raise URLFetchException(f"호스트를 찾을 수 없습니다: {hostname}", status_code=400)
+        resolved = []
+        for _, _, _, _, sockaddr in addresses:
+            address = ipaddress.ip_address(sockaddr[0].split("%", 1)[0])
+            if getattr(address, "ipv4_mapped", None):
+                address = address.ipv4_mapped
+            # 사설, 루프백, 링크 로컬(클라우드 메타데이터 169.254.169.254 포함), 예약, 멀티캐스트 주소 등
+            if not address.is_global and not settings.OCR_URL_ALLOW_PRIVATE:
+                raise URLFetchException(f"내부 네트워크 주소로는 요청할 수 없습니다: {hostname}", status_code=400)
+            resolved.append(str(address))
+        return hostname, resolved[0]
+
+    def _too_large_message(self) -> str:
+        return f"이미지 크기가 너무 큽니다. 최대 크기: {self.max_bytes // (1024*1024)}MB"
+
+    def _cache_paths(self, url: str) -> tuple:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.bin"), os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_cache(self, url: str):
+        """캐시된 본문과 검증 정보 조회 (없으면 None)"""
+        body_path, meta_path = self._cache_paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return {"meta": meta, "body": f.read()}
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, url: str, body: bytes, meta: dict):
+        """본문/검증 정보를 원자적으로 저장하고 캐시 파일 수 제한"""
+        body_path, meta_path = self._cache_paths(url)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode("utf-8"))):
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+
+            # 캐시 파일 수 제한 (초과 시 오래된 항목 삭제)
+            entries = sorted(
+                (os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".json")),
+                key=os.path.getmtime,
+            )
+            for old_meta in entries[:-settings.OCR_URL_CACHE_MAX_FILES]:
+                for path in (old_meta, old_meta[:-len(".json")] + ".bin"):
+                    if os.path.exists(path):
+                        os.remove(path)
+        except Exception as e:
+            print(f"⚠️ URL 캐시 저장 실패: {e}")
+
+    async def aclose(self):
+        """연결 풀 종료 (앱 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 전역 HTTP 다운로더 인스턴스
+# 다른 모듈에서 from app.core.http_client import http_fetcher로 사용
+http_fetcher = HTTPFetcher()
@@ -0,0 +1,73 @@
+"""
+애플리케이션 메트릭 모듈
+
+프로세스 내부 카운터와 히스토그램을 모아 /api/metrics 엔드포인트로 제공합니다.
+외부 모니터링 시스템 없이도 OCR 배치 크기 등 동작 상태를 확인하기 위한 용도입니다.
+"""
+
+import threading
+from bisect import bisect_left
+
+# 기본 히스토그램 구간 (개수 계열 값: 배치 크기 등)
+DEFAULT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class Histogram:
+    """고정 구간 히스토그램 (구간별 개수, 합계, 최댓값)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{b}" for b in self.buckets] + ["inf"]
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "buckets": dict(zip(labels, self.bucket_counts)),
+        }
+
+
+class Metrics:
+    """스레드 안전한 카운터/히스토그램 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def increment(self, name: str, value: int = 1):
+        """카운터 증가"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float, buckets=DEFAULT_BUCKETS):
+        """히스토그램에 값 기록 (구간은 최초 기록 시 결정)"""
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(buckets)
+            self._histograms[name].observe(value)
+
+    def snapshot(self) -> dict:
+        """현재 메트릭 값 조회"""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "histograms": {name: h.snapshot() for name, h in self._histograms.items()},
+            }
+
+
+# 전역 메트릭 인스턴스
+# 다른 모듈에서 from app.core.metrics import metrics로 사용
+metrics = Metrics()
@@ -0,0 +1,401 @@
+"""
+요청 단위 온디맨드 프로파일러 모듈
+
+운영 중인 워커가 느려졌을 때 디버거 없이 시간이 어디에 쓰이는지 확인하기 위해
+관리자 API(/api/admin/profile)로 다음 N개 요청 또는 T초 동안만 프로파일링을 켭니다.
+프로파일링이 꺼져 있을 때는 미들웨어가 요청을 그대로 전달하므로 추가 비용이 거의 없습니다.
+
+주요 기능:
+- sampling 모드: 별도 스레드가 일정 간격(PROFILER_SAMPLE_INTERVAL_MS)으로 모든 스레드의 스택을 수집하여
+  collapsed stack 형식(flamegraph.pl, speedscope 입력)으로 집계 (유휴 대기 스택은 제외)
+- cprofile 모드: 이벤트 루프 스레드와 OCR 스케줄러 작업(run_profiled)을 cProfile로 결정적 프로파일링하여
+  pstats 파일로 제공 (snakeviz, flameprof 입력)
+- 이벤트 루프 멈춤 감시: 루프의 하트비트가 임계값(stall_threshold_ms) 이상 늦어지면
+  그 순간 루프 스레드의 스택을 기록하고 event_loop_stall_ms 메트릭에 멈춘 시간을 기록
+
+동작 방식:
+- 세션은 워커 프로세스당 하나만 실행 (gunicorn 멀티 워커에서는 요청을 받은 워커만 프로파일링)
+- ProfilerMiddleware가 세션 시작 이후 시작된 요청의 완료 수를 세어 max_requests에 도달하면 종료
+  (관리자 API, 헬스체크 요청은 제외)
+- 요청 수와 관계없이 seconds(최대 PROFILER_MAX_SECONDS)가 지나면 종료
+- 종료된 세션의 결과는 다음 세션을 시작할 때까지 조회 가능
+"""
+
+import asyncio
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+from app.config.settings import settings
+from app.core.exceptions import ProfilerException
+from app.core.metrics import metrics
+
+# 프로파일링 모드
+MODE_SAMPLING = "sampling"
+MODE_CPROFILE = "cprofile"
+PROFILER_MODES = (MODE_SAMPLING, MODE_CPROFILE)
+
+# 요청 수에 포함하지 않는 경로 (관리자 API 자신, 로드밸런서 헬스체크)
+EXCLUDED_PATH_PREFIXES = ("/api/admin", "/api/health")
+
+# 유휴 대기로 보고 샘플에서 제외할 최상위 프레임 (파일 이름, 함수 이름)
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),  # ThreadPoolExecutor 작업 대기 (SimpleQueue.get은 C 함수라 프레임이 없음)
+    ("selectors.py", "select"),
+}
+
+# 이벤트 루프 멈춤 시간 히스토그램 구간 (ms)
+STALL_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _frame_label(code) -> str:
+    """collapsed stack 프레임 이름 (같은 함수의 다른 줄은 하나로 합침, ';'는 구분자이므로 사용하지 않음)"""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _collapse(frame, max_depth: int) -> list:
+    """프레임에서 바깥쪽 → 안쪽 순서의 프레임 이름 목록 (최대 max_depth개, 안쪽 기준)"""
+    labels = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def _is_idle(frame) -> bool:
+    """락/큐/셀렉터에서 대기 중인 스레드인지 여부"""
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES
+
+
+def _thread_group(name: str) -> str:
+    """스레드 이름에서 번호를 떼어 같은 풀의 스레드를 하나로 묶음 (ocr-job_3 → ocr-job)"""
+    return re.sub(r"[_-]\d+$", "", name)
+
+
+class ProfileSession:
+    """
+    프로파일링 세션 하나의 설정과 수집 결과
+
+    Attributes:
+        mode (str): sampling / cprofile
+        max_requests (int): 이 수만큼 요청이 끝나면 종료 (0 = 요청 수 제한 없음)
+        seconds (float): 최대 실행 시간 (초)
+        stall_threshold_ms (float): 이벤트 루프 멈춤으로 기록할 최소 지연 (ms)
+        stacks (Counter): sampling 모드 collapsed stack → 샘플 수
+        stalls (deque): 이벤트 루프 멈춤 기록 (최근 PROFILER_MAX_STALLS개)
+    """
+
+    def __init__(self, mode: str, max_requests: int, seconds: float, interval_ms: float, stall_threshold_ms: float):
+        self.mode = mode
+        self.max_requests = max_requests
+        self.seconds = seconds
+        self.interval_ms = interval_ms
+        self.stall_threshold_ms = stall_threshold_ms
+        self.started_at = time.time()
+        self.finished_at = None
+        self.stop_reason = None
+        self.requests = 0
+        self.samples = 0
+        self.stacks = Counter()
+        self.stalls = deque(maxlen=settings.PROFILER_MAX_STALLS)
+        self.stats = None  # cprofile 모드 pstats.Stats (작업별 프로파일을 합침)
+        self.shared_profile_jobs = 0  # 작업별 cProfile을 켤 수 없어 루프 프로파일러로만 측정한 작업 수
+        self.lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self.finished_at is None
+
+    def add_profile(self, profile: cProfile.Profile):
+        """작업 하나의 cProfile 결과를 세션 통계에 합침"""
+        with self.lock:
+            if self.stats is None:
+                self.stats = pstats.Stats(profile)
+            else:
+                self.stats.add(profile)
+
+    def snapshot(self) -> dict:
+        """세션 상태 조회 (관리자 API 응답)"""
+        end = self.finished_at or time.time()
+        with self.lock:
+            return {
+                "mode": self.mode,
+                "running": self.running,
+                "stop_reason": self.stop_reason,
+                "started_at": self.started_at,
+                "elapsed_seconds": round(end - self.started_at, 3),
+                "max_requests": self.max_requests,
+                "max_seconds": self.seconds,
+                "requests": self.requests,
+                "samples": self.samples,
+                "unique_stacks": len(self.stacks),
+                "profiled_functions": len(self.stats.stats) if self.stats is not None else 0,
+                "shared_profile_jobs": self.shared_profile_jobs,
+                "stall_threshold_ms": self.stall_threshold_ms,
+                "stalls": list(self.stalls),
+            }
+
+
+class Profiler:
+    """
+    워커 프로세스의 프로파일링 세션 관리 (시작/종료, 샘플링 스레드, 이벤트 루프 멈춤 감시)
+
+    start/stop/request_done은 이벤트 루프 스레드에서 호출합니다
+    (cprofile 모드의 루프 프로파일러가 호출한 스레드에 설정되므로).
+    """
+
+    def __init__(self):
+        self.session = None
+        self._stop_event = threading.Event()
+        self._threads = []
+        self._timer = None
+        self._heartbeat = None
+        self._loop_profile = None
+        self._loop_thread_id = None
+        self._last_beat = 0.0
+
+    @property
+    def active(self) -> bool:
+        """실행 중인 세션이 있는지 여부"""
+        return self.session is not None and self.session.running
+
+    def start(self, mode: str, max_requests: int = 0, seconds: float = None,
+              interval_ms: float = None, stall_threshold_ms: float = None) -> ProfileSession:
+        """
+        프로파일링 세션 시작 (이전 세션 결과는 버림)
+
+        Args:
+            mode (str): sampling / cprofile
+            max_requests (int): 이 수만큼 요청이 끝나면 종료 (0 = 시간으로만 종료)
+            seconds (float): 최대 실행 시간 (초, PROFILER_MAX_SECONDS로 제한)
+            interval_ms (float): sampling 모드 샘플 간격 (ms)
+            stall_threshold_ms (float): 이벤트 루프 멈춤으로 기록할 최소 지연 (ms)
+        """
+        if self.active:
+            raise ProfilerException("이미 프로파일링 세션이 실행 중입니다.", status_code=409)
+        if mode not in PROFILER_MODES:
+            raise ProfilerException(f"지원하지 않는 프로파일링 모드입니다: {mode} (지원: {', '.join(PROFILER_MODES)})", status_code=400)
+        if max_requests < 0:
+            raise ProfilerException("max_requests는 0 이상이어야 합니다.", status_code=400)
+
+        seconds = min(seconds or settings.PROFILER_DEFAULT_SECONDS, settings.PROFILER_MAX_SECONDS)
+        interval_ms = max(1.0, interval_ms or settings.PROFILER_SAMPLE_INTERVAL_MS)
+        stall_threshold_ms = max(10.0, stall_threshold_ms or settings.PROFILER_STALL_THRESHOLD_MS)
+        session = ProfileSession(mode, max_requests, seconds, interval_ms, stall_threshold_ms)
+
+        loop = asyncio.get_running_loop()
+        self.session = session
+        self._stop_event = threading.Event()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._heartbeat = loop.create_task(self._beat(stall_threshold_ms / 4000))
+        self._timer = loop.call_later(seconds, self.stop, "seconds")
+
+        self._threads = [threading.Thread(target=self._watch_stalls, args=(session,), name="profiler-stall-watch", daemon=True)]
+        if mode == MODE_SAMPLING:
+            self._threads.append(threading.Thread(target=self._sample, args=(session,), name="profiler-sampler", daemon=True))
+        else:
+            self._loop_profile = cProfile.Profile()
+            self._loop_profile.enable()
+        for thread in self._threads:
+            thread.start()
+
+        metrics.increment(f"profiler_sessions_{mode}")
+        limit = f"요청 {max_requests}개 또는 " if max_requests else ""
+        print(f"🔬 프로파일링 시작 ({mode}, {limit}최대 {seconds:g}초)")
+        return session
+
+    def stop(self, reason: str = "manual") -> ProfileSession:
+        """실행 중인 세션 종료 (이미 종료되었으면 아무것도 하지 않음)"""
+        session = self.session
+        if session is None or not session.running:
+            return session
+        session.stop_reason = reason
+        session.finished_at = time.time()
+        self._stop_event.set()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        if self._loop_profile is not None:
+            self._loop_profile.disable()
+            session.add_profile(self._loop_profile)
+            self._loop_profile = None
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        print(f"🔬 프로파일링 종료 ({reason}, 요청 {session.requests}개, 샘플 {session.samples}개, 루프 멈춤 {len(session.stalls)}회)")
+        return session
+
+    def request_done(self, session: ProfileSession):
+        """요청 하나가 끝났을 때 호출 (세션 시작 전에 시작된 요청은 세지 않음)"""
+        if session is not self.session or not session.running:
+            return
+        session.requests += 1
+        if session.max_requests and session.requests >= session.max_requests:
+            self.stop("requests")
+
+    def run_profiled(self, func, *args, **kwargs):
+        """
+        cprofile 세션 중이면 func를 cProfile로 감싸 실행하고 결과를 세션에 합침
+        (OCR 스케줄러 작업 스레드에서 호출, cProfile은 호출한 스레드만 측정하므로 작업마다 따로 측정)
+
+        Python 3.12+의 cProfile은 sys.monitoring을 사용하여 프로세스에서 하나만 켤 수 있고
+        켜 둔 프로파일러가 모든 스레드를 측정하므로, 이미 켜진 프로파일러(이벤트 루프 프로파일러 등)가 있으면
+        작업은 그대로 실행하고 그 프로파일러의 결과에 포함됩니다.
+        """
+        session = self.session
+        if session is None or not session.running or session.mode != MODE_CPROFILE:
+            return func(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # Python 3.12+: Another profiling tool is already active
+            with session.lock:
+                session.shared_profile_jobs += 1
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            session.add_profile(profile)
+
+    def collapsed(self) -> str:
+        """sampling 결과를 collapsed stack 형식(한 줄에 '프레임;프레임;... 샘플수')으로 반환"""
+        session = self._finished_session()
+        if session.mode != MODE_SAMPLING:
+            raise ProfilerException("collapsed 형식은 sampling 모드 결과만 지원합니다 (cprofile 모드는 pstats).", status_code=400)
+        with session.lock:
+            lines = [f"{stack} {count}" for stack, count in session.stacks.most_common()]
+        return "\n".join(lines) + "\n"
+
+    def pstats_bytes(self) -> bytes:
+        """cprofile 결과를 pstats 파일 형식(marshal)으로 반환 (pstats.Stats(파일) / snakeviz로 열 수 있음)"""
+        session = self._cprofile_session()
+        with session.lock:
+            return marshal.dumps(session.stats.stats)
+
+    def pstats_text(self, limit: int = 50) -> str:
+        """cprofile 결과 중 누적 시간 상위 함수 목록 (텍스트)"""
+        session = self._cprofile_session()
+        output = io.StringIO()
+        with session.lock:
+            session.stats.stream = output
+            session.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return output.getvalue()
+
+    def _finished_session(self) -> ProfileSession:
+        if self.session is None:
+            raise ProfilerException("프로파일링 결과가 없습니다. 먼저 세션을 시작하세요.", status_code=404)
+        if self.session.running:
+            raise ProfilerException("프로파일링 세션이 아직 실행 중입니다. 종료 후 조회하세요.", status_code=409)
+        return self.session
+
+    def _cprofile_session(self) -> ProfileSession:
+        session = self._finished_session()
+        if session.mode != MODE_CPROFILE:
+            raise ProfilerException("pstats 형식은 cprofile 모드 결과만 지원합니다 (sampling 모드는 collapsed).", status_code=400)
+        if session.stats is None:
+            raise ProfilerException("수집된 프로파일 데이터가 없습니다.", status_code=404)
+        return session
+
+    async def _beat(self, interval: float):
+        """이벤트 루프 하트비트 (감시 스레드가 마지막 하트비트 이후 경과 시간으로 멈춤 판단)"""
+        while True:
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(interval)
+
+    def _watch_stalls(self, session: ProfileSession):
+        """하트비트가 임계값 이상 늦어지면 루프 스레드 스택을 기록하고, 재개되면 멈춘 시간을 확정"""
+        interval = session.stall_threshold_ms / 4000
+        # 하트비트 간격만큼의 지연은 정상이므로 임계값에 더해서 판단
+        threshold = session.stall_threshold_ms / 1000 + interval
+        current = None
+        while not self._stop_event.wait(interval):
+            lag = time.monotonic() - self._last_beat
+            if lag >= threshold:
+                if current is None:
+                    frame = sys._current_frames().get(self._loop_thread_id)
+                    stack = []
+                    while frame is not None and len(stack) < settings.PROFILER_MAX_STACK_DEPTH:
+                        code = frame.f_code
+                        stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                        frame = frame.f_back
+                    current = {"at": time.time() - lag, "duration_ms": 0.0, "stack": stack[::-1]}
+                current["duration_ms"] = round((lag - interval) * 1000, 1)
+            elif current is not None:
+                self._record_stall(session, current)
+                current = None
+        if current is not None:
+            self._record_stall(session, current)
+
+    def _record_stall(self, session: ProfileSession, stall: dict):
+        with session.lock:
+            session.stalls.append(stall)
+        metrics.increment("event_loop_stalls")
+        metrics.observe("event_loop_stall_ms", stall["duration_ms"], STALL_BUCKETS_MS)
+        print(f"⚠️ 이벤트 루프 멈춤 {stall['duration_ms']:.0f}ms: {stall['stack'][-1] if stall['stack'] else '?'}")
+
+    def _sample(self, session: ProfileSession):
+        """모든 스레드의 현재 스택을 주기적으로 수집 (프로파일러 자신과 유휴 대기 스레드 제외)"""
+        interval = session.interval_ms / 1000
+        own_threads = {thread.ident for thread in self._threads}
+        while not self._stop_event.wait(interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            collected = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in own_threads or _is_idle(frame):
+                    continue
+                thread_name = _thread_group(names.get(thread_id, str(thread_id)))
+                if thread_id == self._loop_thread_id:
+                    thread_name = "event-loop"
+                stack = _collapse(frame, settings.PROFILER_MAX_STACK_DEPTH)
+                collected.append(";".join([thread_name] + stack))
+            with session.lock:
+                session.samples += 1
+                session.stacks.update(collected)
+
+
+class ProfilerMiddleware:
+    """
+    프로파일링 세션 중에 끝난 요청 수를 세는 ASGI 미들웨어
+
+    세션이 없으면 요청을 그대로 전달합니다 (BaseHTTPMiddleware와 달리 응답 본문을 감싸지 않음).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        session = profiler.session
+        if (
+            scope["type"] != "http"
+            or session is None
+            or not session.running
+            or scope["path"].startswith(EXCLUDED_PATH_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.request_done(session)
+
+
+# 전역 프로파일러 인스턴스
+# 다른 모듈에서 from app.core.profiler import profiler로 사용
+profiler = Profiler()
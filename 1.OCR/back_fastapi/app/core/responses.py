@@ -0,0 +1,105 @@
+"""
+응답 직렬화 모듈
+
+글자가 많은 페이지에서는 바운딩 박스 목록(박스당 꼭짓점 4개의 float 쌍)의 JSON 직렬화와
+전송 크기가 응답 시간의 대부분을 차지합니다.
+
+주요 기능:
+- FastJSONResponse: FastAPI ORJSONResponse(numpy 배열 직렬화 포함), orjson이 없으면 공백 없는 표준 json으로 직렬화
+- 바운딩 박스 압축 형식 (box_format 쿼리 파라미터, 기본값 full은 기존 형식 유지)
+  - full: bounding_boxes = [[[x, y] x 4], ...] (float)
+  - int16: packed_boxes = little-endian int16 배열(N x 4 x 2)을 base64로 인코딩한 문자열
+  - columnar: columnar_boxes = {"x": [...], "y": [...]} (박스 순서대로 꼭짓점 4개씩, 정수)
+  - none: 박스 생략 (텍스트와 신뢰도만 필요한 경우)
+- CachedStaticFiles: 내용 해시 파일명인 결과 이미지에 immutable 장기 캐시 헤더 추가
+  (ETag/If-None-Match 304 응답은 StaticFiles 기본 동작)
+"""
+
+import base64
+import json
+from typing import Literal
+
+import numpy as np
+from fastapi.responses import ORJSONResponse
+from fastapi.staticfiles import StaticFiles
+
+from app.config.settings import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 지원하는 바운딩 박스 형식
+BoxFormat = Literal["full", "int16", "columnar", "none"]
+
+
+class FastJSONResponse(ORJSONResponse):
+    """ORJSONResponse (OPT_SERIALIZE_NUMPY 포함), orjson(선택 의존성)이 없으면 표준 json으로 직렬화"""
+
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return super().render(content)
+
+
+def boxes_to_array(bounding_boxes: list, dtype=np.float64) -> np.ndarray:
+    """
+    바운딩 박스 목록을 (N, 4, 2) 배열로 변환
+
+    full 형식 응답에 그대로 쓰이므로 기본값은 float64 (float32로 바꾸면 1.1이 1.100000023841858처럼 직렬화됨)
+    정수로 반올림하는 int16 / columnar 형식만 float32로 변환합니다.
+    """
+    if not bounding_boxes:
+        return np.zeros((0, 4, 2), dtype=dtype)
+    return np.asarray(bounding_boxes, dtype=dtype).reshape(-1, 4, 2)
+
+
+def pack_boxes_int16(boxes: np.ndarray) -> str:
+    """(N, 4, 2) 박스 배열을 반올림하여 little-endian int16 base64 문자열로 인코딩"""
+    packed = np.clip(np.rint(boxes), -32768, 32767).astype("<i2")
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def apply_box_format(response, box_format: str = "full"):
+    """
+    OCR 응답의 바운딩 박스를 요청한 형식으로 변환
+
+    Args:
+        response (OCRResponse): OCR 응답 (bounding_boxes가 채워진 상태)
+        box_format (str): full / int16 / columnar / none
+
+    Returns:
+        OCRResponse: 변환된 응답 (같은 객체)
+    """
+    if box_format == "full":
+        return response
+
+    boxes = boxes_to_array(response.bounding_boxes, np.float32)
+    response.bounding_boxes = []
+    response.box_format = box_format
+
+    if box_format == "int16":
+        response.packed_boxes = pack_boxes_int16(boxes)
+    elif box_format == "columnar":
+        rounded = np.rint(boxes).astype(np.int32)
+        response.columnar_boxes = {
+            "x": rounded[:, :, 0].ravel().tolist(),
+            "y": rounded[:, :, 1].ravel().tolist(),
+        }
+    return response
+
+
+def result_cache_control() -> str:
+    """내용 해시 파일명 결과 이미지용 Cache-Control 헤더 값"""
+    return f"public, max-age={settings.RESULT_CACHE_MAX_AGE}, immutable"
+
+
+class CachedStaticFiles(StaticFiles):
+    """결과 이미지(results/)에 immutable 캐시 헤더를 붙이는 정적 파일 서빙"""
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if path.replace("\\", "/").startswith("results/") and response.status_code in (200, 304):
+            response.headers["Cache-Control"] = result_cache_control()
+        return response
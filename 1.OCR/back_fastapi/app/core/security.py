@@ -1,6 +1,9 @@
-from fastapi import FastAPI
+import hmac
+
+from fastapi import FastAPI, Header
 from fastapi.middleware.cors import CORSMiddleware
 from app.config.settings import settings
+from app.core.exceptions import AdminAuthException
 
 def setup_cors(app: FastAPI):
     """CORS 미들웨어 설정"""
@@ -10,4 +13,16 @@ def setup_cors(app: FastAPI):
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-    ) 
\ No newline at end of file
+    )
+
+async def require_admin(x_admin_token: str = Header(default="")):
+    """
+    관리자 API 인증 의존성 (X-Admin-Token 헤더를 ADMIN_TOKEN과 비교)
+
+    ADMIN_TOKEN이 설정되지 않으면 관리자 API 전체를 비활성화합니다.
+    """
+    if not settings.ADMIN_TOKEN:
+        raise AdminAuthException("관리자 API가 비활성화되어 있습니다 (ADMIN_TOKEN 미설정).", status_code=403)
+    # 토큰 비교 시간으로 일치 길이가 드러나지 않도록 상수 시간 비교
+    if not hmac.compare_digest(x_admin_token.encode(), settings.ADMIN_TOKEN.encode()):
+        raise AdminAuthException("관리자 토큰이 올바르지 않습니다.") 
\ No newline at end of file
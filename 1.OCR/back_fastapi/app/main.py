@@ -8,16 +8,24 @@ FastAPI 인스턴스를 생성하고, 미들웨어, 라우터, 정적 파일 서
 - FastAPI 앱 초기화 및 설정
 - CORS 미들웨어 설정 (React 등 프론트엔드 연동용)
 - 정적 파일 서빙 설정 (결과 이미지 제공용)
-- API 라우터 등록 (OCR, GPT, 헬스체크)
+- API 라우터 등록 (OCR, GPT, 헬스체크, 실시간 카메라 OCR, 도서관 API 프록시, 관리자)
+- 온디맨드 프로파일링 미들웨어 (관리자 API로 세션을 켰을 때만 동작)
 """
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+import asyncio
 import os
 
-from app.api.routes import ocr, gpt, health
+from app.api.routes import ocr, gpt, health, live, library, admin
 from app.core.security import setup_cors
+from app.core.http_client import http_fetcher
+from app.core.profiler import ProfilerMiddleware, profiler
+from app.core.responses import CachedStaticFiles
+from app.services import reader_registry
+from app.services.distributed_queue import distributed_queue
+from app.services.strategy_selector import strategy_selector
+from app.services.title_index import title_index
 
 # FastAPI 애플리케이션 인스턴스 생성
 # title, description, version은 Swagger UI에서 표시됩니다
@@ -31,16 +39,43 @@ app = FastAPI(
 # React 등 프론트엔드에서 API 호출을 허용하기 위한 설정
 setup_cors(app)
 
+# 프로파일링 세션 중 요청 수 집계 (세션이 없으면 그대로 통과)
+app.add_middleware(ProfilerMiddleware)
+
 # 정적 파일 서빙 설정
 # app/static 폴더의 파일들을 /static 경로로 제공
 # OCR 결과 이미지 등을 웹에서 접근할 수 있게 함
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+# 결과 이미지는 내용 해시 파일명이므로 immutable 장기 캐시 헤더를 붙여 재다운로드 방지
+app.mount("/static", CachedStaticFiles(directory="app/static"), name="static")
 
 # API 라우터 등록
 # 각 기능별로 라우터를 분리하여 관리
 app.include_router(health.router, prefix="/api", tags=["health"])  # 헬스체크 API
 app.include_router(ocr.router, prefix="/api/ocr", tags=["ocr"])    # OCR 관련 API
 app.include_router(gpt.router, prefix="/api/gpt", tags=["gpt"])    # GPT 관련 API
+app.include_router(live.router, prefix="/api/ocr", tags=["live"])  # 실시간 카메라 OCR (WebSocket)
+app.include_router(library.router, prefix="/api/library", tags=["library"])  # 도서관 정보나루 API 프록시
+app.include_router(admin.router, prefix="/api/admin", tags=["admin"])  # 관리자 API (프로파일링, X-Admin-Token 필요)
+
+@app.on_event("startup")
+async def configure_worker_runtime():
+    """
+    워커 프로세스 시작 시 실행
+
+    gunicorn 멀티 워커 모드에서는 fork 이후 각 워커에서 실행되므로
+    워커 수에 맞춰 torch 스레드 수를 나누어 설정합니다.
+    """
+    reader_registry.configure_worker_threads()
+    # 제목 인덱스 로드 (TITLE_INDEX_PATH 설정 시)
+    await asyncio.to_thread(title_index.refresh)
+
+@app.on_event("shutdown")
+async def close_http_client():
+    """워커 종료 시 공유 HTTP/Redis 연결 풀 정리, 실행 중인 프로파일링 세션 종료, 전처리 선택 이력 저장"""
+    profiler.stop("shutdown")
+    await asyncio.to_thread(strategy_selector.flush)
+    await http_fetcher.aclose()
+    await distributed_queue.aclose()
 
 @app.get("/")
 async def root():
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Dict
 from datetime import datetime
 
 class OCRResponse(BaseModel):
@@ -8,10 +8,15 @@ class OCRResponse(BaseModel):
     extracted_text: str = Field(..., description="추출된 텍스트")
     confidence_scores: List[float] = Field(..., description="신뢰도 점수 목록")
     bounding_boxes: List[List] = Field(..., description="바운딩 박스 좌표")
+    box_format: str = Field("full", description="바운딩 박스 형식 (full / int16 / columnar / none)")
+    packed_boxes: Optional[str] = Field(None, description="int16 형식: N x 4 x 2 little-endian int16 배열의 base64")
+    columnar_boxes: Optional[Dict[str, List[int]]] = Field(None, description="columnar 형식: 꼭짓점 x, y 정수 배열")
     result_image_url: str = Field(..., description="결과 이미지 URL")
+    thumbnail_url: Optional[str] = Field(None, description="결과 이미지 썸네일 URL")
     total_text_count: int = Field(..., description="추출된 텍스트 개수")
     processing_time_ms: Optional[float] = Field(None, description="처리 시간 (밀리초)")
     error_message: Optional[str] = Field(None, description="오류 메시지")
+    text_lines: Optional[List[str]] = Field(None, exclude=True, description="박스별 텍스트 (GPT 프롬프트 구성용, 응답에는 포함하지 않음)")
 
 class GPTResponse(BaseModel):
     """GPT 응답 모델"""
@@ -21,13 +26,27 @@ class GPTResponse(BaseModel):
     gpt_model: str = Field(..., description="사용된 모델")
     tokens_used: int = Field(..., description="사용된 토큰 수")
     response_time_ms: float = Field(..., description="응답 시간 (밀리초)")
+    tokens_saved: int = Field(0, description="OCR 텍스트 압축으로 줄인 프롬프트 토큰 수")
     error_message: Optional[str] = Field(None, description="오류 메시지")
 
+class BookMatch(BaseModel):
+    """책 제목으로 찾은 도서 후보 모델"""
+    isbn13: str = Field(..., description="ISBN13")
+    bookname: str = Field(..., description="도서명")
+    authors: str = Field("", description="저자")
+    publisher: str = Field("", description="출판사")
+    publication_year: str = Field("", description="출판년도")
+    book_image_url: str = Field("", description="표지 이미지 URL")
+    score: float = Field(..., description="제목 유사도 기반 점수")
+    query: str = Field(..., description="이 후보를 찾은 검색어")
+
 class CombinedResponse(BaseModel):
     """OCR + GPT 통합 응답 모델"""
     ocr_result: OCRResponse = Field(..., description="OCR 결과")
     gpt_result: GPTResponse = Field(..., description="GPT 결과")
     total_processing_time_ms: float = Field(..., description="총 처리 시간")
+    book_matches: Optional[List[BookMatch]] = Field(None, description="ISBN 후보 목록 (resolve_isbn 요청 시, 점수 순)")
+    isbn_resolution_ms: Optional[float] = Field(None, description="ISBN 검색 시간 (밀리초)")
 
 class HealthResponse(BaseModel):
     """헬스체크 응답 모델"""
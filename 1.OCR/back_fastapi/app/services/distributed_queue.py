@@ -0,0 +1,355 @@
+"""
+Redis Streams 기반 분산 OCR 작업 큐 모듈
+
+uvicorn 노드를 여러 대 두더라도 각 노드는 자신이 받은 요청만 처리하므로 OCR 전용 워커 노드를 따로 둘 수 없습니다.
+OCR_QUEUE_BACKEND=redis이면 API 노드는 OCR 작업을 Redis Stream에 넣고, 워커 노드(app.tools.ocr_worker)가
+컨슈머 그룹으로 작업을 나누어 가져가 처리한 뒤 결과를 요청한 API 노드로 돌려보냅니다.
+
+동작 방식:
+- 작업 제출 (API 노드):
+  - 이미지 내용은 별도 키(ocr:payload:{작업 ID}, OCR_QUEUE_PAYLOAD_TTL 만료)에 저장하고
+    스트림(OCR_QUEUE_STREAM)에는 작업 ID, 응답 스트림, 언어, 레인, 마감 시각만 추가
+  - 노드마다 응답 스트림(ocr:replies:{노드 ID}) 하나를 읽는 수신 작업이 결과를 대기 중인 요청에 전달
+  - 요청 마감 시간(app.core.deadline)까지 결과가 없으면 504 (워커가 늦게 보낸 결과는 버림)
+- 작업 처리 (워커 노드):
+  - XREADGROUP으로 새 작업을 가져와 처리 후 응답 스트림에 결과를 추가하고 XACK
+  - 처리 중에는 주기적으로 XCLAIM(JUSTID)으로 유휴 시간을 갱신하여 다른 워커가 가져가지 않도록 함
+  - 워커가 죽어 ACK되지 않은 작업은 OCR_QUEUE_CLAIM_IDLE_MS 이후 XAUTOCLAIM으로 다른 워커가 다시 처리
+  - OCR_QUEUE_MAX_DELIVERIES번 넘게 전달된 작업은 실패로 응답하고 dead-letter 스트림으로 이동
+  - 마감 시각이 지난 작업은 처리하지 않고 버림
+- 결과 이미지는 워커가 결과 저장소(app.services.storage)에 저장하므로 여러 노드 구성에서는 S3 저장소를 함께 사용
+
+redis 패키지는 OCR_QUEUE_BACKEND=redis일 때만 필요합니다 (pip install redis).
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+
+from app.config.settings import settings
+from app.core.deadline import Deadline, current_deadline
+from app.core.exceptions import DeadlineExceededException, OCRException, OverloadedException
+from app.core.metrics import metrics
+from app.services import reader_registry
+from app.services.ocr_scheduler import ocr_lane
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # 분산 큐를 사용하지 않으면 필요 없음
+    aioredis = None
+
+# 작업 결과 상태
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_DEADLINE = "deadline"
+
+
+def _text(value) -> str:
+    """Redis 응답 값(bytes)을 문자열로 변환"""
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def encode_results(results: list) -> list:
+    """OCR 결과 (bbox, text, confidence) 목록을 JSON으로 보낼 수 있는 기본 타입으로 변환"""
+    return [
+        [[[float(x), float(y)] for x, y in bbox], text, float(confidence)]
+        for bbox, text, confidence in results
+    ]
+
+
+def decode_results(results: list) -> list:
+    """encode_results 결과를 (bbox, text, confidence) 튜플 목록으로 복원"""
+    return [(bbox, text, confidence) for bbox, text, confidence in results]
+
+
+class DistributedOCRQueue:
+    """
+    Redis Streams OCR 작업 큐 (API 노드의 제출/결과 수신, 워커 노드의 처리 루프)
+
+    Attributes:
+        stream (str): 작업 스트림 이름
+        group (str): 워커 컨슈머 그룹 이름
+        node_id (str): 이 프로세스의 응답 스트림 식별자 (fork된 프로세스는 새로 생성)
+    """
+
+    def __init__(self, client=None):
+        self.stream = settings.OCR_QUEUE_STREAM
+        self.group = settings.OCR_QUEUE_GROUP
+        self.dead_letter_stream = f"{self.stream}:dead"
+        self._client = client
+        self._group_ready = False
+        self._init_process()
+
+    def _init_process(self):
+        """프로세스별 상태 초기화 (응답 스트림, 결과 대기 목록, 수신 작업)"""
+        self._pid = os.getpid()
+        self.node_id = uuid.uuid4().hex[:12]
+        self.reply_stream = f"ocr:replies:{self.node_id}"
+        self._pending = {}
+        self._listener = None
+
+    @property
+    def enabled(self) -> bool:
+        """분산 큐 사용 여부 (OCR_QUEUE_BACKEND=redis)"""
+        return settings.OCR_QUEUE_BACKEND.lower() == "redis"
+
+    @property
+    def client(self):
+        """Redis 연결 풀 (워커의 이벤트 루프에서 처음 사용할 때 생성)"""
+        if self._client is None:
+            if aioredis is None:
+                raise RuntimeError("분산 OCR 큐를 사용하려면 redis 패키지가 필요합니다 (pip install redis).")
+            self._client = aioredis.from_url(settings.REDIS_URL)
+        return self._client
+
+    async def aclose(self):
+        """수신 작업 종료 및 연결 풀 정리 (워커 종료 시)"""
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ==================== API 노드: 작업 제출 / 결과 수신 ====================
+
+    def admit(self):
+        """이 노드가 결과를 기다리는 작업이 OCR_QUEUE_MAX_INFLIGHT 이상이면 OverloadedException"""
+        if len(self._pending) >= settings.OCR_QUEUE_MAX_INFLIGHT:
+            metrics.increment("ocr_queue_rejected")
+            raise OverloadedException("분산 OCR 작업 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.")
+
+    async def submit(self, contents: bytes) -> tuple:
+        """
+        이미지 OCR 작업을 스트림에 추가하고 워커의 결과를 기다림
+
+        현재 요청의 언어(ocr_languages), 레인(ocr_lane), 마감 시간(current_deadline)을 작업에 함께 전달합니다.
+
+        Args:
+            contents (bytes): 이미지 파일 내용
+
+        Returns:
+            tuple: (최종 OCR 결과, 결과 이미지 파일명) - ocr_scheduler.run(_process_upload)와 같은 형식
+        """
+        self._ensure_listener()
+        deadline = current_deadline.get()
+        timeout = deadline.remaining() if deadline is not None else settings.OCR_QUEUE_RESULT_TIMEOUT
+        job_id = uuid.uuid4().hex
+        payload_key = f"ocr:payload:{job_id}"
+        future = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = future
+
+        try:
+            await self.client.set(payload_key, contents, ex=settings.OCR_QUEUE_PAYLOAD_TTL)
+            await self.client.xadd(self.stream, {
+                "job_id": job_id,
+                "reply_to": self.reply_stream,
+                "payload_key": payload_key,
+                "languages": ",".join(reader_registry.ocr_languages.get() or []),
+                "lane": ocr_lane.get(),
+                "deadline_at": str(time.time() + timeout),
+            }, maxlen=settings.OCR_QUEUE_MAXLEN, approximate=True)
+            metrics.increment("ocr_queue_submitted")
+
+            if deadline is not None:
+                reply = await deadline.guard(future, "queue")
+            else:
+                try:
+                    reply = await asyncio.wait_for(future, timeout)
+                except asyncio.TimeoutError:
+                    raise DeadlineExceededException("분산 OCR 작업 결과를 기다리는 시간이 초과되었습니다.")
+        finally:
+            self._pending.pop(job_id, None)
+
+        status = reply.get("status")
+        if status == STATUS_OK:
+            result = json.loads(reply["result"])
+            return decode_results(result["results"]), result["filename"]
+        if status == STATUS_DEADLINE:
+            raise DeadlineExceededException("요청 처리 마감 시간을 초과했습니다.")
+        raise OCRException(f"분산 OCR 작업 실패: {reply.get('error', '알 수 없는 오류')}")
+
+    def _ensure_listener(self):
+        if self._pid != os.getpid():
+            # gunicorn preload_app으로 fork된 워커는 마스터에서 import한 인스턴스를 물려받음
+            # 워커끼리 응답 스트림을 공유하면 서로의 응답을 읽고 삭제하므로 프로세스마다 새로 만들고
+            # 마스터의 연결 풀도 공유하지 않음
+            self._init_process()
+            self._client = None
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.ensure_future(self._listen())
+
+    async def _listen(self):
+        """이 노드의 응답 스트림을 읽어 결과를 기다리는 요청에 전달 (읽은 응답은 삭제)"""
+        last_id = "0-0"
+        while True:
+            try:
+                response = await self.client.xread({self.reply_stream: last_id}, count=100, block=settings.OCR_QUEUE_BLOCK_MS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ 분산 OCR 응답 수신 실패: {e}")
+                await asyncio.sleep(1)
+                continue
+            for _, entries in response or []:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    reply = {_text(k): _text(v) for k, v in fields.items()}
+                    future = self._pending.get(reply.get("job_id"))
+                    if future is not None and not future.done():
+                        future.set_result(reply)
+                    else:
+                        metrics.increment("ocr_queue_reply_dropped")
+                if entries:
+                    await self.client.xdel(self.reply_stream, *[entry_id for entry_id, _ in entries])
+
+    # ==================== 워커 노드: 작업 처리 ====================
+
+    async def ensure_group(self):
+        """컨슈머 그룹 생성 (이미 있으면 그대로 사용, 스트림이 없으면 함께 생성)"""
+        if self._group_ready:
+            return
+        try:
+            await self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def consume(self, handler, consumer: str, stop_event: asyncio.Event = None):
+        """
+        작업 처리 루프 (stop_event가 설정될 때까지 반복)
+
+        오래 ACK되지 않은 작업(다른 워커가 죽은 경우)을 먼저 가져오고, 없으면 새 작업을 기다립니다.
+
+        Args:
+            handler: 이미지 내용을 받아 (OCR 결과, 결과 이미지 파일명)을 돌려주는 코루틴 함수
+            consumer (str): 컨슈머 이름 (워커 노드마다 고유)
+            stop_event (asyncio.Event): 설정되면 진행 중인 작업을 마치고 종료
+        """
+        await self.ensure_group()
+        stop_event = stop_event or asyncio.Event()
+        while not stop_event.is_set():
+            try:
+                entries = await self._claim_stale(consumer)
+                if not entries:
+                    response = await self.client.xreadgroup(
+                        self.group, consumer, {self.stream: ">"}, count=1, block=settings.OCR_QUEUE_BLOCK_MS
+                    )
+                    entries = [entry for _, stream_entries in response or [] for entry in stream_entries]
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ 분산 OCR 작업 수신 실패: {e}")
+                await asyncio.sleep(1)
+                continue
+            for entry_id, fields in entries:
+                try:
+                    await self._handle(entry_id, fields, handler, consumer)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # ACK하지 못한 작업은 OCR_QUEUE_CLAIM_IDLE_MS 이후 다시 가져와 처리
+                    print(f"⚠️ 분산 OCR 작업 처리 실패: {_text(entry_id)} - {e}")
+
+    async def _claim_stale(self, consumer: str) -> list:
+        """
+        OCR_QUEUE_CLAIM_IDLE_MS 넘게 ACK되지 않은 작업 하나를 이 컨슈머로 가져옴
+        (전달 횟수가 OCR_QUEUE_MAX_DELIVERIES를 넘으면 dead-letter로 옮기고 다음 작업 확인)
+        """
+        while True:
+            response = await self.client.xautoclaim(
+                self.stream, self.group, consumer, min_idle_time=settings.OCR_QUEUE_CLAIM_IDLE_MS, start_id="0-0", count=1
+            )
+            entries = [(entry_id, fields) for entry_id, fields in response[1] if fields]
+            if not entries:
+                return []
+            entry_id, fields = entries[0]
+            pending = await self.client.xpending_range(self.stream, self.group, min=entry_id, max=entry_id, count=1)
+            deliveries = pending[0]["times_delivered"] if pending else 1
+            metrics.increment("ocr_queue_redelivered")
+            if deliveries <= settings.OCR_QUEUE_MAX_DELIVERIES:
+                print(f"♻️ 응답 없는 OCR 작업 재처리: {_text(fields.get(b'job_id', entry_id))} ({deliveries}번째 전달)")
+                return entries
+            job = {_text(k): _text(v) for k, v in fields.items()}
+            try:
+                await self.client.xadd(self.dead_letter_stream, {**job, "deliveries": str(deliveries)},
+                                       maxlen=settings.OCR_QUEUE_MAXLEN, approximate=True)
+                await self._finish(entry_id, job, {"status": STATUS_ERROR, "error": f"작업이 {deliveries}번 전달되었지만 완료되지 않았습니다."})
+                metrics.increment("ocr_queue_dead_lettered")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 이 컨슈머로 가져온 작업이므로 OCR_QUEUE_CLAIM_IDLE_MS 이후 다시 가져와 dead-letter 처리
+                print(f"⚠️ 분산 OCR 작업 dead-letter 이동 실패: {_text(entry_id)} - {e}")
+
+    async def _handle(self, entry_id, fields: dict, handler, consumer: str):
+        """작업 하나 처리 후 결과 응답, ACK, 이미지 내용 삭제"""
+        job = {_text(k): _text(v) for k, v in fields.items()}
+        deadline_at = float(job.get("deadline_at") or 0)
+        remaining_ms = (deadline_at - time.time()) * 1000 if deadline_at else settings.OCR_QUEUE_RESULT_TIMEOUT * 1000
+        if remaining_ms <= 0:
+            # 요청한 API 노드가 이미 포기한 작업
+            metrics.increment("ocr_queue_expired")
+            await self._finish(entry_id, job, {"status": STATUS_DEADLINE})
+            return
+
+        contents = await self.client.get(job["payload_key"])
+        if contents is None:
+            await self._finish(entry_id, job, {"status": STATUS_ERROR, "error": "작업 이미지가 만료되었습니다."})
+            return
+
+        # 요청의 언어/레인/마감 시간을 이 작업의 컨텍스트로 설정 (작업마다 별도 태스크이므로 서로 섞이지 않음)
+        async def run():
+            reader_registry.ocr_languages.set(job["languages"].split(",") if job.get("languages") else None)
+            ocr_lane.set(job.get("lane") or ocr_lane.get())
+            current_deadline.set(Deadline(remaining_ms))
+            return await handler(contents)
+
+        heartbeat = asyncio.ensure_future(self._heartbeat(entry_id, consumer))
+        start_time = time.monotonic()
+        try:
+            results, filename = await asyncio.ensure_future(run())
+            reply = {"status": STATUS_OK, "result": json.dumps({"results": encode_results(results), "filename": filename}, ensure_ascii=False)}
+            metrics.increment("ocr_queue_completed")
+        except DeadlineExceededException:
+            reply = {"status": STATUS_DEADLINE}
+        except Exception as e:
+            print(f"❌ 분산 OCR 작업 실패: {job.get('job_id')} - {e}")
+            reply = {"status": STATUS_ERROR, "error": str(e)}
+            metrics.increment("ocr_queue_failed")
+        finally:
+            heartbeat.cancel()
+        metrics.observe("ocr_queue_job_ms", (time.monotonic() - start_time) * 1000, (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000))
+        await self._finish(entry_id, job, reply)
+
+    async def _heartbeat(self, entry_id, consumer: str):
+        """처리 중인 작업의 유휴 시간을 주기적으로 초기화 (다른 워커의 XAUTOCLAIM 방지)"""
+        interval = settings.OCR_QUEUE_CLAIM_IDLE_MS / 3000
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.client.xclaim(self.stream, self.group, consumer, min_idle_time=0, message_ids=[entry_id], justid=True)
+            except Exception as e:
+                print(f"⚠️ 분산 OCR 작업 유휴 시간 갱신 실패: {e}")
+
+    async def _finish(self, entry_id, job: dict, reply: dict):
+        """결과를 요청한 노드의 응답 스트림에 추가한 뒤 ACK하고 이미지 내용 삭제"""
+        reply_to = job.get("reply_to")
+        if reply_to:
+            await self.client.xadd(reply_to, {"job_id": job.get("job_id", ""), **reply}, maxlen=settings.OCR_QUEUE_MAXLEN, approximate=True)
+            # API 노드가 사라진 경우 응답 스트림이 남지 않도록 만료 시간 설정
+            await self.client.expire(reply_to, settings.OCR_QUEUE_PAYLOAD_TTL)
+        await self.client.xack(self.stream, self.group, entry_id)
+        if job.get("payload_key"):
+            await self.client.delete(job["payload_key"])
+
+
+# 전역 분산 OCR 큐 인스턴스
+# 다른 모듈에서 from app.services.distributed_queue import distributed_queue로 사용
+distributed_queue = DistributedOCRQueue()
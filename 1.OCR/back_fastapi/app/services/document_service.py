@@ -0,0 +1,178 @@
+"""
+다중 페이지 문서 OCR 서비스 모듈
+
+여러 페이지로 된 TIFF 스캔본과 PDF(카탈로그 페이지 등)를 페이지 단위로 OCR하고
+페이지별 결과를 완료되는 대로 스트리밍합니다.
+
+주요 기능:
+- 페이지 제너레이터: 필요한 페이지만 그때그때 디코딩 (문서 전체를 메모리에 풀지 않음)
+  - TIFF: PIL 프레임 탐색(seek)으로 한 프레임씩 디코딩
+  - PDF: pypdfium2로 한 페이지씩 렌더링 (OCR_PDF_DPI)
+- 동시 처리 페이지 수 제한 (OCR_DOCUMENT_PAGE_CONCURRENCY, 메모리에는 그만큼의 페이지만 존재)
+- 페이지 디코딩은 OCR 실행 슬롯을 쓰지 않고 별도 스레드에서 실행 (OCR 대기 지연/과부하 판단에 포함되지 않음)
+- 페이지 순서대로 NDJSON 한 줄씩 결과 전송 (페이지 실패 시 해당 줄에 오류 기록 후 계속 진행)
+"""
+
+import asyncio
+import collections
+import io
+import json
+import os
+import time
+from typing import AsyncIterator, Iterator, Tuple
+
+from PIL import Image
+
+from app.config.settings import settings
+from app.core.deadline import check_deadline
+from app.core.exceptions import DeadlineExceededException, OverloadedException
+from app.services.ocr_scheduler import ocr_scheduler
+
+
+def iter_document_pages(contents: bytes, extension: str) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    문서의 페이지를 하나씩 디코딩하는 제너레이터
+
+    Args:
+        contents (bytes): 문서 파일 내용 (압축된 상태)
+        extension (str): 파일 확장자 (.pdf, .tif, .tiff 등)
+
+    Yields:
+        Tuple[int, Image.Image]: (1부터 시작하는 페이지 번호, RGB PIL 이미지)
+    """
+    if extension == ".pdf":
+        yield from _iter_pdf_pages(contents)
+        return
+
+    # TIFF 등 이미지: 프레임을 하나씩 탐색하며 현재 프레임만 디코딩
+    with Image.open(io.BytesIO(contents)) as image:
+        for index in range(getattr(image, "n_frames", 1)):
+            image.seek(index)
+            yield index + 1, image.convert("RGB")
+
+
+def _iter_pdf_pages(contents: bytes) -> Iterator[Tuple[int, Image.Image]]:
+    """PDF 페이지를 하나씩 렌더링 (pypdfium2 필요)"""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        raise RuntimeError("PDF 처리를 위해 pypdfium2 패키지가 필요합니다. (pip install pypdfium2)")
+
+    pdf = pdfium.PdfDocument(contents)
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            try:
+                bitmap = page.render(scale=settings.OCR_PDF_DPI / 72)
+                yield index + 1, bitmap.to_pil().convert("RGB")
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+
+
+class DocumentService:
+    """
+    다중 페이지 문서 OCR 서비스
+
+    Attributes:
+        ocr_service: 페이지 OCR에 사용할 OCRService 인스턴스
+        concurrency (int): 동시에 처리하는 최대 페이지 수
+    """
+
+    def __init__(self, ocr_service, concurrency: int = None):
+        self.ocr_service = ocr_service
+        self.concurrency = max(1, concurrency or settings.OCR_DOCUMENT_PAGE_CONCURRENCY)
+
+    def _process_page(self, page_number: int, page_image: Image.Image) -> dict:
+        """페이지 하나 OCR (OCR 스케줄러 작업 스레드에서 실행)"""
+        start_time = time.time()
+        results, filename = self.ocr_service._process_image(page_image)
+        page_image.close()
+        response = self.ocr_service._build_response(
+            f"page-{page_number}", results, *self.ocr_service._result_image_urls(filename)
+        )
+        response.processing_time_ms = (time.time() - start_time) * 1000
+        return response.model_dump()
+
+    async def _run_page(self, page_number: int, page_image: Image.Image) -> dict:
+        """페이지 OCR 실행 후 NDJSON 한 줄에 해당하는 dict 반환 (실패 시 오류 기록)"""
+        try:
+            result = await ocr_scheduler.run(self._process_page, page_number, page_image)
+            return {"page": page_number, "result": result}
+        except Exception as e:
+            print(f"❌ {page_number}페이지 OCR 실패: {e}")
+            return {"page": page_number, "error": str(e)}
+
+    async def stream_pages(self, contents: bytes, filename: str) -> AsyncIterator[str]:
+        """
+        문서를 페이지 단위로 OCR하여 NDJSON 줄을 페이지 순서대로 생성
+
+        Args:
+            contents (bytes): 문서 파일 내용
+            filename (str): 원본 파일명
+
+        Yields:
+            str: 페이지 결과 JSON 한 줄 (마지막 줄은 요약)
+        """
+        start_time = time.time()
+        extension = os.path.splitext(filename)[1].lower()
+        pages = iter_document_pages(contents, extension)
+        pending = collections.deque()
+        page_count = 0
+        failed_pages = 0
+        exhausted = False
+        print(f"📄 문서 OCR 시작: {filename}")
+
+        try:
+            while True:
+                # 동시 처리 한도까지 다음 페이지를 디코딩하여 OCR 작업 제출
+                # (디코딩은 OCR 슬롯을 차지하지 않도록 스케줄러 밖의 스레드에서 실행)
+                while not exhausted and len(pending) < self.concurrency:
+                    try:
+                        check_deadline("decode")
+                        page = await asyncio.to_thread(next, pages, None)
+                    except (DeadlineExceededException, OverloadedException):
+                        # 마감 시간 초과/취소는 디코딩 실패가 아니므로 남은 페이지를 처리하지 않고 중단
+                        raise
+                    except Exception as e:
+                        # 디코딩 실패 이후 페이지는 읽을 수 없으므로 오류 줄을 순서대로 전송하고 종료
+                        print(f"❌ 문서 페이지 디코딩 실패: {e}")
+                        page_count += 1
+                        failed = asyncio.get_running_loop().create_future()
+                        failed.set_result({"page": page_count, "error": f"페이지 디코딩 실패: {e}"})
+                        pending.append(failed)
+                        page = None
+                    if page is None:
+                        exhausted = True
+                        break
+                    page_count += 1
+                    pending.append(asyncio.ensure_future(self._run_page(*page)))
+
+                if not pending:
+                    break
+
+                # 페이지 순서를 유지하여 가장 앞 페이지부터 전송
+                line = await pending.popleft()
+                if "error" in line:
+                    failed_pages += 1
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+
+            yield json.dumps({
+                "done": True,
+                "original_filename": filename,
+                "total_pages": page_count,
+                "failed_pages": failed_pages,
+                "processing_time_ms": (time.time() - start_time) * 1000,
+            }, ensure_ascii=False) + "\n"
+            print(f"📄 문서 OCR 완료: {filename} ({page_count}페이지)")
+
+        finally:
+            # 클라이언트 연결 종료 등으로 중단되면 남은 페이지 작업 취소
+            for task in pending:
+                task.cancel()
+            try:
+                pages.close()
+            except ValueError:
+                # 작업 스레드에서 디코딩 중인 제너레이터는 닫을 수 없음 (참조가 사라지면 정리됨)
+                pass
@@ -0,0 +1,97 @@
+"""
+실시간 카메라 프레임 게이트 모듈
+
+카메라에서 들어오는 저해상도 프레임마다 움직임과 선명도를 저렴하게 측정하여
+표지가 몇 프레임 연속으로 멈춰 있고 초점이 맞았을 때만 OCR을 실행하도록 판단합니다.
+
+측정 방법:
+- 움직임: 축소 그레이스케일 프레임 간 평균 절대 차이 (0~255)
+- 선명도: 라플라시안 분산 (값이 클수록 선명, 흔들린 프레임은 작음)
+
+한 번 OCR을 실행한 뒤에는 표지가 다시 움직일 때까지(다음 표지) 재실행하지 않습니다.
+"""
+
+import cv2
+import numpy as np
+
+from app.config.settings import settings
+
+# 움직임 측정용 프레임 너비 (px)
+MOTION_FRAME_WIDTH = 160
+# 선명도 측정용 프레임 최대 너비 (px)
+SHARPNESS_FRAME_WIDTH = 480
+
+
+def _resize_to_width(gray: np.ndarray, width: int) -> np.ndarray:
+    """너비 기준 축소 (이미 작으면 그대로)"""
+    height, current_width = gray.shape[:2]
+    if current_width <= width:
+        return gray
+    return cv2.resize(gray, (width, int(height * width / current_width)), interpolation=cv2.INTER_AREA)
+
+
+class FrameGate:
+    """
+    연결(카메라 스트림) 하나의 안정성 게이트
+
+    Attributes:
+        motion_threshold (float): 정지로 볼 최대 평균 프레임 차이
+        sharpness_threshold (float): 선명하다고 볼 최소 라플라시안 분산
+        stable_frames (int): OCR 실행 전 필요한 연속 안정 프레임 수
+    """
+
+    def __init__(self, motion_threshold: float = None, sharpness_threshold: float = None,
+                 stable_frames: int = None):
+        self.motion_threshold = motion_threshold if motion_threshold is not None else settings.OCR_LIVE_MOTION_THRESHOLD
+        self.sharpness_threshold = sharpness_threshold if sharpness_threshold is not None else settings.OCR_LIVE_SHARPNESS_THRESHOLD
+        self.stable_frames = stable_frames or settings.OCR_LIVE_STABLE_FRAMES
+        self._previous = None
+        self._stable_count = 0
+        self._fired = False
+
+    def update(self, frame: np.ndarray, allow_fire: bool = True) -> dict:
+        """
+        프레임 하나를 측정하고 OCR 실행 여부 판단
+
+        Args:
+            frame (np.ndarray): BGR 또는 그레이스케일 프레임
+            allow_fire (bool): False면 측정만 하고 OCR 실행은 판단하지 않음 (이전 OCR 진행 중)
+
+        Returns:
+            dict: motion, sharpness, stable_frames, ready(OCR 실행 여부)
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
+
+        small = _resize_to_width(gray, MOTION_FRAME_WIDTH)
+        if self._previous is None or self._previous.shape != small.shape:
+            motion = float("inf")
+        else:
+            motion = float(cv2.absdiff(small, self._previous).mean())
+        self._previous = small
+
+        sharpness = float(cv2.Laplacian(_resize_to_width(gray, SHARPNESS_FRAME_WIDTH), cv2.CV_64F).var())
+
+        if motion >= self.motion_threshold:
+            # 표지가 움직이면 다음 정지 구간에서 다시 OCR 가능
+            self._stable_count = 0
+            self._fired = False
+        elif sharpness >= self.sharpness_threshold:
+            self._stable_count += 1
+        else:
+            self._stable_count = 0
+
+        ready = allow_fire and not self._fired and self._stable_count >= self.stable_frames
+        if ready:
+            self._fired = True
+
+        return {
+            "motion": motion if motion != float("inf") else None,
+            "sharpness": sharpness,
+            "stable_frames": self._stable_count,
+            "ready": ready,
+        }
+
+    def rearm(self):
+        """OCR 결과가 없을 때 같은 정지 구간에서도 다시 시도할 수 있도록 초기화"""
+        self._stable_count = 0
+        self._fired = False
@@ -3,9 +3,12 @@ from typing import Optional
 import asyncio
 import time
 
-from app.models.response import GPTResponse
+from app.models.response import GPTResponse, OCRResponse
 from app.config.settings import settings
 from app.core.exceptions import GPTException
+from app.core.metrics import metrics
+from app.services.prompt_builder import build_prompt_text
+from app.services.title_index import span_coverage, title_index
 
 class GPTService:
     def __init__(self):
@@ -56,11 +59,53 @@ class GPTService:
         except Exception as e:
             raise GPTException(f"GPT 분석 실패: {str(e)}")
     
-    async def extract_book_title(self, text: str) -> GPTResponse:
-        """책 표지에서 제목 추출"""
+    async def extract_book_title(self, text: str, ocr_result: Optional[OCRResponse] = None) -> GPTResponse:
+        """
+        책 표지에서 제목 추출
+        
+        ocr_result를 함께 주면 박스별 신뢰도/글자 크기로 노이즈를 거르고 글자가 큰 순서로 정렬한 텍스트를 보냅니다.
+        (app.services.prompt_builder 참고, 텍스트만 주면 반복 단어와 기호 조각만 제거)
+        
+        제목 인덱스에서 TITLE_INDEX_ACCEPT_SCORE 이상으로 일치한 구간이 가장 큰 글씨 줄(박스 정보가 없으면
+        압축한 텍스트 전체)의 TITLE_INDEX_MIN_COVERAGE 이상을 차지하면 GPT 호출을 생략하고,
+        일부만 차지하면(저자명, 출판사명 등과 일치했을 수 있음) 후보로 프롬프트에 넣어 GPT가 판단하게 합니다.
+        """
         try:
             start_time = time.time()
             
+            # OCR 텍스트 압축 (노이즈/중복 제거, 글자 크기 순 정렬, 토큰 예산 적용)
+            if ocr_result is not None:
+                prompt_text = build_prompt_text(
+                    text, "book_title", ocr_result.text_lines, ocr_result.confidence_scores, ocr_result.bounding_boxes
+                )
+            else:
+                prompt_text = build_prompt_text(text, "book_title")
+            
+            # 로컬 제목 인덱스에서 충분히 가까운 제목을 찾으면 GPT 호출 생략
+            # (단어 구간마다 numpy 검색을 하므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+            index_hint = ""
+            if len(title_index):
+                match = await asyncio.to_thread(title_index.best_match, text)
+                if match and match[1] >= settings.TITLE_INDEX_ACCEPT_SCORE:
+                    prominent = prompt_text.text.split("\n")[0] if prompt_text.by_prominence else prompt_text.text
+                    if span_coverage(match[2], prominent) >= settings.TITLE_INDEX_MIN_COVERAGE:
+                        metrics.increment("title_index_hit")
+                        return GPTResponse(
+                            original_text=text,
+                            prompt="책 제목 추출",
+                            gpt_response=match[0],
+                            gpt_model="title-index",
+                            tokens_used=0,
+                            response_time_ms=(time.time() - start_time) * 1000
+                        )
+                    metrics.increment("title_index_hint")
+                    index_hint = f"\n- 도서 목록에서 '{match[2]}' 부분과 비슷한 제목 '{match[0]}'을(를) 찾았습니다. 표지의 제목과 맞을 때만 참고하세요"
+                else:
+                    metrics.increment("title_index_miss")
+            
+            metrics.increment("prompt_tokens_saved", prompt_text.tokens_saved)
+            metrics.observe("prompt_ocr_tokens", prompt_text.tokens, (16, 32, 64, 128, 256, 512, 1024, 2048))
+            
             # 책 제목 추론 전문가 역할 설정 (대폭 보강된 프롬프트)
             system_prompt = """당신은 책 제목 추출 전문가입니다. 
 OCR로 추출된 텍스트에서 가장 가능성이 높은 책 제목을 정확하게 추출하는 것이 당신의 임무입니다.
@@ -89,16 +134,18 @@ OCR로 추출된 텍스트에서 가장 가능성이 높은 책 제목을 정확
 - 너무 긴 문장
 - 의미 없는 조합"""
             
+            order_hint = "\n- 추출된 텍스트는 표지에서 글자가 큰 순서로 한 줄씩 정렬되어 있습니다" if prompt_text.by_prominence else ""
             user_prompt = f"""다음은 책 표지에서 OCR로 추출된 텍스트입니다.
 위의 규칙을 따라 가장 책 제목일 확률이 높은 텍스트를 정확하게 추출해주세요.
 
-📖 추출된 텍스트: {text}
+📖 추출된 텍스트:
+{prompt_text.text}
 
 💡 힌트: 
 - 노이즈가 많아도 핵심 키워드를 찾아보세요
 - 한글과 영어가 섞여있으면 한글을 우선하세요
 - 책 제목은 보통 간결하고 의미가 명확합니다
-- 전체적인 맥락을 고려하여 추론하세요"""
+- 전체적인 맥락을 고려하여 추론하세요{order_hint}{index_hint}"""
             
             # 새로운 GPT API 호출 방식
             response = await asyncio.to_thread(
@@ -128,7 +175,8 @@ OCR로 추출된 텍스트에서 가장 가능성이 높은 책 제목을 정확
                 gpt_response=cleaned_response,
                 gpt_model=self.model,
                 tokens_used=usage.total_tokens if usage else 0,
-                response_time_ms=response_time_ms
+                response_time_ms=response_time_ms,
+                tokens_saved=prompt_text.tokens_saved
             )
             
         except Exception as e:
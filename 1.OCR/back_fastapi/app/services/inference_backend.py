@@ -0,0 +1,232 @@
+"""
+OCR 추론 백엔드 모듈
+
+EasyOCR 리더의 검출기(CRAFT)와 인식기를 교체 가능한 추론 백엔드로 실행합니다.
+
+지원 백엔드 (settings.OCR_BACKEND):
+- torch: EasyOCR 기본 PyTorch eager 실행
+- onnx: ONNX Runtime 실행 (선택적으로 int8 동적 양자화 모델 사용)
+
+ONNX 백엔드는 리더의 detector/recognizer 속성을 ONNX Runtime 세션 래퍼로 교체합니다.
+래퍼는 torch 모듈과 같은 호출 규약을 따르므로 EasyOCR의 detect/recognize/readtext와
+OCRService.extract_text는 수정 없이 그대로 동작합니다.
+
+ONNX 모델 변환:
+    python -m app.tools.export_onnx --languages ko en
+"""
+
+import os
+from typing import List, Tuple
+
+import easyocr
+import torch
+
+from app.config.settings import settings
+
+# 인식기 입력 높이 (easyocr.config.imgH)
+RECOGNIZER_INPUT_HEIGHT = 64
+
+
+class OnnxDetector:
+    """
+    CRAFT 검출기 ONNX Runtime 래퍼
+
+    easyocr.detection.test_net에서 net(x) 형태로 호출되며,
+    torch CRAFT 모듈과 동일하게 (y, feature) torch 텐서 튜플을 반환합니다.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+
+    def eval(self):
+        return self
+
+    def __call__(self, x: torch.Tensor):
+        y, feature = self.session.run(None, {self.input_name: x.cpu().numpy()})
+        return torch.from_numpy(y), torch.from_numpy(feature)
+
+
+class OnnxRecognizer:
+    """
+    텍스트 인식기 ONNX Runtime 래퍼
+
+    easyocr.recognition.recognizer_predict에서 model(image, text) 형태로 호출됩니다.
+    CTC 인식기는 text 입력을 사용하지 않으므로 이미지 텐서만 전달합니다.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+
+    def eval(self):
+        return self
+
+    def __call__(self, image: torch.Tensor, text: torch.Tensor = None):
+        preds = self.session.run(None, {self.input_name: image.cpu().numpy()})[0]
+        return torch.from_numpy(preds)
+
+
+class _RecognizerExportModule(torch.nn.Module):
+    """
+    ONNX 변환용 인식기 모듈
+
+    EasyOCR 인식기의 AdaptiveAvgPool2d((None, 1))는 가변 폭 입력에서 ONNX 변환이 되지 않으므로
+    동일한 연산인 높이 축 평균(mean)으로 바꾸고, 사용하지 않는 text 입력을 제거합니다.
+    """
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, image):
+        visual_feature = self.model.FeatureExtraction(image)
+        visual_feature = visual_feature.permute(0, 3, 1, 2).mean(dim=3)  # [b, c, h, w] -> [b, w, c]
+        contextual_feature = self.model.SequenceModeling(visual_feature)
+        return self.model.Prediction(contextual_feature.contiguous())
+
+
+def _model_key(languages: List[str]) -> str:
+    """
+    언어 조합별 모델 파일 이름 키 (예: en-ko)
+
+    리더 레지스트리는 정렬한 언어 목록으로, 변환 도구는 입력한 순서대로 호출하므로
+    순서와 중복에 관계없이 같은 파일을 가리키도록 정렬하여 만듭니다.
+    """
+    return "-".join(sorted(set(languages)))
+
+
+def onnx_model_paths(languages: List[str], quantize: bool = None) -> Tuple[str, str]:
+    """
+    검출기/인식기 ONNX 모델 파일 경로
+
+    Args:
+        languages (List[str]): 인식기 언어 목록
+        quantize (bool): int8 양자화 모델 경로 여부 (None이면 설정값 사용)
+
+    Returns:
+        Tuple[str, str]: (검출기 경로, 인식기 경로)
+    """
+    if quantize is None:
+        quantize = settings.OCR_ONNX_QUANTIZE
+
+    detector_name = "craft.int8.onnx" if quantize and settings.OCR_ONNX_QUANTIZE_DETECTOR else "craft.onnx"
+    recognizer_name = f"recognizer_{_model_key(languages)}{'.int8' if quantize else ''}.onnx"
+    return (
+        os.path.join(settings.OCR_ONNX_DIR, detector_name),
+        os.path.join(settings.OCR_ONNX_DIR, recognizer_name),
+    )
+
+
+def export_onnx_models(languages: List[str], quantize: bool = None) -> Tuple[str, str]:
+    """
+    EasyOCR 검출기(CRAFT)와 인식기를 ONNX로 변환
+
+    양자화되지 않은 torch 리더를 새로 만들어 fp32 모델을 내보낸 뒤,
+    quantize가 참이면 ONNX Runtime 동적 양자화로 int8 모델을 추가 생성합니다.
+    검출기는 합성곱 위주라 int8 동적 양자화 이득이 작으므로
+    settings.OCR_ONNX_QUANTIZE_DETECTOR가 참일 때만 양자화합니다.
+
+    Returns:
+        Tuple[str, str]: 실행에 사용할 (검출기 경로, 인식기 경로)
+    """
+    if quantize is None:
+        quantize = settings.OCR_ONNX_QUANTIZE
+
+    os.makedirs(settings.OCR_ONNX_DIR, exist_ok=True)
+    detector_fp32, recognizer_fp32 = onnx_model_paths(languages, quantize=False)
+    detector_path, recognizer_path = onnx_model_paths(languages, quantize=quantize)
+
+    print(f"🔧 ONNX 모델 변환 시작: {languages}")
+    reader = easyocr.Reader(languages, gpu=False, quantize=False, verbose=False)
+
+    with torch.no_grad():
+        # 1. 검출기 (CRAFT): 입력 [batch, 3, height, width]
+        torch.onnx.export(
+            reader.detector,
+            torch.randn(1, 3, 640, 640),
+            detector_fp32,
+            input_names=["image"],
+            output_names=["y", "feature"],
+            dynamic_axes={
+                "image": {0: "batch", 2: "height", 3: "width"},
+                "y": {0: "batch", 1: "out_height", 2: "out_width"},
+                "feature": {0: "batch", 2: "out_height", 3: "out_width"},
+            },
+            opset_version=14,
+            do_constant_folding=True,
+        )
+        print(f"✅ 검출기 변환 완료: {detector_fp32}")
+
+        # 2. 인식기: 입력 [batch, 1, 64, width]
+        torch.onnx.export(
+            _RecognizerExportModule(reader.recognizer).eval(),
+            torch.randn(1, 1, RECOGNIZER_INPUT_HEIGHT, 320),
+            recognizer_fp32,
+            input_names=["image"],
+            output_names=["preds"],
+            dynamic_axes={
+                "image": {0: "batch", 3: "width"},
+                "preds": {0: "batch", 1: "sequence"},
+            },
+            opset_version=14,
+            do_constant_folding=True,
+        )
+        print(f"✅ 인식기 변환 완료: {recognizer_fp32}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(recognizer_fp32, recognizer_path, weight_type=QuantType.QUInt8)
+        print(f"✅ 인식기 int8 양자화 완료: {recognizer_path}")
+        if detector_path != detector_fp32:
+            quantize_dynamic(detector_fp32, detector_path, weight_type=QuantType.QUInt8)
+            print(f"✅ 검출기 int8 양자화 완료: {detector_path}")
+
+    return detector_path, recognizer_path
+
+
+def _create_session(model_path: str, threads: int):
+    """ONNX Runtime CPU 추론 세션 생성"""
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = threads
+    options.inter_op_num_threads = 1
+    return onnxruntime.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def apply_backend(reader: easyocr.Reader, languages: List[str], threads: int = 0,
+                  backend: str = None, quantize: bool = None) -> easyocr.Reader:
+    """
+    설정된 추론 백엔드를 리더에 적용
+
+    settings.OCR_BACKEND가 "onnx"이면 검출기/인식기를 ONNX Runtime 래퍼로 교체합니다.
+    모델 파일이 없으면 OCR_ONNX_AUTO_EXPORT 설정에 따라 변환하며,
+    onnxruntime 미설치 등으로 실패하면 torch 백엔드를 그대로 사용합니다.
+
+    Args:
+        reader (easyocr.Reader): 대상 리더
+        languages (List[str]): 리더 언어 목록
+        threads (int): ONNX Runtime intra-op 스레드 수 (0 = 런타임 기본값)
+        backend (str): 적용할 백엔드 (None이면 설정값 사용)
+        quantize (bool): int8 양자화 모델 사용 여부 (None이면 설정값 사용)
+    """
+    if (backend or settings.OCR_BACKEND) != "onnx":
+        return reader
+
+    try:
+        detector_path, recognizer_path = onnx_model_paths(languages, quantize=quantize)
+        if not (os.path.exists(detector_path) and os.path.exists(recognizer_path)):
+            if not settings.OCR_ONNX_AUTO_EXPORT:
+                raise FileNotFoundError(f"ONNX 모델 파일이 없습니다: {detector_path}, {recognizer_path}")
+            detector_path, recognizer_path = export_onnx_models(languages, quantize=quantize)
+
+        reader.detector = OnnxDetector(_create_session(detector_path, threads))
+        reader.recognizer = OnnxRecognizer(_create_session(recognizer_path, threads))
+        print(f"✅ ONNX Runtime 백엔드 적용: {os.path.basename(detector_path)}, {os.path.basename(recognizer_path)}")
+    except Exception as e:
+        print(f"⚠️ ONNX 백엔드 적용 실패, torch 백엔드 사용: {e}")
+
+    return reader
@@ -0,0 +1,228 @@
+"""
+도서관 정보나루(data4library) API 프록시 서비스 모듈
+
+프론트엔드가 브라우저마다 data4library.kr을 직접 호출하면 사용자마다 원본 지연시간과
+호출 한도를 그대로 부담하므로, 서버에서 응답을 공유 캐시에 보관하고 대신 호출합니다.
+
+주요 기능:
+- 지원 API: srchBooks, srchDtlList, libSrch, libSrchByBook, loanItemSrch
+- 인증키(LIBRARY_API_KEY)는 서버에서 주입 (클라이언트가 보낸 authKey는 무시)
+- TTL + stale-while-revalidate + single-flight 캐시 (app.core.cache.AsyncTTLCache)
+- 공유 HTTP 연결 풀 사용 및 원본 동시 호출 수 제한 (LIBRARY_MAX_CONCURRENCY)
+- 원본 응답 본문과 Content-Type을 그대로 전달 (XML 기본, format=json 지원)
+  (HTTP 200이어도 본문이 오류 응답(response.error)이면 캐시하지 않고 502)
+- 책 제목 → ISBN 변환: 제목과 대체 후보들로 도서 검색을 동시에 실행하고 마감 시간 안에 끝난 결과를 순위화
+"""
+
+import asyncio
+import difflib
+import json
+import re
+from typing import Optional
+from xml.etree import ElementTree
+
+import httpx
+
+from app.config.settings import settings
+from app.core.cache import AsyncTTLCache
+from app.core.exceptions import LibraryAPIException
+from app.core.http_client import http_fetcher
+
+# 프록시를 허용하는 정보나루 API 목록
+LIBRARY_ENDPOINTS = ("srchBooks", "srchDtlList", "libSrch", "libSrchByBook", "loanItemSrch")
+
+
+def upstream_error(body: bytes) -> Optional[str]:
+    """
+    정보나루 오류 응답의 오류 메시지 (정상 응답이면 None)
+
+    정보나루는 인증키 오류, 호출 한도 초과 등도 HTTP 200으로 응답하고 본문의 response.error에 사유를 담습니다.
+    (JSON: {"response": {"error": "..."}}, XML: <response><error>...</error></response>)
+    """
+    if body.lstrip().startswith(b"{"):
+        try:
+            error = json.loads(body).get("response", {}).get("error")
+        except (ValueError, AttributeError):
+            return None
+        return str(error) if error else None
+    if b"<error" not in body:
+        return None
+    try:
+        error = ElementTree.fromstring(body).find("error")
+    except ElementTree.ParseError:
+        return None
+    if error is None:
+        return None
+    return (error.text or "").strip() or "알 수 없는 오류"
+
+
+class LibraryService:
+    """정보나루 API 캐싱 프록시"""
+
+    def __init__(self):
+        self.cache = AsyncTTLCache(
+            "library",
+            ttl=settings.LIBRARY_CACHE_TTL,
+            stale_ttl=settings.LIBRARY_CACHE_STALE_TTL,
+            max_entries=settings.LIBRARY_CACHE_MAX_ENTRIES,
+        )
+        self._upstream_limit = None
+
+    @property
+    def upstream_limit(self) -> asyncio.Semaphore:
+        """원본 API 동시 호출 수 제한 (워커의 이벤트 루프에서 처음 사용할 때 생성)"""
+        if self._upstream_limit is None:
+            self._upstream_limit = asyncio.Semaphore(settings.LIBRARY_MAX_CONCURRENCY)
+        return self._upstream_limit
+
+    async def fetch(self, endpoint: str, params) -> tuple:
+        """
+        정보나루 API 호출 (캐시 우선)
+
+        Args:
+            endpoint (str): API 이름 (LIBRARY_ENDPOINTS 중 하나)
+            params (dict | list): 쿼리 파라미터 dict 또는 (이름, 값) 목록 (같은 이름 반복 가능, authKey 제외)
+
+        Returns:
+            tuple: (응답 본문 bytes, Content-Type, 캐시 상태)
+        """
+        if endpoint not in LIBRARY_ENDPOINTS:
+            raise LibraryAPIException(f"지원하지 않는 도서관 API입니다: {endpoint}", status_code=404)
+        if not settings.LIBRARY_API_KEY:
+            raise LibraryAPIException("도서관 API 키가 설정되지 않았습니다.", status_code=500)
+
+        items = params.items() if isinstance(params, dict) else params
+        # 이름 순으로만 정렬하여 같은 이름의 반복 파라미터는 보낸 순서 유지
+        params = sorted(((k, v) for k, v in items if k != "authKey"), key=lambda item: item[0])
+        key = (endpoint, tuple(params))
+
+        async def load():
+            return await self._request(endpoint, params)
+
+        (body, content_type), cache_status = await self.cache.get_or_load(key, load)
+        return body, content_type, cache_status
+
+    async def _request(self, endpoint: str, params: list) -> tuple:
+        """원본 API 호출 (동시 호출 수 제한)"""
+        url = f"{settings.LIBRARY_API_BASE_URL.rstrip('/')}/{endpoint}"
+        async with self.upstream_limit:
+            try:
+                response = await http_fetcher.client.get(
+                    url,
+                    params=[*params, ("authKey", settings.LIBRARY_API_KEY)],
+                    timeout=settings.LIBRARY_API_TIMEOUT,
+                    follow_redirects=True,  # 설정한 API 주소이므로 리다이렉트 허용 (공유 클라이언트 기본값은 사용 안 함)
+                )
+            except httpx.HTTPError as e:
+                raise LibraryAPIException(f"도서관 API 호출 실패: {endpoint} ({e})")
+
+        if response.status_code != 200:
+            raise LibraryAPIException(f"도서관 API 호출 실패 (HTTP {response.status_code}): {endpoint}")
+        # 오류 응답은 캐시하지 않도록 예외로 처리 (인증키가 고쳐지거나 한도가 풀리면 바로 정상 응답)
+        error = upstream_error(response.content)
+        if error is not None:
+            raise LibraryAPIException(f"도서관 API 오류: {endpoint} ({error})")
+        return response.content, response.headers.get("Content-Type", "application/xml")
+
+    async def resolve_title(self, title: str, top_k: int = 5, deadline_ms: float = None) -> list:
+        """
+        책 제목(과 대체 검색어)을 ISBN 후보로 변환
+
+        후보 검색어마다 srchBooks를 동시에 호출하고, 마감 시간까지 끝난 검색 결과만 모아
+        제목 유사도 순으로 정렬합니다. 마감 시간을 넘긴 검색은 결과에서 제외됩니다.
+        (취소되어도 캐시 적재는 계속되므로 같은 제목의 다음 요청은 캐시에서 바로 응답)
+
+        Args:
+            title (str): 추출된 책 제목
+            top_k (int): 반환할 최대 후보 수
+            deadline_ms (float): 전체 검색 마감 시간 (밀리초)
+
+        Returns:
+            list: 점수 내림차순 도서 후보 dict 목록
+        """
+        queries = self._title_queries(title)
+        if not queries:
+            return []
+
+        deadline = (deadline_ms or settings.LIBRARY_RESOLVE_DEADLINE_MS) / 1000
+        tasks = {
+            asyncio.ensure_future(self.fetch("srchBooks", {**params, "format": "json", "pageSize": 10})): query
+            for query, params in queries
+        }
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            print(f"⏱️ ISBN 검색 {len(pending)}개가 마감 시간({deadline * 1000:.0f}ms)을 넘겨 제외됨")
+
+        matches = {}
+        normalized_title = self._normalize(title)
+        for task in done:
+            if task.exception() is not None:
+                print(f"⚠️ ISBN 검색 실패 ({tasks[task]}): {task.exception()}")
+                continue
+            body, _, _ = task.result()
+            for rank, book in enumerate(self._parse_books(body)):
+                isbn = book.get("isbn13")
+                if not isbn:
+                    continue
+                similarity = difflib.SequenceMatcher(
+                    None, normalized_title, self._normalize(book.get("bookname", ""))
+                ).ratio()
+                # 제목 유사도를 기본 점수로, 검색 결과 상위일수록 약간 가산
+                score = round(similarity + 0.05 / (rank + 1), 4)
+                if isbn not in matches or matches[isbn]["score"] < score:
+                    matches[isbn] = {
+                        "isbn13": isbn,
+                        "bookname": book.get("bookname", ""),
+                        "authors": book.get("authors", ""),
+                        "publisher": book.get("publisher", ""),
+                        "publication_year": book.get("publication_year", ""),
+                        "book_image_url": book.get("bookImageURL", ""),
+                        "score": score,
+                        "query": tasks[task],
+                    }
+
+        return sorted(matches.values(), key=lambda m: m["score"], reverse=True)[:top_k]
+
+    def _title_queries(self, title: str) -> list:
+        """제목에서 검색어 후보 생성: (검색어, srchBooks 파라미터) 목록 (중복 제거)"""
+        title = " ".join(title.split())
+        if not title:
+            return []
+
+        # 부제목(:, -, ( 이후) 제거한 제목, 앞 두 단어 키워드 (프론트엔드 키워드 검색과 같은 규칙)
+        main_title = re.split(r"\s*[:\-(]\s*", title)[0].strip() or title
+        keyword = ";".join(main_title.split()[:2])
+
+        queries = [
+            (title, {"title": title}),
+            (main_title, {"title": main_title}),
+            (keyword, {"keyword": keyword}),
+        ]
+        seen = set()
+        unique = []
+        for query, params in queries:
+            key = tuple(sorted(params.items()))
+            if key not in seen:
+                seen.add(key)
+                unique.append((query, params))
+        return unique[:settings.LIBRARY_RESOLVE_MAX_QUERIES]
+
+    def _parse_books(self, body: bytes) -> list:
+        """srchBooks JSON 응답에서 도서 목록 추출"""
+        try:
+            docs = json.loads(body).get("response", {}).get("docs", [])
+        except (ValueError, AttributeError):
+            return []
+        return [item.get("doc", item) for item in docs if isinstance(item, dict)]
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """비교용 정규화 (공백/기호 제거, 소문자)"""
+        return re.sub(r"[\W_]+", "", text).lower()
+
+
+# 전역 도서관 API 서비스 인스턴스
+# 다른 모듈에서 from app.services.library_service import library_service로 사용
+library_service = LibraryService()
@@ -0,0 +1,310 @@
+"""
+OCR 작업 스케줄러 모듈 (스레드 예산 관리, 우선순위 레인)
+
+EasyOCR(torch), OpenCV, 기본 스레드 풀이 각자 코어 수만큼 스레드를 만들면
+동시 요청이 몰릴 때 코어 과다 구독(oversubscription)으로 지연시간이 급격히 늘어납니다.
+이 모듈은 워커 프로세스의 스레드 예산을 진행 중인 OCR 작업들에 나누어 배정합니다.
+
+동작 방식:
+- OCR 작업은 이벤트 루프나 기본 스레드 풀이 아닌 전용 작업 스레드에서 실행 (동시 실행 최대 max_jobs개)
+- 작업 시작 시 (워커 스레드 예산 / 진행 중인 작업 수)만큼 torch, OpenCV 스레드 수를 설정
+  (OpenMP 기반 torch 빌드에서는 스레드 수가 호출한 작업 스레드 단위로 적용됨)
+- 동시 작업 수가 줄면 다음 작업부터 더 많은 스레드를 배정
+- 작업 제출부터 실행 시작까지의 대기 시간을 측정하여 레인별 수락 제어기(app.core.admission)에 전달하고,
+  OCR 엔드포인트는 시작 전에 admit(레인)으로 해당 레인의 과부하 여부를 확인
+  (bulk 작업이 오래 기다려도 interactive 요청은 거절하지 않음)
+- OCR_PIN_CORES 설정 시 gunicorn 워커 프로세스를 서로 겹치지 않는 코어 집합에 고정
+  (reader_registry.pin_process_to_cores, gunicorn.conf.py의 post_fork에서 호출)
+
+우선순위 레인:
+- 작업은 interactive(단일 업로드, 실시간 카메라) 또는 bulk(일괄 처리, 테스트, 다중 페이지 문서) 레인에 속함
+  (라우트에서 ocr_lane.set(LANE_BULK)으로 지정, 기본값 interactive)
+- 실행 슬롯은 레인 가중치(OCR_LANE_INTERACTIVE_WEIGHT : OCR_LANE_BULK_WEIGHT)에 따른
+  가중 공정 스케줄링(stride)으로 배정되므로 interactive가 몰려도 bulk는 최소 비율을 보장받음
+- 실행 중인 bulk 작업은 전처리 변형 경계(checkpoint)에서 interactive 대기 작업이 먼저 배정될 차례면
+  슬롯을 양보했다가 다시 배정받음
+- 슬롯 대기와 checkpoint에서 요청 마감 시간/연결 끊김(app.core.deadline)을 확인하여 버려진 작업 중단
+- cprofile 프로파일링 세션(app.core.profiler) 중에는 작업을 작업 스레드 단위 cProfile로 감싸 실행
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import torch
+
+from app.config.settings import settings
+from app.core.admission import QUEUE_DELAY_BUCKETS_MS, CoDelAdmission
+from app.core.deadline import check_deadline, current_deadline
+from app.core.metrics import metrics
+from app.core.profiler import profiler
+from app.services import reader_registry
+
+# 레인 이름 (우선순위 높은 순)
+LANE_INTERACTIVE = "interactive"
+LANE_BULK = "bulk"
+
+# 현재 요청의 레인 (라우트에서 설정, asyncio.gather 등으로 만든 하위 작업에도 전달됨)
+ocr_lane = contextvars.ContextVar("ocr_lane", default=LANE_INTERACTIVE)
+
+
+class _Waiter:
+    """실행 슬롯 대기자 (상태는 LaneGate의 잠금 안에서만 변경)"""
+
+    def __init__(self, notify, charge: bool = True):
+        self.notify = notify
+        self.charge = charge  # False: 양보했던 작업의 재개 (이미 배정 몫을 치렀으므로 pass를 올리지 않음)
+        self.granted = False
+        self.cancelled = False
+
+    def grant(self) -> bool:
+        if self.cancelled:
+            return False
+        self.granted = True
+        self.notify()
+        return True
+
+
+class LaneGate:
+    """
+    레인별 가중 공정(stride) 실행 슬롯 배정기
+
+    레인마다 배정받을 때마다 1 / 가중치씩 증가하는 pass 값을 두고,
+    대기 작업이 있는 레인 중 pass가 가장 작은 레인에 다음 슬롯을 배정합니다.
+    (pass가 같으면 우선순위가 높은 레인 우선)
+
+    Attributes:
+        slots (int): 동시에 실행할 수 있는 작업 수
+        weights (dict): 레인 -> 가중치 (우선순위 높은 순서)
+    """
+
+    def __init__(self, slots: int, weights: dict):
+        self.slots = slots
+        self.weights = dict(weights)
+        self._lock = threading.Lock()
+        self._free = slots
+        self._queues = {lane: deque() for lane in self.weights}
+        self._pass = {lane: 0.0 for lane in self.weights}
+        self._vtime = 0.0  # 마지막으로 배정된 레인의 pass (쉬던 레인이 밀린 몫을 한꺼번에 받지 않도록)
+
+    async def acquire(self, lane: str):
+        """이벤트 루프에서 슬롯 대기"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = _Waiter(notify)
+        with self._lock:
+            self._enqueue(lane, waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._free += 1
+                    self._grant_next()
+                else:
+                    waiter.cancelled = True
+            raise
+
+    def release(self):
+        """슬롯 반환 후 다음 대기자에게 배정"""
+        with self._lock:
+            self._free += 1
+            self._grant_next()
+
+    def should_yield(self, lane: str) -> bool:
+        """우선순위가 높은 레인의 대기 작업이 이 레인보다 먼저 배정될 차례인지 확인"""
+        with self._lock:
+            for other in self.weights:
+                if other == lane:
+                    return False
+                if self._backlogged(other) and self._pass[other] < self._pass[lane]:
+                    return True
+            return False
+
+    def yield_slot(self, lane: str):
+        """작업 스레드에서 슬롯을 양보하고 같은 레인의 맨 앞에서 다시 배정받을 때까지 대기"""
+        event = threading.Event()
+        with self._lock:
+            self._free += 1
+            self._enqueue(lane, _Waiter(event.set, charge=False), front=True)
+        event.wait()
+
+    def _backlogged(self, lane: str) -> bool:
+        queue = self._queues[lane]
+        while queue and queue[0].cancelled:
+            queue.popleft()
+        return bool(queue)
+
+    def _enqueue(self, lane: str, waiter: _Waiter, front: bool = False):
+        if not self._backlogged(lane):
+            self._pass[lane] = max(self._pass[lane], self._vtime)
+        if front:
+            self._queues[lane].appendleft(waiter)
+        else:
+            self._queues[lane].append(waiter)
+        self._grant_next()
+
+    def _grant_next(self):
+        while self._free > 0:
+            backlogged = [lane for lane in self.weights if self._backlogged(lane)]
+            if not backlogged:
+                return
+            lane = min(backlogged, key=lambda name: self._pass[name])
+            waiter = self._queues[lane].popleft()
+            if not waiter.grant():
+                continue
+            self._free -= 1
+            self._vtime = self._pass[lane]
+            if waiter.charge:
+                self._pass[lane] += 1.0 / self.weights[lane]
+
+
+class OCRScheduler:
+    """
+    스레드 예산 기반 OCR 작업 스케줄러
+
+    Attributes:
+        total_threads (int): 워커 프로세스 하나의 전체 스레드 예산
+        max_jobs (int): 동시에 실행할 수 있는 OCR 작업 수
+    """
+
+    def __init__(self, total_threads: int = None, max_jobs: int = None):
+        self.total_threads = total_threads or reader_registry.worker_thread_count()
+        self.max_jobs = max_jobs or settings.OCR_MAX_CONCURRENT_JOBS or max(
+            1, self.total_threads // max(1, settings.OCR_MIN_THREADS_PER_JOB)
+        )
+        self.gate = LaneGate(self.max_jobs, {
+            LANE_INTERACTIVE: settings.OCR_LANE_INTERACTIVE_WEIGHT,
+            LANE_BULK: settings.OCR_LANE_BULK_WEIGHT,
+        })
+        # 작업 스레드는 첫 작업 제출 시 생성되므로 preload 모드의 fork 전에 만들어도 안전
+        # 슬롯을 양보하고 기다리는 작업 스레드(최대 max_jobs개)가 있어도 새 작업을 실행할 수 있도록 2배로 생성
+        self._executor = ThreadPoolExecutor(max_workers=self.max_jobs * 2, thread_name_prefix="ocr-job")
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._active_jobs = 0
+        self._waiting_jobs = {LANE_INTERACTIVE: 0, LANE_BULK: 0}
+        self._yielded_jobs = 0
+        # 레인마다 대기 시간이 다르므로 수락 제어도 레인별로 수행
+        self.admission = {lane: CoDelAdmission(name=lane) for lane in self._waiting_jobs}
+
+    @property
+    def active_jobs(self) -> int:
+        """현재 실행 중인 OCR 작업 수"""
+        return self._active_jobs
+
+    @property
+    def waiting_jobs(self) -> int:
+        """작업 스레드를 기다리고 있는 OCR 작업 수"""
+        return sum(self._waiting_jobs.values())
+
+    def admit(self, lane: str = LANE_INTERACTIVE):
+        """새 OCR 요청 수락 여부 확인 (이 레인의 대기 지연이 계속 목표를 넘으면 OverloadedException)"""
+        self.admission[lane].check(self._waiting_jobs[lane])
+
+    def thread_budget(self, active_jobs: int) -> int:
+        """
+        진행 중인 작업 수에 따른 작업당 스레드 수
+
+        인식 배칭(OCR_BATCHING)을 사용하면 배치 스레드도 작업 하나로 계산하여
+        작업 스레드와 배치 스레드의 합이 워커의 스레드 예산을 넘지 않도록 합니다.
+        """
+        consumers = active_jobs + (1 if settings.OCR_BATCHING else 0)
+        return max(1, self.total_threads // max(1, consumers))
+
+    async def run(self, func, *args, **kwargs):
+        """
+        OCR 작업을 현재 레인(ocr_lane)의 실행 슬롯을 배정받은 뒤 전용 작업 스레드에서 실행하고 결과를 기다림
+
+        Args:
+            func: 실행할 동기 함수 (OCR, 전처리 등 CPU 작업)
+        """
+        lane = ocr_lane.get()
+        deadline = current_deadline.get()
+        with self._lock:
+            self._waiting_jobs[lane] += 1
+        submitted_at = time.monotonic()
+        try:
+            if deadline is not None:
+                await deadline.guard(self.gate.acquire(lane), "queue", on_discard=lambda _: self.gate.release())
+            else:
+                await self.gate.acquire(lane)
+        except BaseException:
+            with self._lock:
+                self._waiting_jobs[lane] -= 1
+            raise
+
+        # 작업 스레드에서도 요청의 마감 시간 등 컨텍스트 변수를 볼 수 있도록 컨텍스트를 복사하여 실행
+        context = contextvars.copy_context()
+        job = self._executor.submit(context.run, self._run_job, lane, submitted_at, func, *args, **kwargs)
+        # 실행 전에 취소되면 _run_job이 슬롯을 반환하지 못하므로 여기서 반환
+        job.add_done_callback(lambda f: f.cancelled() and self._cancelled_before_start(lane))
+        return await asyncio.wrap_future(job)
+
+    def _cancelled_before_start(self, lane: str):
+        with self._lock:
+            self._waiting_jobs[lane] -= 1
+        self.gate.release()
+
+    def _run_job(self, lane: str, submitted_at: float, func, *args, **kwargs):
+        """작업 스레드에서 스레드 예산을 적용한 뒤 작업 실행"""
+        with self._lock:
+            self._waiting_jobs[lane] -= 1
+            self._active_jobs += 1
+            threads = self.thread_budget(self._active_jobs)
+        queue_delay = time.monotonic() - submitted_at
+        self.admission[lane].record(queue_delay)
+        metrics.observe(f"ocr_queue_delay_ms_{lane}", queue_delay * 1000, QUEUE_DELAY_BUCKETS_MS)
+        self._local.lane = lane
+        try:
+            check_deadline("start")
+            torch.set_num_threads(threads)
+            cv2.setNumThreads(threads)
+            # cprofile 프로파일링 세션 중이면 작업 단위로 측정 (아니면 그대로 실행)
+            return profiler.run_profiled(func, *args, **kwargs)
+        finally:
+            self._local.lane = None
+            with self._lock:
+                self._active_jobs -= 1
+            self.gate.release()
+
+    def checkpoint(self):
+        """
+        작업 중간 경계(전처리 변형 사이)에서 호출: 요청이 마감/취소되었으면 DeadlineExceededException,
+        우선순위가 높은 레인의 대기 작업이 먼저 배정될 차례면 실행 슬롯을 양보하고 다시 배정받을 때까지 대기
+        (스케줄러 작업 스레드 밖에서는 아무것도 하지 않음)
+        """
+        lane = getattr(self._local, "lane", None)
+        if lane is None:
+            return
+        check_deadline("variant")
+        if not self.gate.should_yield(lane):
+            return
+        with self._lock:
+            if self._yielded_jobs >= self.max_jobs:
+                return
+            self._yielded_jobs += 1
+            self._active_jobs -= 1
+        metrics.increment(f"ocr_lane_yield_{lane}")
+        try:
+            self.gate.yield_slot(lane)
+        finally:
+            with self._lock:
+                self._yielded_jobs -= 1
+                self._active_jobs += 1
+                threads = self.thread_budget(self._active_jobs)
+            torch.set_num_threads(threads)
+            cv2.setNumThreads(threads)
+
+
+# 전역 OCR 스케줄러 인스턴스
+# 다른 모듈에서 from app.services.ocr_scheduler import ocr_scheduler로 사용
+ocr_scheduler = OCRScheduler()
@@ -8,9 +8,13 @@ OCR (Optical Character Recognition) 서비스 모듈
 - EasyOCR 초기화 및 설정
 - 이미지 전처리 (노이즈 제거, 대비 향상, 이진화 등)
 - 다중 스케일 처리 (작은 텍스트 포착)
-- OCR 결과 필터링 및 후처리
-- 박싱 이미지 생성 (텍스트 박스 표시)
-- 파일 업로드 및 경로 기반 OCR 지원
+- 운영 이력 기반 전처리 변형 시도 순서 조정 (조기 중단은 OCR_STRATEGY_EARLY_STOP으로 선택)
+- 요청 간 인식 마이크로 배칭 (OCR_BATCHING)
+- OCR 결과 필터링 및 후처리 (변형 간 위치 기반 융합)
+- 박싱 이미지 생성 (텍스트 박스 표시, 내용 해시 파일명, WebP/썸네일 선택)
+- 결과 이미지 저장 및 URL 생성은 결과 저장소(app.services.storage: 로컬 / S3 호환)에 위임
+- OCR_QUEUE_BACKEND=redis이면 업로드/URL 이미지 OCR을 분산 작업 큐(app.services.distributed_queue)의 워커 노드에서 처리
+- 파일 업로드, URL 및 경로 기반 OCR 지원
 
 전처리 기법:
 1. 그레이스케일 변환
@@ -22,19 +26,33 @@ OCR (Optical Character Recognition) 서비스 모듈
 7. 다중 스케일 처리
 """
 
-import easyocr
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import io
 import os
-import uuid
-from typing import List, Tuple
+import hashlib
+from urllib.parse import urlparse
+from typing import List, Optional, Tuple
 from fastapi import UploadFile
 
 from app.models.response import OCRResponse
 from app.config.settings import settings
-from app.core.exceptions import OCRException
+from app.core.exceptions import DeadlineExceededException, OCRException
+from app.core.deadline import check_deadline
+from app.core.http_client import http_fetcher
+from app.core.responses import boxes_to_array
+from app.core.metrics import metrics
+from app.services import reader_registry
+from app.services.distributed_queue import distributed_queue
+from app.services.ocr_scheduler import ocr_scheduler
+from app.services.recognition_batcher import recognition_batcher
+from app.services.result_fusion import fuse_results, rescale_results
+from app.services.storage import result_storage
+from app.services.strategy_selector import strategy_selector
+
+# 다중 스케일 전처리 배율
+MULTISCALE_FACTORS = (1.0, 1.2, 1.5)
 
 class OCRService:
     """
@@ -53,30 +71,25 @@ class OCRService:
     def __init__(self):
         """
         EasyOCR 리더 초기화
-        
+
         설정된 언어(한국어, 영어)로 EasyOCR 리더를 초기화합니다.
         GPU 사용이 불가능한 환경을 고려하여 CPU 모드로 설정합니다.
+        리더는 reader_registry에서 프로세스 단위로 공유되며,
+        gunicorn preload 모드에서는 fork 전에 마스터에서 이미 로딩되어 있습니다.
         """
         try:
             print("🔧 EasyOCR 초기화 중...")
-            # EasyOCR 리더 초기화
+            # 기본 언어 리더를 미리 생성
             # settings.OCR_LANGUAGES: ["ko", "en"] (한국어, 영어)
-            # gpu=False: CPU 사용 (GPU가 없는 환경에서도 동작)
-            # verbose=False: 로그 출력 최소화
-            self.reader = easyocr.Reader(
-                settings.OCR_LANGUAGES,
-                gpu=False,  # CPU 사용으로 변경
-                verbose=False  # 로그 줄이기
-            )
+            reader_registry.get_reader(settings.OCR_LANGUAGES)
             print("✅ EasyOCR 초기화 완료")
         except Exception as e:
-            print(f"❌ EasyOCR 초기화 실패: {e}")
-            # 기본 설정으로 재시도
-            try:
-                self.reader = easyocr.Reader(['ko', 'en'], gpu=False)
-                print("✅ 기본 설정으로 EasyOCR 초기화 완료")
-            except Exception as e2:
-                raise OCRException(f"EasyOCR 초기화 실패: {str(e2)}")
+            raise OCRException(f"EasyOCR 초기화 실패: {str(e)}")
+    
+    @property
+    def reader(self):
+        """현재 요청 언어(reader_registry.ocr_languages)에 맞는 EasyOCR 리더 (없으면 기본 언어 리더)"""
+        return reader_registry.get_reader()
     
     def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """
@@ -145,26 +158,20 @@ class OCRService:
     def _preprocess_multiscale(self, image: np.ndarray) -> list:
         """다중 스케일 전처리 - 여러 크기로 처리하여 작은 텍스트도 포착 (강도 조절)"""
         try:
-            preprocessed_images = []
-            
-            # 원본 크기 (약한 전처리)
-            preprocessed_images.append(self._preprocess_image(image))
-            
-            # 1.2배 확대 (약한 전처리)
-            height, width = image.shape[:2]
-            enlarged = cv2.resize(image, (int(width * 1.2), int(height * 1.2)), interpolation=cv2.INTER_LINEAR)
-            preprocessed_images.append(self._preprocess_image(enlarged))
-            
-            # 1.5배 확대 (약한 전처리)
-            enlarged_15x = cv2.resize(image, (int(width * 1.5), int(height * 1.5)), interpolation=cv2.INTER_LINEAR)
-            preprocessed_images.append(self._preprocess_image(enlarged_15x))
-            
-            return preprocessed_images
+            # 원본 크기, 1.2배, 1.5배 확대 (약한 전처리)
+            return [self._preprocess_scaled(image, scale) for scale in MULTISCALE_FACTORS]
             
         except Exception as e:
             print(f"⚠️ 다중 스케일 전처리 실패: {e}")
             return [self._preprocess_image(image)]
     
+    def _preprocess_scaled(self, image: np.ndarray, scale: float) -> np.ndarray:
+        """지정 배율로 확대한 뒤 기본 전처리 (약한 강도)"""
+        if scale != 1.0:
+            height, width = image.shape[:2]
+            image = cv2.resize(image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_LINEAR)
+        return self._preprocess_image(image)
+    
     def _enhance_small_text(self, image: np.ndarray) -> np.ndarray:
         """작은 텍스트 강화 전처리 (약한 강도)"""
         try:
@@ -239,141 +246,366 @@ class OCRService:
             
             # 파일 읽기
             contents = await file.read()
-            image = Image.open(io.BytesIO(contents))
-            
-            # OpenCV 형식으로 변환
-            cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-            
-            # 이미지 크기 조정 (처리 속도 향상)
-            cv_image = self._resize_image(cv_image)
-            
-            # 원본 이미지로 먼저 OCR 시도
-            print("🔍 원본 이미지로 OCR 시도...")
-            original_results = self.reader.readtext(cv_image)
-            print(f"📊 원본 이미지 OCR 결과: {len(original_results)}개 텍스트 발견")
-            
-            if original_results:
-                for i, (bbox, text, conf) in enumerate(original_results[:3]):  # 처음 3개만 출력
-                    print(f"  {i+1}. '{text}' (신뢰도: {conf:.2f})")
-            
-            # 원본에서 결과가 없으면 전처리 시도
-            if not original_results:
-                print("⚠️ 원본 이미지에서 텍스트를 찾지 못했습니다. 전처리 시도...")
-                
-                # 다양한 전처리 방법 적용
-                preprocessed_images = []
-                
-                # 1. 원본 이미지 기반 전처리 (최소한의 처리)
-                print("🔍 원본 기반 전처리 적용...")
-                preprocessed_images.append(self._preprocess_original(cv_image))
-                
-                # 2. 다중 스케일 전처리 적용 (약한 강도)
-                print("🔍 다중 스케일 전처리 적용...")
-                multiscale_images = self._preprocess_multiscale(cv_image)
-                preprocessed_images.extend(multiscale_images)
-                
-                # 3. 작은 텍스트 강화 전처리도 추가 (약한 강도)
-                print("🔍 작은 텍스트 강화 전처리 적용...")
-                small_text_enhanced = self._enhance_small_text(cv_image)
-                preprocessed_images.append(small_text_enhanced)
-                
-                # 4. 원본 이미지도 직접 사용 (전처리 없이)
-                print("🔍 원본 이미지 직접 사용...")
-                preprocessed_images.append(cv_image)
-                
-                # 모든 전처리된 이미지에서 OCR 수행
-                all_results = []
-                for i, preprocessed_image in enumerate(preprocessed_images):
-                    print(f"🔍 전처리 이미지 {i+1}/{len(preprocessed_images)}에서 OCR 수행...")
-                    try:
-                        results = self.reader.readtext(preprocessed_image)
-                        print(f"  → {len(results)}개 텍스트 발견")
-                        all_results.extend(results)
-                    except Exception as e:
-                        print(f"  → OCR 실패: {e}")
-                
-                # 중복 제거 및 신뢰도 기반 필터링
-                unique_results = self._filter_and_merge_results(all_results)
-                final_results = unique_results
-            else:
-                final_results = original_results
             
-            # 결과 처리
-            extracted_text = []
-            bounding_boxes = []
+            return await self._extract_from_bytes(file.filename, contents)
             
-            for (bbox, text, confidence) in final_results:
-                extracted_text.append(text)
-                # numpy 타입을 Python 기본 타입으로 변환
-                converted_bbox = [[float(x), float(y)] for x, y in bbox]
-                bounding_boxes.append(converted_bbox)
+        except DeadlineExceededException:
+            raise
+        except Exception as e:
+            print(f"❌ OCR 실패: {e}")
+            raise OCRException(f"텍스트 추출 실패: {str(e)}")
+    
+    async def extract_text_from_url(self, url: str) -> OCRResponse:
+        """
+        URL 이미지에서 텍스트 추출
+        
+        다운로드는 공유 HTTP 클라이언트(연결 풀, 호스트별 동시성 제한, 디스크 캐시)로 수행하고
+        OCR은 업로드 이미지와 같은 경로로 처리합니다.
+        """
+        print(f"🔍 URL OCR 시작: {url}")
+        contents = await http_fetcher.fetch(url)
+        
+        try:
+            filename = os.path.basename(urlparse(url).path) or url
+            return await self._extract_from_bytes(filename, contents)
+        except DeadlineExceededException:
+            raise
+        except Exception as e:
+            print(f"❌ URL OCR 실패: {e}")
+            raise OCRException(f"URL 이미지 텍스트 추출 실패: {str(e)}")
+    
+    async def _extract_from_bytes(self, original_filename: str, contents: bytes) -> OCRResponse:
+        """이미지 파일 내용 OCR 후 응답 생성"""
+        # 디코딩/OCR/결과 이미지 생성은 CPU 작업이므로
+        # 이벤트 루프가 아닌 OCR 스케줄러의 스레드 예산 안에서 실행 (분산 큐 사용 시 워커 노드에서 실행)
+        if distributed_queue.enabled:
+            final_results, filename = await distributed_queue.submit(contents)
+        else:
+            final_results, filename = await ocr_scheduler.run(self._process_upload, contents)
+        
+        return self._build_response(original_filename, final_results, *self._result_image_urls(filename))
+    
+    def _build_response(self, original_filename: str, final_results: list, result_image_url: str,
+                        thumbnail_url: Optional[str] = None) -> OCRResponse:
+        """OCR 결과 목록을 응답 모델로 변환"""
+        extracted_text = [text for _, text, _ in final_results]
+        # numpy 타입을 Python 기본 타입으로 변환 (박스 전체를 한 번에 배열로 변환)
+        bounding_boxes = boxes_to_array([bbox for bbox, _, _ in final_results]).tolist()
+        
+        print(f"📊 최종 OCR 결과: {len(extracted_text)}개 텍스트")
+        if extracted_text:
+            print(f"📝 추출된 텍스트: {' '.join(extracted_text[:3])}...")
+        
+        return OCRResponse(
+            original_filename=original_filename,
+            extracted_text=" ".join(extracted_text),
+            confidence_scores=[float(conf) for _, _, conf in final_results],
+            bounding_boxes=bounding_boxes,
+            result_image_url=result_image_url,
+            thumbnail_url=thumbnail_url,
+            total_text_count=len(extracted_text),
+            text_lines=extracted_text
+        )
+    
+    def _process_upload(self, contents: bytes) -> Tuple[list, str]:
+        """
+        업로드 이미지 OCR 처리 (OCR 스케줄러 작업 스레드에서 실행)
+        
+        Args:
+            contents (bytes): 업로드된 이미지 파일 내용
             
-            print(f"📊 최종 OCR 결과: {len(extracted_text)}개 텍스트")
-            if extracted_text:
-                print(f"📝 추출된 텍스트: {' '.join(extracted_text[:3])}...")
+        Returns:
+            Tuple[list, str]: (최종 OCR 결과, 결과 이미지 파일명)
+        """
+        return self._process_image(Image.open(io.BytesIO(contents)))
+    
+    def _process_image(self, image: Image.Image) -> Tuple[list, str]:
+        """
+        PIL 이미지 OCR 처리 (업로드 이미지, 문서 페이지 공통)
+        
+        Args:
+            image (Image.Image): RGB PIL 이미지
             
-            # 결과 이미지 생성 (원본 이미지에 바운딩 박스 표시)
-            result_image = self._create_result_image(cv_image, final_results)
+        Returns:
+            Tuple[list, str]: (최종 OCR 결과, 결과 이미지 파일명)
+        """
+        # OpenCV 형식으로 변환
+        full_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+        
+        # 이미지 크기 조정 (처리 속도 향상)
+        cv_image = self._resize_image(full_image)
+        
+        final_results = self._run_ocr_cascade(cv_image, full_image)
+        
+        # 결과 이미지 생성 (원본 이미지에 바운딩 박스 표시) 및 저장
+        # 요청이 이미 마감/취소되었으면 아무도 받지 않을 이미지는 만들지 않음
+        check_deadline("render")
+        filename = self._save_result_image(cv_image, final_results)
+        return final_results, filename
+    
+    def _run_ocr_cascade(self, cv_image: np.ndarray, full_image: np.ndarray = None) -> list:
+        """
+        원본 이미지 OCR 후 결과가 없으면 전처리 변형들로 재시도
+        
+        Args:
+            cv_image (np.ndarray): 크기 조정된 이미지 (OpenCV 형식)
+            full_image (np.ndarray): 크기 조정 전 원본 해상도 이미지 (2단계 OCR용, 선택)
             
-            # 결과 이미지 저장
-            filename = f"{uuid.uuid4()}.jpg"
-            result_path = os.path.join(settings.RESULTS_DIR, filename)
-            cv2.imwrite(result_path, result_image)
-
-            # 결과 이미지 파일 개수 제한 (20개 초과 시 오래된 파일 삭제)
+        Returns:
+            list: (bbox, text, confidence) 튜플 목록 (cv_image 좌표 기준)
+        """
+        # 원본 이미지로 먼저 OCR 시도
+        print("🔍 원본 이미지로 OCR 시도...")
+        original_results = self._read_text(cv_image, full_image)
+        print(f"📊 원본 이미지 OCR 결과: {len(original_results)}개 텍스트 발견")
+        
+        if original_results:
+            for i, (bbox, text, conf) in enumerate(original_results[:3]):  # 처음 3개만 출력
+                print(f"  {i+1}. '{text}' (신뢰도: {conf:.2f})")
+            return original_results
+        
+        # 원본에서 결과가 없으면 전처리 시도
+        print("⚠️ 원본 이미지에서 텍스트를 찾지 못했습니다. 전처리 시도...")
+        
+        # 다양한 전처리 변형 (필요할 때 생성)
+        variants = self._fallback_variants(cv_image, full_image)
+        names = list(variants)
+        adaptive = settings.OCR_ADAPTIVE_STRATEGY
+        # 조기 중단은 다른 변형에서만 찾는 텍스트를 놓칠 수 있으므로 별도 설정으로 켬 (기본: 모든 변형 실행 후 융합)
+        early_stop = adaptive and settings.OCR_STRATEGY_EARLY_STOP
+        if adaptive:
+            # 운영 중 채택 이력이 좋은 변형부터 시도 (마감 시간/양보로 중간에 끊겨도 좋은 변형이 먼저 실행됨)
+            names = strategy_selector.order(names)
+            print(f"🎯 전처리 변형 시도 순서: {', '.join(names)}")
+        
+        all_results = []
+        tried = []
+        accepted = {}  # 변형 이름 -> 채택 기준 신뢰도 이상인 검출 수
+        fused_count = 0
+        for i, name in enumerate(names):
+            # 변형 경계: bulk 작업은 대기 중인 interactive 작업에 실행 슬롯을 양보
+            ocr_scheduler.checkpoint()
+            print(f"🔍 전처리 변형 {i+1}/{len(names)} ({name})에서 OCR 수행...")
+            tried.append(name)
+            results = []
             try:
-                files = [os.path.join(settings.RESULTS_DIR, f) for f in os.listdir(settings.RESULTS_DIR) if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
-                if len(files) > 20:
-                    files.sort(key=lambda x: os.path.getctime(x))  # 생성시간 기준 정렬
-                    for old_file in files[:-20]:
-                        try:
-                            os.remove(old_file)
-                            print(f"🗑️ 오래된 결과 이미지 삭제: {old_file}")
-                        except Exception as e:
-                            print(f"⚠️ 이미지 삭제 실패: {old_file} - {e}")
+                preprocessed_image = variants[name]()
+                results = self._readtext(preprocessed_image)
+                print(f"  → {len(results)}개 텍스트 발견")
+                # 확대 변형의 박스는 기준 이미지(cv_image) 좌표로 환산
+                scale_x = preprocessed_image.shape[1] / cv_image.shape[1]
+                scale_y = preprocessed_image.shape[0] / cv_image.shape[0]
+                all_results.extend(rescale_results(results, scale_x, scale_y))
             except Exception as e:
-                print(f"⚠️ 결과 이미지 정리 중 오류: {e}")
+                print(f"  → OCR 실패: {e}")
+            accepted[name] = sum(1 for _, _, conf in results if conf >= settings.OCR_STRATEGY_ACCEPT_CONFIDENCE)
+            
+            if early_stop:
+                # 채택 가능한 텍스트가 나온 뒤, 새 변형이 융합 결과에 새 텍스트 영역을 더하지 못하면
+                # 이후 변형도 같은 텍스트를 다시 찾을 가능성이 높으므로 중단
+                count = len(fuse_results(all_results, iou_threshold=settings.OCR_FUSION_IOU_THRESHOLD, min_confidence=0.1))
+                if any(accepted.values()) and len(tried) > 1 and count <= fused_count:
+                    print(f"✅ '{name}' 변형이 새 텍스트를 추가하지 않아 나머지 {len(names) - len(tried)}개 변형 생략")
+                    break
+                fused_count = count
+        
+        if adaptive:
+            # 채택 기준 이상의 검출을 가장 많이 낸 변형을 성공으로 기록
+            winner = max(accepted, key=accepted.get) if any(accepted.values()) else None
+            strategy_selector.record(tried, winner)
+        metrics.increment("ocr_fallback_runs")
+        metrics.increment("ocr_fallback_variants_tried", len(tried))
+        
+        # 위치 기반 융합 (겹치는 검출 클러스터링) 및 신뢰도 기반 필터링
+        return self._filter_and_merge_results(all_results)
+    
+    def _fallback_variants(self, cv_image: np.ndarray, full_image: np.ndarray = None) -> dict:
+        """
+        fallback 단계 전처리 변형 목록 (기본 시도 순서)
+        
+        Returns:
+            dict: 변형 이름 → 전처리 이미지를 만드는 함수
+        """
+        variants = {
+            # 1. 원본 이미지 기반 전처리 (최소한의 처리)
+            "original_binary": lambda: self._preprocess_original(cv_image),
+        }
+        
+        # 2. 다중 스케일 전처리 (약한 강도)
+        # 2단계 OCR에서는 작은 텍스트를 원본 해상도 크롭으로 인식하므로 확대 변형(1.2x/1.5x)은 생략
+        scales = (1.0,) if self._two_pass_enabled(cv_image, full_image) else MULTISCALE_FACTORS
+        for scale in scales:
+            variants[f"preprocess_{scale}x"] = lambda scale=scale: self._preprocess_scaled(cv_image, scale)
+        
+        # 3. 작은 텍스트 강화 전처리 (약한 강도)
+        variants["small_text"] = lambda: self._enhance_small_text(cv_image)
+        
+        # 4. 원본 이미지 직접 사용 (전처리 없이)
+        variants["raw"] = lambda: cv_image
+        return variants
+    
+    def _two_pass_enabled(self, cv_image: np.ndarray, full_image: np.ndarray) -> bool:
+        """2단계 OCR 적용 여부 (설정이 켜져 있고 원본이 축소 이미지보다 클 때)"""
+        return (
+            settings.OCR_TWO_PASS
+            and full_image is not None
+            and max(full_image.shape[:2]) > max(cv_image.shape[:2])
+        )
+    
+    def _read_text(self, cv_image: np.ndarray, full_image: np.ndarray = None) -> list:
+        """
+        기본 OCR 수행 (2단계 OCR 설정 시 coarse-to-fine 방식)
+        
+        Args:
+            cv_image (np.ndarray): 크기 조정된 이미지
+            full_image (np.ndarray): 원본 해상도 이미지 (선택)
             
-            return OCRResponse(
-                original_filename=file.filename,
-                extracted_text=" ".join(extracted_text),
-                confidence_scores=[float(conf) for _, _, conf in final_results],
-                bounding_boxes=bounding_boxes,
-                result_image_url=f"/static/results/{filename}",
-                total_text_count=len(extracted_text)
-            )
+        Returns:
+            list: (bbox, text, confidence) 튜플 목록 (cv_image 좌표 기준)
+        """
+        if self._two_pass_enabled(cv_image, full_image):
+            return self._read_text_two_pass(cv_image, full_image)
+        return self._readtext(cv_image)
+    
+    def _readtext(self, image: np.ndarray) -> list:
+        """
+        검출 + 인식 수행 (요청 간 배칭 설정 시 인식 단계를 배처에 위임)
+        
+        Args:
+            image (np.ndarray): OCR 대상 이미지
             
-        except Exception as e:
-            print(f"❌ OCR 실패: {e}")
-            raise OCRException(f"텍스트 추출 실패: {str(e)}")
+        Returns:
+            list: (bbox, text, confidence) 튜플 목록
+        """
+        if not settings.OCR_BATCHING:
+            return self.reader.readtext(image)
+        horizontal_list, free_list = self.reader.detect(image)
+        return self._recognize(image, horizontal_list[0], free_list[0])
+    
+    def _recognize(self, image: np.ndarray, horizontal_list: list, free_list: list) -> list:
+        """검출된 박스 인식 (배칭 설정 시 다른 요청의 크롭과 함께 한 번의 forward로 처리)"""
+        if settings.OCR_BATCHING:
+            return recognition_batcher.recognize(self.reader, image, horizontal_list, free_list)
+        return self.reader.recognize(image, horizontal_list, free_list)
+    
+    def _read_text_two_pass(self, low_image: np.ndarray, full_image: np.ndarray) -> list:
+        """
+        2단계(coarse-to-fine) OCR
+        
+        1단계: 축소 이미지에서 텍스트 영역 검출 (CRAFT 비용은 해상도에 비례하므로 저해상도로 수행)
+        2단계: 검출 영역을 원본 해상도 좌표로 변환하여 원본 이미지 크롭으로 인식
+        
+        축소 과정에서 뭉개지는 부제목/저자명 같은 작은 글자를
+        원본 해상도 수준의 정확도로 인식하면서 비용은 저해상도 OCR에 가깝게 유지합니다.
+        
+        Args:
+            low_image (np.ndarray): 검출용 축소 이미지
+            full_image (np.ndarray): 인식용 원본 해상도 이미지
+            
+        Returns:
+            list: (bbox, text, confidence) 튜플 목록 (low_image 좌표 기준)
+        """
+        # 너무 큰 원본은 인식용 최대 크기로 제한
+        full_image = self._resize_image(full_image, max_size=settings.OCR_TWO_PASS_MAX_SIZE)
+        scale_x = full_image.shape[1] / low_image.shape[1]
+        scale_y = full_image.shape[0] / low_image.shape[0]
+        print(f"🔍 2단계 OCR: {low_image.shape[1]}x{low_image.shape[0]}에서 검출 → {full_image.shape[1]}x{full_image.shape[0]}에서 인식")
+        
+        # 1단계: 저해상도 검출
+        horizontal_list, free_list = self.reader.detect(low_image)
+        horizontal_list, free_list = horizontal_list[0], free_list[0]
+        if not horizontal_list and not free_list:
+            return []
+        
+        # 검출 박스를 원본 해상도 좌표로 변환
+        # horizontal_list: [x_min, x_max, y_min, y_max] / free_list: 네 꼭짓점 [[x, y], ...]
+        full_horizontal = [
+            [int(x_min * scale_x), int(x_max * scale_x), int(y_min * scale_y), int(y_max * scale_y)]
+            for x_min, x_max, y_min, y_max in horizontal_list
+        ]
+        full_free = [
+            [[int(x * scale_x), int(y * scale_y)] for x, y in box]
+            for box in free_list
+        ]
+        
+        # 2단계: 원본 해상도 크롭 인식
+        results = self._recognize(full_image, full_horizontal, full_free)
+        
+        # 결과 박스를 다시 축소 이미지 좌표로 변환 (결과 이미지/응답 좌표계 유지)
+        return [
+            ([[x / scale_x, y / scale_y] for x, y in bbox], text, confidence)
+            for bbox, text, confidence in results
+        ]
+    
+    def _save_result_image(self, cv_image: np.ndarray, results: list) -> str:
+        """
+        결과 이미지 생성 및 결과 저장소에 저장 (로컬 저장소는 20개 초과 시 오래된 파일 삭제)
+        
+        파일명은 이미지 내용의 해시이므로 같은 URL의 내용은 바뀌지 않습니다.
+        (정적 파일 서빙 시 immutable 캐시 헤더 사용, app.core.responses.CachedStaticFiles 참고)
+        
+        Returns:
+            str: 저장된 결과 이미지 파일명
+        """
+        result_image = self._create_result_image(cv_image, results)
+        
+        # 결과 이미지 인코딩 (jpg / webp) 후 내용 해시로 파일명 결정
+        extension = ".webp" if settings.OCR_RESULT_IMAGE_FORMAT == "webp" else ".jpg"
+        encoded = self._encode_image(result_image, extension)
+        digest = hashlib.sha256(encoded).hexdigest()[:32]
+        filename = f"{digest}{extension}"
+        result_storage.put(filename, encoded)
+        
+        # 목록/미리보기용 썸네일
+        if settings.OCR_RESULT_THUMBNAILS:
+            thumbnail = self._resize_image(result_image, max_size=settings.OCR_THUMBNAIL_SIZE)
+            result_storage.put(f"{digest}.thumb{extension}", self._encode_image(thumbnail, extension))
+
+        # 결과 이미지 파일 개수 제한 (로컬 저장소만, S3는 버킷 수명 주기 규칙 사용)
+        result_storage.prune()
+        
+        return filename
+    
+    def _encode_image(self, image: np.ndarray, extension: str) -> bytes:
+        """결과 이미지를 jpg / webp 바이트로 인코딩"""
+        quality = settings.OCR_RESULT_IMAGE_QUALITY
+        params = [cv2.IMWRITE_WEBP_QUALITY, quality] if extension == ".webp" else [cv2.IMWRITE_JPEG_QUALITY, quality]
+        success, buffer = cv2.imencode(extension, image, params)
+        if not success:
+            raise OCRException("결과 이미지 인코딩 실패")
+        return buffer.tobytes()
+    
+    def _result_image_urls(self, filename: str) -> Tuple[str, Optional[str]]:
+        """
+        결과 이미지 파일명으로 (결과 이미지 URL, 썸네일 URL) 생성
+        
+        URL 형식은 결과 저장소에 따라 다릅니다 (로컬: /static/results/..., S3: 서명 URL / 프록시 경로 / 공개 URL).
+        썸네일은 OCR_RESULT_THUMBNAILS 설정 시 결과 이미지와 함께 항상 저장되므로
+        저장소에 존재 여부를 다시 묻지 않습니다 (원격 저장소 왕복 방지).
+        
+        Returns:
+            Tuple[str, Optional[str]]: 썸네일을 만들지 않으면 썸네일 URL은 None
+        """
+        thumbnail_url = None
+        if settings.OCR_RESULT_THUMBNAILS:
+            stem, extension = os.path.splitext(filename)
+            thumbnail_url = result_storage.url(f"{stem}.thumb{extension}")
+        return result_storage.url(filename), thumbnail_url
     
     def _filter_and_merge_results(self, all_results: list) -> list:
-        """OCR 결과 중복 제거 및 신뢰도 기반 필터링"""
+        """
+        OCR 결과 중복 제거 및 신뢰도 기반 필터링
+        
+        모든 결과는 기준 이미지 좌표여야 하며, 겹치는 검출을 하나의 클러스터로 묶어
+        클러스터마다 변형 간 합의가 가장 높은 텍스트 하나만 남깁니다. (result_fusion 참고)
+        """
         try:
-            # 텍스트별로 그룹화
-            text_groups = {}
-            for bbox, text, confidence in all_results:
-                # 텍스트 정규화 (공백 제거, 소문자 변환)
-                normalized_text = text.strip().lower()
-                
-                if normalized_text not in text_groups:
-                    text_groups[normalized_text] = []
-                
-                text_groups[normalized_text].append((bbox, text, confidence))
-            
-            # 각 그룹에서 최고 신뢰도 결과 선택
-            filtered_results = []
-            for normalized_text, group in text_groups.items():
-                # 신뢰도 기준으로 정렬
-                group.sort(key=lambda x: x[2], reverse=True)
-                best_result = group[0]
-                
-                # 최소 신뢰도 임계값 적용 (너무 낮은 신뢰도 제거)
-                if best_result[2] > 0.1:  # 10% 이상 신뢰도
-                    filtered_results.append(best_result)
-            
-            # 신뢰도 기준으로 정렬
-            filtered_results.sort(key=lambda x: x[2], reverse=True)
+            # 최소 신뢰도 10% 이상 결과만 융합 (신뢰도 내림차순 정렬)
+            filtered_results = fuse_results(
+                all_results,
+                iou_threshold=settings.OCR_FUSION_IOU_THRESHOLD,
+                min_confidence=0.1,
+            )
             
             print(f"📊 OCR 결과 필터링: {len(all_results)} → {len(filtered_results)}")
             return filtered_results
@@ -443,43 +675,8 @@ class OCRService:
         try:
             print(f"🔍 파일 경로 OCR 시작: {image_path}")
             
-            image = cv2.imread(image_path)
-            if image is None:
-                raise OCRException("이미지를 읽을 수 없습니다.")
-            
-            print(f"📏 원본 이미지 크기: {image.shape}")
-            
-            # 이미지 크기 조정
-            image = self._resize_image(image)
-            print(f"📏 리사이즈 후 이미지 크기: {image.shape}")
-            
-            # 원본 이미지로 먼저 OCR 시도
-            print("🔍 원본 이미지로 OCR 시도...")
-            original_results = self.reader.readtext(image)
-            print(f"📊 원본 이미지 OCR 결과: {len(original_results)}개 텍스트 발견")
-            
-            if original_results:
-                for i, (bbox, text, conf) in enumerate(original_results[:3]):
-                    print(f"  {i+1}. '{text}' (신뢰도: {conf:.2f})")
-            
-            # 원본에서 결과가 없으면 전처리 시도
-            if not original_results:
-                print("⚠️ 원본 이미지에서 텍스트를 찾지 못했습니다. 전처리 시도...")
-                
-                # 이미지 전처리
-                preprocessed_image = self._preprocess_image(image)
-                print("🔍 전처리된 이미지로 OCR 시도...")
-                
-                preprocessed_results = self.reader.readtext(preprocessed_image)
-                print(f"📊 전처리 이미지 OCR 결과: {len(preprocessed_results)}개 텍스트 발견")
-                
-                if preprocessed_results:
-                    for i, (bbox, text, conf) in enumerate(preprocessed_results[:3]):
-                        print(f"  {i+1}. '{text}' (신뢰도: {conf:.2f})")
-                
-                results = preprocessed_results if preprocessed_results else original_results
-            else:
-                results = original_results
+            # 이미지 읽기/OCR은 OCR 스케줄러의 스레드 예산 안에서 실행
+            results = await ocr_scheduler.run(self._process_path, image_path)
             
             extracted_text = []
             bounding_boxes = []
@@ -500,13 +697,55 @@ class OCRService:
                 confidence_scores=[float(conf) for _, _, conf in results],
                 bounding_boxes=bounding_boxes,
                 result_image_url="",
-                total_text_count=len(extracted_text)
+                total_text_count=len(extracted_text),
+                text_lines=extracted_text
             )
             
+        except DeadlineExceededException:
+            raise
         except Exception as e:
             print(f"❌ 파일 경로 OCR 실패: {e}")
             raise OCRException(f"파일 경로에서 텍스트 추출 실패: {str(e)}")
     
+    def _process_path(self, image_path: str) -> list:
+        """경로 기반 이미지 OCR 처리 (OCR 스케줄러 작업 스레드에서 실행)"""
+        image = cv2.imread(image_path)
+        if image is None:
+            raise OCRException("이미지를 읽을 수 없습니다.")
+        
+        print(f"📏 원본 이미지 크기: {image.shape}")
+        
+        # 이미지 크기 조정
+        full_image = image
+        image = self._resize_image(full_image)
+        print(f"📏 리사이즈 후 이미지 크기: {image.shape}")
+        
+        # 원본 이미지로 먼저 OCR 시도
+        print("🔍 원본 이미지로 OCR 시도...")
+        original_results = self._read_text(image, full_image)
+        print(f"📊 원본 이미지 OCR 결과: {len(original_results)}개 텍스트 발견")
+        
+        if original_results:
+            for i, (bbox, text, conf) in enumerate(original_results[:3]):
+                print(f"  {i+1}. '{text}' (신뢰도: {conf:.2f})")
+            return original_results
+        
+        # 원본에서 결과가 없으면 전처리 시도
+        print("⚠️ 원본 이미지에서 텍스트를 찾지 못했습니다. 전처리 시도...")
+        
+        # 이미지 전처리
+        preprocessed_image = self._preprocess_image(image)
+        print("🔍 전처리된 이미지로 OCR 시도...")
+        
+        preprocessed_results = self._readtext(preprocessed_image)
+        print(f"📊 전처리 이미지 OCR 결과: {len(preprocessed_results)}개 텍스트 발견")
+        
+        if preprocessed_results:
+            for i, (bbox, text, conf) in enumerate(preprocessed_results[:3]):
+                print(f"  {i+1}. '{text}' (신뢰도: {conf:.2f})")
+        
+        return preprocessed_results if preprocessed_results else original_results
+    
     async def extract_text_with_mode(self, file: UploadFile = None, image_path: str = None, mode: str = "prod"):
         """
         mode에 따라 업로드 파일 또는 경로 기반 이미지에서 OCR 수행
@@ -0,0 +1,182 @@
+"""
+GPT 프롬프트용 OCR 텍스트 압축 모듈
+
+extract_book_title은 OCR 결과를 공백으로 이어 붙인 텍스트를 그대로 보내므로 전처리 변형 간 중복 줄,
+기호 조각, 신뢰도가 낮은 조각, 작은 글씨(출판사 문구, 바코드 숫자 등)까지 프롬프트 토큰과 응답 지연을 늘립니다.
+박스별 신뢰도와 글자 크기로 줄을 고르고 프롬프트 종류별 토큰 예산 안으로 줄입니다.
+
+동작 방식:
+- 박스 정보가 있으면 (OCRResponse.text_lines + confidence_scores + bounding_boxes)
+  1. 기호만 있는 조각, 신뢰도 PROMPT_MIN_CONFIDENCE 미만 조각 제거
+  2. 가장 큰 글자 높이의 PROMPT_MIN_RELATIVE_HEIGHT배보다 작은 글씨 제거
+  3. 대소문자/공백/기호를 무시하고 더 두드러진 줄과 같거나 그 안에 포함된 조각 제거
+  4. 시각적 두드러짐(글자 높이 x 신뢰도) 순으로 정렬 (제목은 보통 표지에서 가장 큰 글씨)
+- 박스 정보가 없으면 (텍스트만 받은 경우) 기호 조각과 반복 단어만 제거하고 원래 순서 유지
+- 프롬프트 종류별 토큰 예산(PROMPT_PROFILES)에 들어가는 줄까지만 사용
+- 토큰 수는 tiktoken이 설치되어 있으면 모델 토크나이저로, 없으면 문자 종류별 근사값으로 계산
+"""
+
+import re
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from app.config.settings import settings
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# 프롬프트 종류별 OCR 텍스트 토큰 예산
+PROMPT_PROFILES = {
+    "book_title": {"budget": settings.PROMPT_BUDGET_BOOK_TITLE},
+}
+
+# 의미 있는 글자 (한글, 영문, 숫자)
+_MEANINGFUL = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣA-Za-z0-9]")
+# 중복 비교 시 무시하는 글자 (공백, 기호)
+_IGNORED = re.compile(r"[\W_]+")
+
+_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수
+
+    tiktoken이 없으면 근사값을 사용합니다 (ASCII 4글자당 1토큰, 한글 등 그 외 글자는 글자당 1토큰).
+    """
+    global _encoding
+    if not text:
+        return 0
+    if tiktoken is not None:
+        if _encoding is None:
+            try:
+                _encoding = tiktoken.encoding_for_model(settings.OPENAI_MODEL)
+            except KeyError:
+                _encoding = tiktoken.get_encoding("cl100k_base")
+        return len(_encoding.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+class PromptText(NamedTuple):
+    """압축한 프롬프트 텍스트와 토큰 통계"""
+    text: str  # 프롬프트에 넣을 텍스트 (줄 단위)
+    tokens: int  # 압축 후 토큰 수
+    original_tokens: int  # 압축 전(이어 붙인 원문) 토큰 수
+    lines_total: int  # 입력 줄(조각) 수
+    lines_kept: int  # 사용한 줄 수
+    by_prominence: bool  # 글자 크기 순으로 정렬했는지 여부
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.original_tokens - self.tokens)
+
+
+def _box_height(bbox) -> float:
+    """박스 글자 높이 (기울어진 박스도 고려하여 왼쪽/오른쪽 변 길이 평균)"""
+    points = np.asarray(bbox, dtype=np.float32).reshape(-1, 2)
+    if len(points) < 4:
+        return 0.0
+    return float((np.linalg.norm(points[3] - points[0]) + np.linalg.norm(points[2] - points[1])) / 2)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split()).strip()
+
+
+def _key(text: str) -> str:
+    return _IGNORED.sub("", text.lower())
+
+
+def _is_junk(text: str) -> bool:
+    """의미 있는 글자가 없거나 영문/숫자 한 글자뿐인 조각"""
+    meaningful = _MEANINGFUL.findall(text)
+    return not meaningful or (len(meaningful) == 1 and not re.match(r"[가-힣]", meaningful[0]))
+
+
+def _select_lines(texts: list, confidences: list, boxes: list) -> list:
+    """노이즈 제거, 중복 제거 후 시각적 두드러짐 순으로 정렬한 줄 목록"""
+    candidates = []
+    for text, confidence, bbox in zip(texts, confidences, boxes):
+        text = _normalize(text)
+        if _is_junk(text) or confidence < settings.PROMPT_MIN_CONFIDENCE:
+            continue
+        height = _box_height(bbox)
+        candidates.append((height * (0.5 + 0.5 * confidence), height, text))
+    if not candidates:
+        return []
+
+    max_height = max(height for _, height, _ in candidates)
+    candidates = [c for c in candidates if c[1] >= max_height * settings.PROMPT_MIN_RELATIVE_HEIGHT]
+    candidates.sort(key=lambda c: c[0], reverse=True)
+
+    # 더 두드러진 줄과 같거나 그 안에 포함된 조각 제거 (두드러진 순서로 보므로 먼저 남은 줄이 우선)
+    kept, kept_keys = [], []
+    for _, _, text in candidates:
+        key = _key(text)
+        if any(key in other for other in kept_keys):
+            continue
+        kept.append(text)
+        kept_keys.append(key)
+    return kept
+
+
+def _select_words(text: str) -> list:
+    """박스 정보가 없을 때: 기호 조각과 반복 단어만 제거 (원래 순서 유지)"""
+    words, seen = [], set()
+    for word in text.split():
+        key = _key(word)
+        if _is_junk(word) or key in seen:
+            continue
+        seen.add(key)
+        words.append(word)
+    return [" ".join(words)] if words else []
+
+
+def build_prompt_text(text: str, prompt_type: str = "book_title", text_lines: Optional[List[str]] = None,
+                      confidences: Optional[List[float]] = None, boxes: Optional[List] = None) -> PromptText:
+    """
+    OCR 결과를 프롬프트 종류의 토큰 예산 안으로 압축
+
+    Args:
+        text (str): 이어 붙인 OCR 텍스트 (박스 정보가 없을 때 사용, 절감량 계산 기준)
+        prompt_type (str): PROMPT_PROFILES 키
+        text_lines, confidences, boxes: 박스별 텍스트/신뢰도/좌표 (길이가 같을 때만 사용)
+
+    Returns:
+        PromptText: 압축한 텍스트와 토큰 통계 (PROMPT_COMPACTION=false이면 원문 그대로)
+    """
+    original_tokens = count_tokens(text)
+    if not settings.PROMPT_COMPACTION:
+        return PromptText(text, original_tokens, original_tokens, 1, 1, False)
+
+    budget = PROMPT_PROFILES.get(prompt_type, PROMPT_PROFILES["book_title"])["budget"]
+    by_prominence = bool(text_lines) and confidences is not None and boxes is not None \
+        and len(text_lines) == len(confidences) == len(boxes)
+    if by_prominence:
+        lines_total = len(text_lines)
+        lines = _select_lines(text_lines, confidences, boxes)
+        if not lines:
+            # 모든 줄이 노이즈로 걸러지면 텍스트 기준 정리로 대신함 (빈 프롬프트 방지)
+            lines, by_prominence = _select_words(text), False
+    else:
+        lines_total = len(text.split())
+        lines = _select_words(text)
+
+    selected, tokens = [], 0
+    for line in lines:
+        line_tokens = count_tokens(line) + (1 if selected else 0)  # 줄바꿈
+        if tokens + line_tokens > budget:
+            if selected:
+                continue  # 더 짧은 다음 줄은 들어갈 수 있음
+            # 첫 줄이 예산보다 길면 예산만큼 글자 수로 자름
+            line = line[:max(1, len(line) * budget // max(1, line_tokens))]
+            line_tokens = count_tokens(line)
+        selected.append(line)
+        tokens += line_tokens
+
+    compacted = "\n".join(selected)
+    return PromptText(compacted, count_tokens(compacted), original_tokens, lines_total, len(selected), by_prominence)
@@ -0,0 +1,282 @@
+"""
+EasyOCR 리더 레지스트리 모듈
+
+프로세스 안에서 EasyOCR 리더를 언어 조합별로 한 번만 생성하여 공유합니다.
+gunicorn preload 모드에서는 마스터 프로세스가 fork 전에 모델을 미리 로딩하므로
+워커 프로세스들은 읽기 전용 가중치 페이지를 copy-on-write로 공유합니다.
+
+주요 기능:
+- 언어 조합별 EasyOCR 리더 풀 (get_reader)
+  - 요청 언어(ocr_languages 컨텍스트 변수, 기본 settings.OCR_LANGUAGES)별로 처음 사용할 때 생성
+    (영어 전용 요청은 더 작고 빠른 영어 인식기 사용)
+  - 검출기(CRAFT)는 언어와 무관하므로 기본 리더의 검출기를 공유
+  - 인식기 메모리 합계가 OCR_READER_POOL_MAX_MB를 넘거나 리더 수가 OCR_READER_POOL_MAX_READERS를 넘으면
+    가장 오래 사용하지 않은 리더부터 제거 (기본 언어 리더는 제거하지 않음)
+- 가중치 파일 mmap 로딩 (로딩 시 피크 메모리 감소)
+- 설정된 추론 백엔드(torch/onnx) 적용
+- fork 전 모델 선로딩 및 gc.freeze() (preload_models)
+- 워커당 torch intra-op 스레드 수 자동 설정 (configure_worker_threads)
+- 워커 프로세스 코어 고정 (pin_process_to_cores)
+"""
+
+import contextlib
+import contextvars
+import gc
+import os
+import threading
+from collections import OrderedDict
+
+import easyocr
+import torch
+
+from app.config.settings import settings
+from app.core.metrics import metrics
+from app.services import inference_backend
+
+# 현재 요청의 인식 언어 (라우트에서 설정, None이면 settings.OCR_LANGUAGES)
+ocr_languages = contextvars.ContextVar("ocr_languages", default=None)
+
+# pin_process_to_cores()로 고정된 코어 목록 (고정하지 않았으면 빈 목록)
+_pinned_cores = []
+
+
+def _available_cpus() -> int:
+    """현재 프로세스가 사용할 수 있는 CPU 코어 수"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@contextlib.contextmanager
+def _mmap_weights():
+    """
+    EasyOCR 모델 로딩 동안 torch.load를 mmap 모드로 교체
+
+    가중치 파일을 메모리 맵으로 읽어 파일 전체를 익명 메모리로 복사하지 않습니다.
+    mmap을 지원하지 않는 torch 버전이나 파일 형식이면 기존 방식으로 로딩합니다.
+    """
+    if not settings.OCR_MMAP_WEIGHTS:
+        yield
+        return
+
+    original_load = torch.load
+
+    def mmap_load(*args, **kwargs):
+        try:
+            return original_load(*args, mmap=True, **kwargs)
+        except (TypeError, RuntimeError):
+            return original_load(*args, **kwargs)
+
+    torch.load = mmap_load
+    try:
+        yield
+    finally:
+        torch.load = original_load
+
+
+def _build_reader(languages: list) -> easyocr.Reader:
+    """EasyOCR 리더 생성 (CPU 모드) 후 설정된 추론 백엔드 적용"""
+    with _mmap_weights():
+        reader = easyocr.Reader(
+            languages,
+            gpu=False,      # CPU 사용
+            verbose=False   # 로그 줄이기
+        )
+    return inference_backend.apply_backend(reader, languages, threads=worker_thread_count())
+
+
+def _recognizer_size_mb(reader: easyocr.Reader) -> float:
+    """리더 인식기의 가중치 메모리 크기 (MB, torch 모듈이 아니면 추정값)"""
+    try:
+        size = sum(p.numel() * p.element_size() for p in reader.recognizer.parameters())
+        return size / (1024 * 1024)
+    except Exception:
+        return settings.OCR_READER_ESTIMATED_MB
+
+
+def language_key(languages: list) -> tuple:
+    """언어 목록을 풀 키로 변환 (순서와 중복 무시)"""
+    return tuple(sorted(set(languages)))
+
+
+class ReaderPool:
+    """
+    언어 조합별 EasyOCR 리더 LRU 풀
+
+    Attributes:
+        max_mb (float): 인식기 메모리 예산 (MB)
+        max_readers (int): 최대 리더 수
+    """
+
+    def __init__(self, max_mb: float = None, max_readers: int = None):
+        self.max_mb = max_mb or settings.OCR_READER_POOL_MAX_MB
+        self.max_readers = max_readers or settings.OCR_READER_POOL_MAX_READERS
+        self._lock = threading.Lock()
+        self._readers = OrderedDict()  # 언어 키 -> (리더, 인식기 크기 MB)
+        self._build_locks = {}  # 언어 키 -> 생성 잠금 (같은 리더를 동시에 두 번 만들지 않도록)
+        self._default_key = language_key(settings.OCR_LANGUAGES)
+
+    def get(self, languages: list = None) -> easyocr.Reader:
+        """
+        언어 조합에 맞는 리더 반환 (없으면 생성)
+
+        기본 언어 리더 생성이 실패하면 ["ko", "en"]으로 재시도합니다.
+        preload 모드에서는 마스터 프로세스에서 이미 생성된 기본 리더를 그대로 반환합니다.
+        """
+        key = language_key(languages or settings.OCR_LANGUAGES)
+        with self._lock:
+            entry = self._readers.get(key)
+            if entry is not None:
+                self._readers.move_to_end(key)
+                return entry[0]
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                entry = self._readers.get(key)
+            if entry is not None:
+                return entry[0]
+
+            metrics.increment("ocr_reader_pool_build")
+            try:
+                reader = _build_reader(list(key))
+            except Exception as e:
+                if key != self._default_key:
+                    raise
+                print(f"❌ EasyOCR 초기화 실패: {e}")
+                # 기본 설정으로 재시도
+                reader = _build_reader(["ko", "en"])
+                print("✅ 기본 설정으로 EasyOCR 초기화 완료")
+            self._add(key, reader)
+            return reader
+
+    def _add(self, key: tuple, reader: easyocr.Reader):
+        with self._lock:
+            default = self._readers.get(self._default_key)
+            if default is not None and key != self._default_key:
+                # 검출기는 언어와 무관하므로 기본 리더의 검출기를 공유 (새로 로딩한 검출기는 해제)
+                reader.detector = default[0].detector
+            self._readers[key] = (reader, _recognizer_size_mb(reader))
+            self._evict(keep=key)
+            print(f"✅ EasyOCR 리더 생성: {'+'.join(key)} (풀: {len(self._readers)}개, {self.total_mb():.0f}MB)")
+
+    def _evict(self, keep: tuple):
+        """예산을 넘으면 기본 리더와 방금 만든 리더(keep)를 제외하고 가장 오래 사용하지 않은 리더부터 제거"""
+        while len(self._readers) > 1 and (
+            len(self._readers) > self.max_readers or self.total_mb() > self.max_mb
+        ):
+            key = next((k for k in self._readers if k not in (self._default_key, keep)), None)
+            if key is None:
+                return
+            del self._readers[key]
+            metrics.increment("ocr_reader_pool_evicted")
+            print(f"🗑️ EasyOCR 리더 제거 (LRU): {'+'.join(key)}")
+
+    def total_mb(self) -> float:
+        """풀에 있는 인식기 메모리 합계 (MB)"""
+        return sum(size for _, size in self._readers.values())
+
+    def loaded(self) -> list:
+        """로딩된 언어 조합 목록 (오래 사용하지 않은 순)"""
+        with self._lock:
+            return ["+".join(key) for key in self._readers]
+
+
+# 프로세스 공유 리더 풀
+reader_pool = ReaderPool()
+
+
+def get_reader(languages: list = None) -> easyocr.Reader:
+    """
+    언어 조합에 맞는 프로세스 공유 EasyOCR 리더 반환
+
+    Args:
+        languages (list): 인식 언어 목록 (None이면 현재 요청의 ocr_languages, 그것도 없으면 settings.OCR_LANGUAGES)
+    """
+    return reader_pool.get(languages or ocr_languages.get())
+
+
+def validate_languages(languages: list) -> list:
+    """
+    요청 언어 목록 검증 (허용되지 않은 언어가 있으면 ValueError)
+
+    임의의 언어 조합으로 리더를 계속 새로 만들지 않도록 OCR_ALLOWED_LANGUAGES 안에서만 허용합니다.
+    """
+    languages = [language.strip() for language in languages if language and language.strip()]
+    if not languages:
+        raise ValueError("인식 언어가 비어 있습니다.")
+    unsupported = [language for language in languages if language not in settings.OCR_ALLOWED_LANGUAGES]
+    if unsupported:
+        raise ValueError(f"지원하지 않는 인식 언어입니다: {unsupported} (지원: {settings.OCR_ALLOWED_LANGUAGES})")
+    return languages
+
+
+def preload_models() -> None:
+    """
+    fork 전 모델 선로딩 (gunicorn 마스터 프로세스에서 호출)
+
+    리더를 생성한 뒤 gc.freeze()로 현재 객체들을 GC 추적 대상에서 제외합니다.
+    워커에서 GC가 실행되어도 공유 페이지에 쓰기가 발생하지 않아 copy-on-write 복사를 줄입니다.
+    """
+    print("🔧 워커 fork 전 EasyOCR 모델 선로딩...")
+    get_reader()
+    gc.collect()
+    gc.freeze()
+    print(f"✅ 모델 선로딩 완료 (고정된 객체 수: {gc.get_freeze_count()})")
+
+
+def worker_thread_count(workers: int = None) -> int:
+    """
+    워커 프로세스 하나가 사용할 추론 스레드 수
+
+    settings.OCR_TORCH_THREADS가 0이면 사용 가능한 코어를 워커 수로 나누어 자동 결정합니다.
+    """
+    threads = settings.OCR_TORCH_THREADS
+    if threads <= 0 and _pinned_cores:
+        # 코어가 고정된 워커는 고정된 코어를 모두 사용
+        threads = len(_pinned_cores)
+    elif threads <= 0:
+        workers = workers or settings.OCR_WORKERS
+        threads = max(1, _available_cpus() // max(1, workers))
+    return threads
+
+
+def configure_worker_threads(workers: int = None) -> int:
+    """
+    워커 프로세스의 torch intra-op 스레드 수 설정
+
+    여러 워커가 모든 코어를 각각 점유하는 과다 구독을 막기 위해 워커 프로세스에서 호출합니다.
+
+    Returns:
+        int: 설정된 스레드 수
+    """
+    threads = worker_thread_count(workers)
+    torch.set_num_threads(threads)
+    print(f"🧵 torch 스레드 수 설정: {threads} (pid={os.getpid()})")
+    return threads
+
+
+def pin_process_to_cores(slot: int, slots: int) -> list:
+    """
+    현재 프로세스를 slot번째 코어 집합에 고정 (Linux 전용)
+
+    사용 가능한 코어를 slots개 구간으로 나누어 워커끼리 같은 코어를 두고 경쟁하지 않게 합니다.
+
+    Args:
+        slot (int): 워커 슬롯 번호 (0부터 시작)
+        slots (int): 전체 워커 수
+
+    Returns:
+        list: 고정된 코어 번호 목록 (지원하지 않는 환경이면 빈 목록)
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return []
+
+    cpus = sorted(os.sched_getaffinity(0))
+    per_worker = max(1, len(cpus) // max(1, slots))
+    start = (slot * per_worker) % len(cpus)
+    assigned = cpus[start:start + per_worker]
+    os.sched_setaffinity(0, assigned)
+    _pinned_cores[:] = assigned
+    print(f"📌 워커 코어 고정: pid={os.getpid()} cores={assigned}")
+    return assigned
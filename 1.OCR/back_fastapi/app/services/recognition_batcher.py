@@ -0,0 +1,173 @@
+"""
+EasyOCR 인식 단계 요청 간 마이크로 배칭 모듈
+
+EasyOCR의 readtext는 CPU 모드에서 텍스트 박스를 하나씩 인식기에 넣기 때문에
+요청마다 아주 작은 배치가 반복 실행되고 CPU SIMD 유닛이 쉬는 시간이 많습니다.
+이 모듈은 동시에 진행 중인 모든 OCR 요청의 크롭을 최대 몇 밀리초 동안 모아
+인식기 forward 한 번으로 처리한 뒤 결과를 요청별로 나누어 돌려줍니다.
+
+동작 방식:
+1. OCR 작업 스레드가 검출 결과로 크롭 목록을 만들어 배치 큐에 넣고 결과를 기다림
+2. 배치 스레드가 첫 작업을 받은 뒤 OCR_BATCH_MAX_WAIT_MS 동안 같은 리더의 작업을 추가로 모음
+   (크롭 수가 OCR_BATCH_MAX_SIZE에 도달하면 즉시 실행)
+3. 모은 크롭을 easyocr.recognition.get_text로 한 번에 인식하고 요청별로 결과를 분배
+4. 배치당 크롭 수/요청 수를 메트릭(ocr_batch_crops, ocr_batch_requests)으로 기록
+
+주의: allowlist/blocklist, 문단 병합 등 readtext의 부가 옵션은 사용하지 않는 기본 경로만 지원합니다.
+"""
+
+import collections
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import cv2
+import numpy as np
+import torch
+from easyocr.recognition import get_text
+from easyocr.utils import get_image_list
+
+from app.config.settings import settings
+from app.core.metrics import metrics
+from app.services.ocr_scheduler import ocr_scheduler
+
+# 인식기 입력 높이 (easyocr.config.imgH)
+RECOGNIZER_INPUT_HEIGHT = 64
+
+
+class _BatchJob:
+    """배치 큐에 들어가는 요청 하나의 크롭 묶음"""
+
+    def __init__(self, reader, image_list: list, max_width: int):
+        self.reader = reader
+        self.image_list = image_list
+        self.max_width = max_width
+        self.future = Future()
+
+
+class RecognitionBatcher:
+    """
+    요청 간 인식 마이크로 배처
+
+    Attributes:
+        max_batch_size (int): 한 번의 인식기 forward에 넣을 최대 크롭 수
+        max_wait (float): 다른 요청의 크롭을 기다리는 최대 시간 (초)
+    """
+
+    def __init__(self, max_batch_size: int = None, max_wait_ms: float = None):
+        self.max_batch_size = max_batch_size or settings.OCR_BATCH_MAX_SIZE
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else settings.OCR_BATCH_MAX_WAIT_MS) / 1000
+        self._queue = queue.Queue()
+        self._deferred = collections.deque()  # 다른 리더의 작업 (다음 배치로 미룸)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    def recognize(self, reader, image: np.ndarray, horizontal_list: list, free_list: list) -> list:
+        """
+        검출된 박스들을 배치 인식 (OCR 작업 스레드에서 호출, 결과가 나올 때까지 대기)
+
+        Args:
+            reader: EasyOCR 리더
+            image (np.ndarray): 원본 이미지 (BGR 또는 그레이스케일)
+            horizontal_list (list): 수평 박스 목록 [x_min, x_max, y_min, y_max]
+            free_list (list): 자유 형태 박스 목록 (네 꼭짓점)
+
+        Returns:
+            list: (bbox, text, confidence) 튜플 목록
+        """
+        grey = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        image_list, max_width = get_image_list(
+            horizontal_list, free_list, grey, model_height=RECOGNIZER_INPUT_HEIGHT
+        )
+        if not image_list:
+            return []
+
+        job = _BatchJob(reader, image_list, max_width)
+        self._ensure_thread()
+        self._queue.put(job)
+        return job.future.result()
+
+    def _ensure_thread(self):
+        """배치 스레드 시작 (fork 이후 워커 프로세스에서 처음 사용할 때 생성)"""
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="ocr-batcher", daemon=True)
+                self._thread.start()
+
+    def _next_job(self, timeout: float = None):
+        """미뤄둔 작업을 먼저 꺼내고, 없으면 큐에서 대기"""
+        if self._deferred:
+            return self._deferred.popleft()
+        return self._queue.get(timeout=timeout)
+
+    def _collect_batch(self) -> list:
+        """첫 작업을 받은 뒤 최대 대기 시간 동안 같은 리더의 작업을 모음"""
+        first = self._next_job()
+        batch = [first]
+        crops = len(first.image_list)
+        deadline = time.monotonic() + self.max_wait
+        skipped = []
+
+        while crops < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 and not self._deferred:
+                break
+            try:
+                job = self._next_job(timeout=max(remaining, 0.0))
+            except queue.Empty:
+                break
+            if job.reader is first.reader:
+                batch.append(job)
+                crops += len(job.image_list)
+            else:
+                skipped.append(job)
+
+        self._deferred.extend(skipped)
+        return batch
+
+    def _loop(self):
+        """배치 스레드 메인 루프"""
+        threads = None
+        while True:
+            batch = self._collect_batch()
+            # 배치 스레드도 작업 하나로 계산한 스레드 예산 사용 (진행 중인 작업 수에 따라 배치마다 조정)
+            budget = ocr_scheduler.thread_budget(ocr_scheduler.active_jobs)
+            if budget != threads:
+                threads = budget
+                torch.set_num_threads(threads)
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                print(f"⚠️ 배치 인식 실패: {e}")
+                for job in batch:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+
+    def _run_batch(self, batch: list):
+        """모은 크롭을 인식기 forward 한 번(또는 max_batch_size 단위)으로 처리하고 결과 분배"""
+        reader = batch[0].reader
+        image_list = [crop for job in batch for crop in job.image_list]
+        max_width = max(job.max_width for job in batch)
+        ignore_char = "".join(set(reader.character) - set(reader.lang_char))
+
+        results = get_text(
+            reader.character, RECOGNIZER_INPUT_HEIGHT, int(max_width),
+            reader.recognizer, reader.converter, image_list,
+            ignore_char, "greedy", 5, min(len(image_list), self.max_batch_size),
+            0.1, 0.5, 0.003, 0, reader.device,
+        )
+
+        metrics.observe("ocr_batch_crops", len(image_list))
+        metrics.observe("ocr_batch_requests", len(batch))
+
+        offset = 0
+        for job in batch:
+            count = len(job.image_list)
+            job.future.set_result(results[offset:offset + count])
+            offset += count
+
+
+# 전역 배처 인스턴스
+# 다른 모듈에서 from app.services.recognition_batcher import recognition_batcher로 사용
+recognition_batcher = RecognitionBatcher()
@@ -0,0 +1,132 @@
+"""
+다중 변형 OCR 결과 융합 모듈
+
+전처리/확대 변형마다 얻은 OCR 결과를 하나로 합칩니다.
+텍스트 문자열만으로 중복을 제거하면 확대 변형(1.2x, 1.5x)의 박스가 확대 좌표로 남아
+엉뚱한 위치에 표시되고, 인식 결과가 한 글자만 달라도 같은 영역이 여러 번 남습니다.
+
+주요 기능:
+- 변형별 박스를 기준 이미지 좌표로 환산
+- 박스 간 IoU 행렬을 NumPy로 한 번에 계산
+- 겹치는 검출(IoU 임계값 이상, 또는 같은 텍스트끼리 일부라도 겹침)을 하나의 클러스터로 묶음
+- 클러스터마다 신뢰도 합이 가장 큰 텍스트를 선택하고, 그 텍스트 중 최고 신뢰도 결과를 유지
+"""
+
+from collections import defaultdict
+
+import numpy as np
+
+# 기본 클러스터링 IoU 임계값
+DEFAULT_IOU_THRESHOLD = 0.5
+# 기본 최소 신뢰도 (이하 결과는 버림)
+DEFAULT_MIN_CONFIDENCE = 0.1
+
+
+def rescale_results(results: list, scale_x: float, scale_y: float) -> list:
+    """
+    변형 이미지 좌표의 OCR 결과를 기준 이미지 좌표로 환산
+
+    Args:
+        results (list): (bbox, text, confidence) 튜플 목록 (변형 이미지 좌표)
+        scale_x (float): 변형 이미지 너비 / 기준 이미지 너비
+        scale_y (float): 변형 이미지 높이 / 기준 이미지 높이
+
+    Returns:
+        list: 기준 이미지 좌표의 (bbox, text, confidence) 튜플 목록
+    """
+    if scale_x == 1 and scale_y == 1:
+        return results
+    return [
+        ([[float(x) / scale_x, float(y) / scale_y] for x, y in bbox], text, confidence)
+        for bbox, text, confidence in results
+    ]
+
+
+def _bounding_boxes(results: list) -> np.ndarray:
+    """다각형 박스를 축 정렬 박스 배열 (N, 4) [x1, y1, x2, y2]로 변환"""
+    points = np.array([np.asarray(bbox, dtype=np.float32).reshape(-1, 2) for bbox, _, _ in results])
+    return np.concatenate([points.min(axis=1), points.max(axis=1)], axis=1)
+
+
+def iou_matrix(boxes: np.ndarray) -> tuple:
+    """
+    박스 간 IoU 행렬 계산 (벡터화)
+
+    Args:
+        boxes (np.ndarray): (N, 4) [x1, y1, x2, y2] 배열
+
+    Returns:
+        tuple: (IoU 행렬 (N, N), 교집합 넓이 행렬 (N, N))
+    """
+    x1, y1, x2, y2 = boxes.T
+    areas = np.maximum(x2 - x1, 0) * np.maximum(y2 - y1, 0)
+
+    inter_w = np.clip(np.minimum(x2[:, None], x2[None, :]) - np.maximum(x1[:, None], x1[None, :]), 0, None)
+    inter_h = np.clip(np.minimum(y2[:, None], y2[None, :]) - np.maximum(y1[:, None], y1[None, :]), 0, None)
+    inter = inter_w * inter_h
+    union = areas[:, None] + areas[None, :] - inter
+    iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+    return iou, inter
+
+
+def _connected_components(adjacency: np.ndarray) -> np.ndarray:
+    """
+    인접 행렬의 연결 요소 라벨 계산 (각 노드를 자신과 이웃 중 최소 라벨로 갱신하는 반복)
+
+    넓이가 0인 박스(점, 선)는 자기 자신과의 IoU도 0이라 인접 행렬의 행이 모두 False일 수 있으므로
+    자신의 라벨을 함께 비교하여 이웃이 없는 노드가 하나의 클러스터로 묶이지 않도록 합니다.
+    """
+    count = adjacency.shape[0]
+    labels = np.arange(count)
+    while True:
+        updated = np.minimum(labels, np.where(adjacency, labels[None, :], count).min(axis=1))
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def fuse_results(all_results: list,
+                 iou_threshold: float = DEFAULT_IOU_THRESHOLD,
+                 min_confidence: float = DEFAULT_MIN_CONFIDENCE) -> list:
+    """
+    여러 변형의 OCR 결과를 위치 기반으로 융합
+
+    Args:
+        all_results (list): 기준 이미지 좌표로 환산된 (bbox, text, confidence) 튜플 목록
+        iou_threshold (float): 같은 영역으로 볼 IoU 임계값
+        min_confidence (float): 최소 신뢰도 (이하 결과는 제외)
+
+    Returns:
+        list: 클러스터별 대표 결과 (신뢰도 내림차순)
+    """
+    candidates = [r for r in all_results if r[2] > min_confidence and r[1].strip()]
+    if not candidates:
+        return []
+
+    normalized = np.array([text.strip().lower() for _, text, _ in candidates], dtype=object)
+    iou, inter = iou_matrix(_bounding_boxes(candidates))
+
+    # 같은 영역(IoU 임계값 이상) 또는 같은 텍스트이면서 일부라도 겹치는 검출을 연결
+    same_text = normalized[:, None] == normalized[None, :]
+    adjacency = (iou >= iou_threshold) | (same_text & (inter > 0))
+    labels = _connected_components(adjacency)
+
+    clusters = defaultdict(list)
+    for index, label in enumerate(labels):
+        clusters[label].append(index)
+
+    fused = []
+    for members in clusters.values():
+        # 변형 간 합의: 신뢰도 합이 가장 큰 텍스트 선택
+        votes = defaultdict(float)
+        for index in members:
+            votes[normalized[index]] += candidates[index][2]
+        best_text = max(votes, key=votes.get)
+        best_index = max(
+            (index for index in members if normalized[index] == best_text),
+            key=lambda index: candidates[index][2],
+        )
+        fused.append(candidates[best_index])
+
+    fused.sort(key=lambda x: x[2], reverse=True)
+    return fused
@@ -0,0 +1,209 @@
+"""
+OCR 결과 파일 저장소 모듈
+
+결과 이미지를 각 노드의 로컬 디렉토리(app/static/results)에만 저장하면 이미지를 만든 노드만
+URL을 제공할 수 있어 로드밸런서 뒤에 여러 OCR 노드를 둘 때 sticky session이 필요합니다.
+결과 파일 저장과 URL 생성을 저장소 인터페이스로 분리하여 노드가 상태를 갖지 않도록 합니다.
+
+주요 기능:
+- LocalStorage: 로컬 디렉토리 저장 (기본값, 기존 동작), /static/results 정적 파일 URL, 최근 20개 유지
+- S3Storage: S3 호환 오브젝트 스토리지 저장 (AWS S3, MinIO, moto_server 등 S3_ENDPOINT_URL로 지정)
+  - presigned: 서명된 URL로 클라이언트가 스토리지에서 직접 다운로드 (S3_PRESIGN_EXPIRES초 유효)
+  - proxy: /api/ocr/result/{파일명}으로 어느 노드에서든 스토리지에서 읽어 전달
+  - public: 공개 버킷/CDN 주소(S3_PUBLIC_BASE_URL) + 파일명
+- 결과 파일명은 내용 해시이므로 같은 키의 내용은 바뀌지 않음 (immutable 캐시 헤더로 저장)
+
+boto3는 S3 백엔드를 사용할 때만 필요합니다 (pip install boto3).
+오래된 결과 정리는 로컬 백엔드만 수행하며, S3 백엔드는 버킷 수명 주기(lifecycle) 규칙으로 만료시킵니다.
+"""
+
+import mimetypes
+import os
+import uuid
+from typing import Optional
+
+from app.config.settings import settings
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:  # S3 백엔드를 사용하지 않으면 필요 없음
+    boto3 = None
+    ClientError = Exception
+
+# 로컬 백엔드에서 유지할 결과 이미지 수 (썸네일 제외)
+LOCAL_MAX_RESULTS = 20
+
+# 결과 파일 Content-Type (mimetypes에 webp가 없는 환경 대비)
+CONTENT_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png", ".webp": "image/webp"}
+
+# URL 생성 방식 (S3 백엔드)
+URL_MODES = ("presigned", "proxy", "public")
+
+
+def content_type(key: str) -> str:
+    """파일명 확장자로 Content-Type 결정"""
+    extension = os.path.splitext(key)[1].lower()
+    return CONTENT_TYPES.get(extension) or mimetypes.guess_type(key)[0] or "application/octet-stream"
+
+
+class LocalStorage:
+    """
+    로컬 디렉토리 결과 저장소 (단일 노드)
+
+    Attributes:
+        directory (str): 저장 경로
+        url_prefix (str): 정적 파일 URL 경로 (main.py의 /static 마운트)
+    """
+
+    backend = "local"
+
+    def __init__(self, directory: str = None, url_prefix: str = "/static/results"):
+        self.directory = directory or settings.RESULTS_DIR
+        self.url_prefix = url_prefix
+        os.makedirs(self.directory, exist_ok=True)
+
+    def put(self, key: str, data: bytes):
+        """결과 파일 저장 (같은 내용의 파일이 이미 있으면 수정 시간만 갱신)"""
+        path = os.path.join(self.directory, key)
+        if os.path.exists(path):
+            os.utime(path)
+            return
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """결과 파일 내용 (없으면 None)"""
+        path = self.local_path(key)
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def local_path(self, key: str) -> Optional[str]:
+        """결과 파일의 로컬 경로 (없으면 None)"""
+        path = os.path.join(self.directory, os.path.basename(key))
+        return path if os.path.exists(path) else None
+
+    def url(self, key: str) -> str:
+        """클라이언트에 돌려줄 결과 파일 URL"""
+        return f"{self.url_prefix}/{key}"
+
+    def prune(self, max_results: int = LOCAL_MAX_RESULTS):
+        """결과 이미지 파일 개수 제한 (초과 시 오래된 파일과 썸네일 삭제)"""
+        try:
+            files = [
+                os.path.join(self.directory, f) for f in os.listdir(self.directory)
+                if f.lower().endswith(('.jpg', '.jpeg', '.png', '.webp')) and '.thumb.' not in f
+            ]
+            if len(files) <= max_results:
+                return
+            files.sort(key=lambda x: os.path.getmtime(x))  # 저장(또는 재사용) 시간 기준 정렬
+            for old_file in files[:-max_results]:
+                stem, old_extension = os.path.splitext(old_file)
+                for path in (old_file, f"{stem}.thumb{old_extension}"):
+                    try:
+                        if os.path.exists(path):
+                            os.remove(path)
+                            print(f"🗑️ 오래된 결과 이미지 삭제: {path}")
+                    except Exception as e:
+                        print(f"⚠️ 이미지 삭제 실패: {path} - {e}")
+        except Exception as e:
+            print(f"⚠️ 결과 이미지 정리 중 오류: {e}")
+
+
+class S3Storage:
+    """
+    S3 호환 오브젝트 스토리지 결과 저장소 (여러 노드가 공유)
+
+    Attributes:
+        bucket (str): 버킷 이름
+        prefix (str): 객체 키 접두사
+        url_mode (str): presigned / proxy / public
+    """
+
+    backend = "s3"
+
+    def __init__(self, bucket: str = None, prefix: str = None, endpoint_url: str = None,
+                 url_mode: str = None, client=None):
+        if client is None and boto3 is None:
+            raise RuntimeError("S3 결과 저장소를 사용하려면 boto3가 필요합니다 (pip install boto3).")
+        self.bucket = bucket or settings.S3_BUCKET
+        if not self.bucket:
+            raise RuntimeError("S3 결과 저장소를 사용하려면 S3_BUCKET을 설정해야 합니다.")
+        self.prefix = settings.S3_PREFIX if prefix is None else prefix
+        self.url_mode = url_mode or settings.RESULT_STORAGE_URL_MODE
+        if self.url_mode not in URL_MODES:
+            raise RuntimeError(f"지원하지 않는 결과 URL 방식입니다: {self.url_mode} (지원: {', '.join(URL_MODES)})")
+        if self.url_mode == "public" and not settings.S3_PUBLIC_BASE_URL:
+            raise RuntimeError("public URL 방식을 사용하려면 S3_PUBLIC_BASE_URL을 설정해야 합니다.")
+        # 접근 키를 지정하지 않으면 boto3 기본 자격 증명 체인(환경변수, IAM 역할 등) 사용
+        self.client = client or boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or settings.S3_ENDPOINT_URL or None,
+            region_name=settings.S3_REGION or None,
+            aws_access_key_id=settings.S3_ACCESS_KEY_ID or None,
+            aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY or None,
+        )
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{os.path.basename(key)}"
+
+    def put(self, key: str, data: bytes):
+        """결과 파일 업로드 (키가 내용 해시이므로 같은 키를 다시 올려도 내용은 같음)"""
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Body=data,
+            ContentType=content_type(key),
+            CacheControl=f"public, max-age={settings.RESULT_CACHE_MAX_AGE}, immutable",
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """결과 파일 내용 (없으면 None, proxy 방식 다운로드용)"""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+        return response["Body"].read()
+
+    def local_path(self, key: str) -> Optional[str]:
+        """로컬 파일이 없으므로 항상 None (proxy 라우트가 get()으로 읽음)"""
+        return None
+
+    def url(self, key: str) -> str:
+        """클라이언트에 돌려줄 결과 파일 URL (url_mode에 따라 서명 URL / 프록시 경로 / 공개 URL)"""
+        if self.url_mode == "proxy":
+            return f"/api/ocr/result/{key}"
+        if self.url_mode == "public":
+            return f"{settings.S3_PUBLIC_BASE_URL.rstrip('/')}/{self._object_key(key)}"
+        # 서명은 로컬에서 계산하므로 스토리지 요청이 발생하지 않음
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self._object_key(key)},
+            ExpiresIn=settings.S3_PRESIGN_EXPIRES,
+        )
+
+    def prune(self, max_results: int = LOCAL_MAX_RESULTS):
+        """오래된 결과는 버킷 수명 주기 규칙으로 만료시키므로 아무것도 하지 않음"""
+
+
+def create_storage():
+    """RESULT_STORAGE_BACKEND 설정에 따라 결과 저장소 생성 (local / s3)"""
+    backend = settings.RESULT_STORAGE_BACKEND.lower()
+    if backend == "s3":
+        storage = S3Storage()
+        print(f"🪣 결과 저장소: S3 (버킷: {storage.bucket}, URL: {storage.url_mode})")
+        return storage
+    if backend != "local":
+        raise RuntimeError(f"지원하지 않는 결과 저장소입니다: {backend} (지원: local, s3)")
+    return LocalStorage()
+
+
+# 전역 결과 저장소 인스턴스
+# 다른 모듈에서 from app.services.storage import result_storage로 사용
+result_storage = create_storage()
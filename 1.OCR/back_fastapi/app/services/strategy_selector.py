@@ -0,0 +1,173 @@
+"""
+전처리 변형 선택기 모듈 (적응형 fallback 순서)
+
+원본 이미지 OCR이 실패했을 때의 fallback 단계는 모든 전처리 변형을 항상 같은 순서로 시도합니다.
+실제 책 표지 이미지에서는 한두 가지 변형이 거의 항상 정답을 내므로,
+운영 중 어떤 변형이 채택된 텍스트를 냈는지 기록하여 성공 가능성이 높은 변형부터 시도합니다.
+
+동작 방식:
+- 변형마다 (시도 횟수, 채택 횟수)를 기록하는 베르누이 멀티 암드 밴딧
+- 톰슨 샘플링: Beta(1 + 채택, 1 + 실패)에서 뽑은 값이 큰 순서로 시도
+  (성공률이 낮은 변형도 가끔 앞쪽에 배치되어 데이터가 계속 쌓임)
+- 상태는 JSON 파일(OCR_STRATEGY_STATE_PATH)에 원자적으로 저장되어 재시작 후에도 유지
+  - 작업마다 저장하지 않고 OCR_STRATEGY_SAVE_EVERY건 또는 OCR_STRATEGY_SAVE_INTERVAL초마다 저장 (종료 시에도 저장)
+  - 저장 시 파일 잠금을 잡고 파일의 횟수에 마지막 저장 이후 기록한 횟수만 더하므로
+    여러 워커가 같은 파일을 써도 서로의 기록을 덮어쓰지 않고, 다른 워커의 기록도 함께 반영됨
+"""
+
+import contextlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+
+from app.config.settings import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: 워커 간 파일 잠금 없이 저장
+    fcntl = None
+
+
+def _add_counts(target: dict, counts: dict):
+    """변형별 시도/채택 횟수를 target에 더함"""
+    for name, stat in counts.items():
+        total = target.setdefault(name, {"trials": 0, "wins": 0})
+        total["trials"] += stat["trials"]
+        total["wins"] += stat["wins"]
+
+
+class StrategySelector:
+    """
+    톰슨 샘플링 기반 전처리 변형 선택기
+
+    Attributes:
+        state_path (str): 상태 저장 JSON 파일 경로
+    """
+
+    def __init__(self, state_path: str = None):
+        self.state_path = state_path or settings.OCR_STRATEGY_STATE_PATH
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stats = self._load()
+        self._unsaved = {}  # 마지막 저장 이후 기록한 횟수
+        self._unsaved_records = 0
+        self._last_save = time.monotonic()
+
+    def _load(self) -> dict:
+        """저장된 상태 로드 (없거나 손상되면 빈 상태)"""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {
+                name: {"trials": int(stat["trials"]), "wins": int(stat["wins"])}
+                for name, stat in data.get("variants", {}).items()
+            }
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️ 전처리 선택기 상태 로드 실패, 초기화합니다: {e}")
+            return {}
+
+    def _save(self, stats: dict):
+        """상태를 임시 파일에 쓴 뒤 교체하여 원자적으로 저장"""
+        directory = os.path.dirname(self.state_path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".strategy-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"variants": stats}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        """워커 프로세스 간 저장 잠금 (읽기-합산-쓰기 사이에 다른 워커가 저장하지 않도록)"""
+        directory = os.path.dirname(self.state_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.state_path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def order(self, names: list) -> list:
+        """
+        기대 성공률(톰슨 샘플) 순으로 변형 이름 정렬
+
+        Args:
+            names (list): 시도할 수 있는 변형 이름 목록 (기본 순서)
+
+        Returns:
+            list: 시도 순서대로 정렬된 변형 이름 목록
+        """
+        with self._lock:
+            samples = {}
+            for name in names:
+                stat = self._stats.get(name, {"trials": 0, "wins": 0})
+                samples[name] = random.betavariate(1 + stat["wins"], 1 + stat["trials"] - stat["wins"])
+        return sorted(names, key=lambda name: samples[name], reverse=True)
+
+    def record(self, tried: list, winner: str = None):
+        """
+        fallback 결과 기록
+
+        Args:
+            tried (list): 시도한 변형 이름 목록
+            winner (str): 채택된 텍스트를 낸 변형 이름 (없으면 None)
+        """
+        counts = {name: {"trials": 1, "wins": int(name == winner)} for name in tried}
+        with self._lock:
+            _add_counts(self._stats, counts)
+            _add_counts(self._unsaved, counts)
+            self._unsaved_records += 1
+            due = (self._unsaved_records >= settings.OCR_STRATEGY_SAVE_EVERY
+                   or time.monotonic() - self._last_save >= settings.OCR_STRATEGY_SAVE_INTERVAL)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """
+        마지막 저장 이후 기록한 횟수를 상태 파일에 합산하여 저장
+
+        저장 후에는 파일의 합계(다른 워커의 기록 포함)를 이 워커의 상태로 사용합니다.
+        """
+        with self._save_lock:
+            with self._lock:
+                unsaved, self._unsaved = self._unsaved, {}
+                self._unsaved_records = 0
+                self._last_save = time.monotonic()
+            if not unsaved:
+                return
+            try:
+                with self._file_lock():
+                    stats = self._load()
+                    _add_counts(stats, unsaved)
+                    self._save(stats)
+            except Exception as e:
+                print(f"⚠️ 전처리 선택기 상태 저장 실패: {e}")
+                with self._lock:
+                    _add_counts(self._unsaved, unsaved)  # 다음 저장 때 다시 시도
+                return
+            with self._lock:
+                # 파일의 합계 + 저장하는 동안 새로 기록한 횟수
+                _add_counts(stats, self._unsaved)
+                self._stats = stats
+
+    def snapshot(self) -> dict:
+        """변형별 시도/채택 횟수 조회"""
+        with self._lock:
+            return {name: dict(stat) for name, stat in self._stats.items()}
+
+
+# 전역 전처리 선택기 인스턴스
+# 다른 모듈에서 from app.services.strategy_selector import strategy_selector로 사용
+strategy_selector = StrategySelector()
@@ -0,0 +1,286 @@
+"""
+도서 제목 퍼지 검색 인덱스 모듈 (한글 자모 n-gram)
+
+OCR 텍스트는 음절이 깨져서 나오는 경우가 많아("경험의 멸종" → "겅험의 멸중") 음절 단위 비교로는
+정답 제목을 찾기 어렵습니다. 한글 음절을 초성/중성/종성 자모로 분해한 뒤 n-gram으로 비교하면
+음절 일부가 틀려도 대부분의 n-gram이 일치하므로, 로컬 도서 목록에서 가장 가까운 제목을
+GPT 호출 없이 수 밀리초 안에 찾을 수 있습니다.
+
+주요 기능:
+- 도서 목록 로드: CSV(title / bookname / 서명 / 도서명 컬럼, 없으면 첫 컬럼) 또는 SQLite(TITLE_INDEX_SQLITE_QUERY)
+- 역색인은 numpy CSR 배열(n-gram별 시작 위치 + 제목 id 목록)로 압축 보관
+- 증분 추가: 새 제목은 대기 목록에 쌓았다가 일정 개수를 넘으면 CSR 배열에 병합
+  (검색은 CSR 배열과 대기 목록을 함께 보므로 병합 전에도 새 제목이 검색됨,
+  refresh()는 파일이 바뀌었을 때 다시 읽어 새 제목만 추가)
+- 점수: 자모 n-gram 집합의 Dice 계수 (0 ~ 1)
+- best_match(): OCR 텍스트의 연속 단어 구간마다 검색하여 가장 높은 점수의 제목 반환
+  (저자명, 출판사명 등 제목 이외의 텍스트가 섞여 있어도 제목 구간만 비교,
+  TITLE_INDEX_MIN_SPAN_CHARS글자보다 짧은 구간은 짧은 제목과 우연히 일치하기 쉬우므로 비교하지 않음)
+- span_coverage(): 일치한 구간이 기준 텍스트(표지에서 가장 큰 글씨 줄 등)에서 차지하는 비율
+"""
+
+import csv
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+
+import numpy as np
+
+from app.config.settings import settings
+
+# 한글 음절 분해 상수 (유니코드 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+# CSV에서 제목으로 사용할 컬럼 이름 (앞에서부터 우선)
+TITLE_COLUMNS = ("title", "bookname", "서명", "도서명")
+
+
+def decompose_jamo(text: str) -> str:
+    """
+    비교용 정규화 후 한글 음절을 자모로 분해
+
+    공백/기호를 제거하고 소문자로 바꾼 뒤, 한글 음절은 초성/중성/종성 자모(U+1100 영역)로 풀어 씁니다.
+    예: "각"(1글자) → 초성 ᄀ, 중성 ᅡ, 종성 ᆨ (3글자)
+    """
+    text = re.sub(r"[\W_]+", "", unicodedata.normalize("NFC", text)).lower()
+    jamo = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            jamo.append(chr(0x1100 + offset // (JUNGSEONG_COUNT * JONGSEONG_COUNT)))
+            jamo.append(chr(0x1161 + (offset // JONGSEONG_COUNT) % JUNGSEONG_COUNT))
+            if offset % JONGSEONG_COUNT:
+                jamo.append(chr(0x11A7 + offset % JONGSEONG_COUNT))
+        else:
+            jamo.append(char)
+    return "".join(jamo)
+
+
+def _compact_text(text: str) -> str:
+    """공백/기호를 제거한 소문자 텍스트 (구간 길이, 포함 여부 비교용)"""
+    return re.sub(r"[\W_]+", "", unicodedata.normalize("NFC", text)).lower()
+
+
+def span_coverage(span: str, reference: str) -> float:
+    """
+    일치한 OCR 구간이 기준 텍스트에서 차지하는 글자 비율 (0 ~ 1)
+
+    구간이 기준 텍스트 안에 없으면 0입니다 (공백/기호, 대소문자 무시).
+    """
+    span, reference = _compact_text(span), _compact_text(reference)
+    if not span or not reference or span not in reference:
+        return 0.0
+    return len(span) / len(reference)
+
+
+def jamo_ngrams(text: str, n: int) -> set:
+    """자모 분해 문자열의 n-gram 집합 (n보다 짧으면 문자열 전체를 하나의 n-gram으로)"""
+    jamo = decompose_jamo(text)
+    if len(jamo) <= n:
+        return {jamo} if jamo else set()
+    return {jamo[i:i + n] for i in range(len(jamo) - n + 1)}
+
+
+class TitleIndex:
+    """
+    자모 n-gram 역색인 기반 제목 퍼지 검색
+
+    Attributes:
+        n (int): n-gram 길이 (자모 기준)
+        compact_threshold (int): 대기 목록이 이 개수를 넘으면 CSR 배열로 병합
+    """
+
+    def __init__(self, n: int = None, compact_threshold: int = None):
+        self.n = n or settings.TITLE_INDEX_NGRAM
+        self.compact_threshold = compact_threshold or settings.TITLE_INDEX_COMPACT_THRESHOLD
+        self._lock = threading.Lock()
+        self._titles = []  # 제목 id -> 원본 제목
+        self._keys = {}  # 정규화 제목 -> 제목 id (중복 방지)
+        self._vocab = {}  # n-gram -> n-gram id
+        # 병합된 역색인 (CSR): n-gram id g의 제목 목록 = postings[indptr[g]:indptr[g + 1]]
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._postings = np.zeros(0, dtype=np.int32)
+        self._gram_counts = np.zeros(0, dtype=np.int32)  # 제목 id -> n-gram 수
+        # 아직 병합하지 않은 증분 추가분
+        self._pending = {}  # n-gram id -> [제목 id, ...]
+        self._pending_counts = []
+        self._source_mtime = None
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def add_titles(self, titles) -> int:
+        """
+        제목 추가 (이미 있는 제목은 무시)
+
+        Returns:
+            int: 새로 추가된 제목 수
+        """
+        added = 0
+        with self._lock:
+            for title in titles:
+                title = " ".join(str(title).split())
+                key = decompose_jamo(title)
+                if not key or key in self._keys:
+                    continue
+                title_id = len(self._titles)
+                self._titles.append(title)
+                self._keys[key] = title_id
+                grams = jamo_ngrams(title, self.n)
+                for gram in grams:
+                    gram_id = self._vocab.setdefault(gram, len(self._vocab))
+                    self._pending.setdefault(gram_id, []).append(title_id)
+                self._pending_counts.append(len(grams))
+                added += 1
+            if len(self._pending_counts) >= self.compact_threshold:
+                self._compact()
+        return added
+
+    def compact(self):
+        """대기 중인 증분 추가분을 CSR 배열에 병합"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        if not self._pending_counts:
+            return
+        # 기존 CSR을 (n-gram id, 제목 id) 쌍으로 풀고 대기분과 합쳐 n-gram id 순으로 다시 정렬
+        gram_ids = [np.repeat(np.arange(len(self._indptr) - 1, dtype=np.int64), np.diff(self._indptr))]
+        title_ids = [self._postings]
+        for gram_id, ids in self._pending.items():
+            gram_ids.append(np.full(len(ids), gram_id, dtype=np.int64))
+            title_ids.append(np.asarray(ids, dtype=np.int32))
+        gram_ids = np.concatenate(gram_ids)
+        title_ids = np.concatenate(title_ids)
+
+        order = np.argsort(gram_ids, kind="stable")
+        counts = np.bincount(gram_ids, minlength=len(self._vocab))
+        indptr = np.zeros(len(self._vocab) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        self._postings = title_ids[order]
+        self._indptr = indptr
+        self._gram_counts = np.concatenate(
+            [self._gram_counts, np.asarray(self._pending_counts, dtype=np.int32)]
+        )
+        self._pending = {}
+        self._pending_counts = []
+
+    def search(self, text: str, top_k: int = 5) -> list:
+        """
+        텍스트와 가장 가까운 제목 검색
+
+        Returns:
+            list: [(제목, Dice 점수), ...] 점수 내림차순
+        """
+        grams = jamo_ngrams(text, self.n)
+        if not grams or not self._titles:
+            return []
+
+        with self._lock:
+            # 병합은 대기 목록이 compact_threshold를 넘을 때만 하고, 병합 전 추가분은 대기 목록에서 함께 검색
+            indptr, postings, gram_counts = self._indptr, self._postings, self._gram_counts
+            gram_ids = [self._vocab[gram] for gram in grams if gram in self._vocab]
+            pending_hits = [title_id for g in gram_ids for title_id in self._pending.get(g, ())]
+            if self._pending_counts:
+                gram_counts = np.concatenate([gram_counts, np.asarray(self._pending_counts, dtype=np.int32)])
+
+        if not gram_ids:
+            return []
+        compacted_grams = len(indptr) - 1  # 마지막 병합 이후 처음 나온 n-gram은 CSR 배열에 없음
+        hits = np.concatenate(
+            [postings[indptr[g]:indptr[g + 1]] for g in gram_ids if g < compacted_grams]
+            + [np.asarray(pending_hits, dtype=np.int32)]
+        )
+        if len(hits) == 0:
+            return []
+
+        # 공유 n-gram 수 -> Dice = 2 * 공유 / (질의 n-gram 수 + 제목 n-gram 수)
+        candidates, shared = np.unique(hits, return_counts=True)
+        scores = 2.0 * shared / (len(grams) + gram_counts[candidates])
+        top = np.argsort(-scores, kind="stable")[:top_k]
+        return [(self._titles[candidates[i]], round(float(scores[i]), 4)) for i in top]
+
+    def best_match(self, ocr_text: str, max_span_words: int = None):
+        """
+        OCR 텍스트 안의 제목 구간과 가장 가까운 제목 검색
+
+        연속된 단어 구간(최대 max_span_words 단어)마다 검색하여 가장 높은 점수를 반환합니다.
+        TITLE_INDEX_MIN_SPAN_CHARS글자(공백/기호 제외)보다 짧은 구간은 저자명, "사랑" 같은 단어가
+        짧은 제목과 그대로 일치하여 1.0점이 되기 쉬우므로 제외합니다.
+
+        Returns:
+            tuple | None: (제목, Dice 점수, 일치한 OCR 구간) 또는 None
+        """
+        max_span_words = max_span_words or settings.TITLE_INDEX_MAX_SPAN_WORDS
+        words = ocr_text.split()
+        spans = {
+            " ".join(words[start:start + length])
+            for start in range(len(words))
+            for length in range(1, max_span_words + 1)
+            if start + length <= len(words)
+        }
+        spans = {span for span in spans if len(_compact_text(span)) >= settings.TITLE_INDEX_MIN_SPAN_CHARS}
+
+        best = None
+        for span in spans:
+            results = self.search(span, top_k=1)
+            if results and (best is None or results[0][1] > best[1]):
+                best = (results[0][0], results[0][1], span)
+        return best
+
+    def refresh(self, path: str = None) -> int:
+        """
+        도서 목록 파일을 (다시) 읽어 새 제목만 추가
+
+        파일 수정 시각이 마지막으로 읽은 시각과 같으면 건너뜁니다.
+
+        Returns:
+            int: 새로 추가된 제목 수
+        """
+        path = path or settings.TITLE_INDEX_PATH
+        if not path or not os.path.exists(path):
+            return 0
+        mtime = os.path.getmtime(path)
+        if mtime == self._source_mtime:
+            return 0
+
+        added = self.add_titles(self._read_catalog(path))
+        self.compact()
+        self._source_mtime = mtime
+        print(f"📚 제목 인덱스 갱신: +{added}개 (전체 {len(self)}개)")
+        return added
+
+    def _read_catalog(self, path: str):
+        """CSV 또는 SQLite 도서 목록에서 제목 읽기"""
+        if os.path.splitext(path)[1].lower() in (".db", ".sqlite", ".sqlite3"):
+            with sqlite3.connect(path) as conn:
+                for (title,) in conn.execute(settings.TITLE_INDEX_SQLITE_QUERY):
+                    if title:
+                        yield title
+            return
+
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            column = next((header.index(name) for name in TITLE_COLUMNS if name in header), None)
+            if column is None:
+                # 알려진 제목 컬럼이 없으면 헤더 없는 파일로 보고 첫 컬럼 사용
+                column = 0
+                yield header[0]
+            for row in reader:
+                if len(row) > column and row[column]:
+                    yield row[column]
+
+
+# 전역 제목 인덱스 인스턴스
+# 다른 모듈에서 from app.services.title_index import title_index로 사용
+title_index = TitleIndex()
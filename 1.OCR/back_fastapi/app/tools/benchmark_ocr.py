@@ -0,0 +1,210 @@
+"""
+OCR 전처리/후처리 마이크로 벤치마크 도구
+
+OCRService의 전처리 변형과 결과 후처리 함수를 결정적으로 생성한 합성 입력으로 반복 측정하고,
+저장된 기준값(baseline)과 비교하여 허용 범위를 넘게 느려진 항목이 있으면 실패(종료 코드 1)합니다.
+EasyOCR 모델은 로딩하지 않으므로(OCRService.__init__ 생략) 몇 초 안에 끝납니다.
+
+측정 대상:
+- 이미지 (small 640x480 / medium 1280x960 / large 2560x1920 합성 표지):
+  _preprocess_image, _preprocess_original, _enhance_small_text, _preprocess_multiscale,
+  _resize_image, _create_result_image
+- 결과 목록 (20 / 100 / 500개 합성 검출, 변형 간 중복 포함): _filter_and_merge_results
+
+기준값은 실행한 머신에 따라 달라지므로 같은 머신에서 저장/비교해야 합니다.
+
+사용법:
+    # 기준값 저장
+    python -m app.tools.benchmark_ocr --save-baseline
+
+    # 기준값과 비교 (20% 넘게 느려지면 종료 코드 1)
+    python -m app.tools.benchmark_ocr
+    python -m app.tools.benchmark_ocr --tolerance 0.3 --repeat 10 --only preprocess
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from app.services.ocr_service import OCRService
+
+# 기준값 기본 경로 (back_fastapi 기준)
+DEFAULT_BASELINE_PATH = os.path.join("benchmarks", "ocr_baseline.json")
+
+# 합성 이미지 크기 (너비, 높이)
+IMAGE_SIZES = {
+    "small": (640, 480),
+    "medium": (1280, 960),
+    "large": (2560, 1920),
+}
+
+# 합성 결과 목록 크기 (검출 수)
+RESULT_SIZES = {
+    "small": 20,
+    "medium": 100,
+    "large": 500,
+}
+
+SEED = 20240601
+
+
+def make_image(width: int, height: int, seed: int = SEED) -> np.ndarray:
+    """
+    책 표지와 비슷한 합성 이미지 생성 (같은 인자면 항상 같은 이미지)
+
+    배경 그라데이션 + 크기가 다른 텍스트 줄 + 가우시안 노이즈로 구성합니다.
+    """
+    rng = np.random.default_rng(seed + width * height)
+    gradient = np.linspace(180, 240, height, dtype=np.float32)[:, None]
+    image = np.repeat(np.repeat(gradient, width, axis=1)[:, :, None], 3, axis=2).astype(np.uint8)
+
+    for _ in range(max(4, height // 80)):
+        scale = rng.uniform(0.5, 2.5) * width / 1280
+        thickness = max(1, int(scale * 2))
+        origin = (int(rng.integers(0, width // 2)), int(rng.integers(30, height)))
+        text = "".join(rng.choice(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "), size=int(rng.integers(5, 20))))
+        color = tuple(int(c) for c in rng.integers(0, 80, size=3))
+        cv2.putText(image, text, origin, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness, cv2.LINE_AA)
+
+    noise = rng.normal(0, 6, image.shape)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+
+def make_results(count: int, width: int = 1024, height: int = 768, seed: int = SEED) -> list:
+    """
+    합성 OCR 결과 목록 생성 (bbox, text, confidence)
+
+    검출의 약 1/3은 다른 전처리 변형이 같은 위치에서 찾은 것처럼 약간 이동한 중복으로 만듭니다.
+    """
+    rng = np.random.default_rng(seed + count)
+    results = []
+    unique = max(1, count * 2 // 3)
+    for i in range(count):
+        if i < unique:
+            x, y = float(rng.uniform(0, width - 200)), float(rng.uniform(0, height - 40))
+            w, h = float(rng.uniform(40, 200)), float(rng.uniform(15, 40))
+            text = f"text{i}"
+        else:
+            source_box, text, _ = results[int(rng.integers(0, unique))]
+            (x, y), _, (x2, y2), _ = source_box
+            w, h = x2 - x, y2 - y
+            x, y = x + float(rng.uniform(-3, 3)), y + float(rng.uniform(-3, 3))
+        bbox = [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]
+        results.append((bbox, text, float(rng.uniform(0.05, 0.99))))
+    return results
+
+
+def _time(func, repeat: int) -> float:
+    """한 번 예열 후 repeat회 실행한 지연시간 중앙값 (ms), 함수 로그 출력은 버림"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+        timings = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(timings)
+
+
+def build_cases(service: OCRService) -> dict:
+    """벤치마크 항목 이름 -> 인자 없는 함수"""
+    cases = {}
+    for size_name, (width, height) in IMAGE_SIZES.items():
+        image = make_image(width, height)
+        results = make_results(RESULT_SIZES[size_name], width, height)
+        cases[f"preprocess_image@{size_name}"] = lambda image=image: service._preprocess_image(image)
+        cases[f"preprocess_original@{size_name}"] = lambda image=image: service._preprocess_original(image)
+        cases[f"enhance_small_text@{size_name}"] = lambda image=image: service._enhance_small_text(image)
+        cases[f"preprocess_multiscale@{size_name}"] = lambda image=image: service._preprocess_multiscale(image)
+        cases[f"resize_image@{size_name}"] = lambda image=image: service._resize_image(image)
+        cases[f"create_result_image@{size_name}"] = (
+            lambda image=image, results=results: service._create_result_image(image, results)
+        )
+    for size_name, count in RESULT_SIZES.items():
+        results = make_results(count)
+        cases[f"filter_and_merge_results@{size_name}"] = lambda results=results: service._filter_and_merge_results(results)
+    return cases
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """
+    기준값 대비 느려진 항목 목록
+
+    (현재 - 기준) 값이 기준 * tolerance와 min_delta_ms를 모두 넘어야 회귀로 봅니다.
+    (아주 짧은 항목의 측정 잡음으로 실패하지 않도록)
+    """
+    regressions = []
+    for name, current_ms in current.items():
+        baseline_ms = baseline.get(name)
+        if baseline_ms is None:
+            continue
+        delta = current_ms - baseline_ms
+        if delta > baseline_ms * tolerance and delta > min_delta_ms:
+            regressions.append((name, baseline_ms, current_ms))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 전처리/후처리 마이크로 벤치마크")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="기준값 JSON 파일 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 측정값을 기준값으로 저장")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 실행 횟수 (중앙값 사용)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 지연 증가 비율 (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="회귀로 보는 최소 지연 증가 (ms)")
+    parser.add_argument("--only", default="", help="이름에 이 문자열이 포함된 항목만 실행")
+    args = parser.parse_args()
+
+    # EasyOCR 리더 없이 전처리/후처리 메서드만 사용 (__init__의 모델 로딩 생략)
+    service = OCRService.__new__(OCRService)
+    cv2.setNumThreads(1)  # 스레드 수에 따른 측정 편차 제거
+
+    current = {}
+    for name, func in build_cases(service).items():
+        if args.only and args.only not in name:
+            continue
+        current[name] = round(_time(func, args.repeat), 3)
+        print(f"⏱️ {name:<40} {current[name]:>10.3f} ms")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f).get("results", {})
+        baseline.update(current)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "machine": {"platform": platform.platform(), "python": platform.python_version(),
+                            "opencv": cv2.__version__, "cpu_count": os.cpu_count()},
+                "repeat": args.repeat,
+                "results": baseline,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준값 저장: {args.baseline} ({len(current)}개 항목)")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"⚠️ 기준값 파일이 없습니다: {args.baseline} (--save-baseline으로 먼저 저장하세요)")
+        return
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f).get("results", {})
+    regressions = compare(current, baseline, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"❌ 성능 회귀 {len(regressions)}개 (허용: +{args.tolerance:.0%}, +{args.min_delta_ms}ms):")
+        for name, baseline_ms, current_ms in regressions:
+            print(f"  {name}: {baseline_ms:.3f} ms → {current_ms:.3f} ms ({current_ms / baseline_ms - 1:+.0%})")
+        sys.exit(1)
+    print(f"✅ 기준값 대비 회귀 없음 ({len(current)}개 항목)")
+
+
+if __name__ == "__main__":
+    main()
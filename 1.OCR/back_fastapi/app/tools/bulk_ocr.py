@@ -0,0 +1,255 @@
+"""
+오프라인 대량 OCR 도구 (카탈로그 백필용)
+
+이미지 디렉토리 또는 glob 패턴의 모든 이미지를 OCR하여 결과를 JSONL로 기록합니다.
+HTTP API를 거치지 않고 여러 프로세스의 EasyOCR 리더로 병렬 처리합니다.
+
+동작 방식:
+- 프리페치 스레드가 이미지 파일을 미리 읽고 디코딩/축소하여 큐에 적재
+- 프로세스 풀의 각 워커가 자신의 OCRService(EasyOCR 리더)로 서비스와 같은 OCR 경로 수행
+- 결과는 완료되는 대로 JSONL에 한 줄씩 기록 (출력 파일이 곧 체크포인트)
+- 중단 후 다시 실행하면 출력 파일에 이미 기록된 이미지는 건너뛰고 이어서 처리
+- 처리량(images/s)을 주기적으로 출력
+- --gpt-pass: OCR 결과에서 책 제목을 추출하는 GPT 단계를 두 번째 패스로 묶어서 실행
+  (동시 요청 --gpt-batch-size개 단위, 제목 결과도 별도 JSONL에 이어쓰기)
+
+사용법:
+    python -m app.tools.bulk_ocr catalog_images/ --output catalog.jsonl
+    python -m app.tools.bulk_ocr "scans/**/*.jpg" --output catalog.jsonl --workers 4
+    python -m app.tools.bulk_ocr catalog_images/ --output catalog.jsonl --gpt-pass
+    python -m app.tools.bulk_ocr --gpt-only --output catalog.jsonl
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import cv2
+
+from app.config.settings import settings
+
+# 프로세스 풀 워커의 OCR 서비스 (워커 초기화 시 생성)
+_worker_service = None
+
+# 진행 상황 출력 간격 (이미지 수)
+PROGRESS_INTERVAL = 20
+
+
+def _collect_images(target: str) -> list:
+    """디렉토리(하위 폴더 포함) 또는 glob 패턴에서 이미지 경로 수집"""
+    if os.path.isdir(target):
+        paths = glob.glob(os.path.join(target, "**", "*"), recursive=True)
+    else:
+        paths = glob.glob(target, recursive=True)
+    return sorted(p for p in paths if os.path.splitext(p)[1].lower() in settings.ALLOWED_EXTENSIONS)
+
+
+def _load_done(path: str, key: str = "path") -> set:
+    """JSONL 출력 파일에서 이미 처리한 항목 수집 (중단으로 잘린 마지막 줄은 제거)"""
+    if not os.path.exists(path):
+        return set()
+
+    done = set()
+    valid_size = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)[key])
+                valid_size += len(line)
+            except (ValueError, KeyError):
+                break
+    # 마지막 줄이 중간에 잘렸으면 잘라내고 이어쓰기
+    if valid_size < os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(valid_size)
+    return done
+
+
+def _prefetch(paths: list, output: queue.Queue, two_pass: bool):
+    """이미지를 읽어 디코딩/축소한 뒤 큐에 적재 (프리페치 스레드)"""
+    from app.services.image_service import ImageService
+
+    for path in paths:
+        image = cv2.imread(path)
+        if image is None:
+            output.put((path, None, None))
+            continue
+        cv_image = ImageService.resize_image(image, (1024, 1024))
+        full_image = None
+        if two_pass:
+            max_size = settings.OCR_TWO_PASS_MAX_SIZE
+            full_image = ImageService.resize_image(image, (max_size, max_size))
+        output.put((path, cv_image, full_image))
+    output.put(None)
+
+
+def _init_worker(threads: int):
+    """프로세스 풀 워커 초기화: 스레드 수 제한 후 EasyOCR 리더 로딩"""
+    global _worker_service
+    import torch
+    from app.services.ocr_service import OCRService
+
+    torch.set_num_threads(threads)
+    cv2.setNumThreads(threads)
+    _worker_service = OCRService()
+
+
+def _ocr_worker(path: str, cv_image, full_image) -> dict:
+    """이미지 하나 OCR (프로세스 풀 워커에서 실행)"""
+    start_time = time.perf_counter()
+    try:
+        results = _worker_service._run_ocr_cascade(cv_image, full_image)
+        return {
+            "path": path,
+            "extracted_text": " ".join(text for _, text, _ in results),
+            "texts": [text for _, text, _ in results],
+            "confidence_scores": [round(float(conf), 4) for _, _, conf in results],
+            "bounding_boxes": [[[round(float(x), 1), round(float(y), 1)] for x, y in bbox] for bbox, _, _ in results],
+            "processing_time_ms": round((time.perf_counter() - start_time) * 1000, 1),
+        }
+    except Exception as e:
+        return {"path": path, "error": str(e)}
+
+
+def run_ocr_pass(paths: list, output_path: str, workers: int, prefetch: int):
+    """OCR 패스: 프로세스 풀로 이미지를 처리하며 JSONL에 이어쓰기"""
+    done = _load_done(output_path)
+    pending_paths = [p for p in paths if p not in done]
+    print(f"📂 전체 {len(paths)}개 / 완료 {len(paths) - len(pending_paths)}개 / 남은 이미지 {len(pending_paths)}개")
+    if not pending_paths:
+        return
+
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    print(f"🔧 OCR 프로세스 {workers}개 시작 (프로세스당 스레드 {threads}개)")
+
+    prefetched = queue.Queue(maxsize=prefetch)
+    threading.Thread(
+        target=_prefetch, args=(pending_paths, prefetched, settings.OCR_TWO_PASS), daemon=True
+    ).start()
+
+    # 디코딩 스레드가 도는 상태에서 fork하지 않도록 spawn 사용 (Windows와 동일한 방식)
+    context = multiprocessing.get_context("spawn")
+    processed = 0
+    failed = 0
+    start_time = time.perf_counter()
+
+    with open(output_path, "a", encoding="utf-8") as output, ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(threads,)
+    ) as pool:
+        in_flight = set()
+        exhausted = False
+
+        while not exhausted or in_flight:
+            # 프로세스 수의 2배까지 작업을 제출해 워커가 쉬지 않도록 유지
+            while not exhausted and len(in_flight) < workers * 2:
+                item = prefetched.get()
+                if item is None:
+                    exhausted = True
+                    break
+                path, cv_image, full_image = item
+                if cv_image is None:
+                    output.write(json.dumps({"path": path, "error": "이미지를 읽을 수 없습니다."}, ensure_ascii=False) + "\n")
+                    failed += 1
+                    continue
+                in_flight.add(pool.submit(_ocr_worker, path, cv_image, full_image))
+
+            if not in_flight:
+                continue
+
+            completed, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in completed:
+                record = future.result()
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                processed += 1
+                failed += "error" in record
+            output.flush()
+
+            if processed and processed % PROGRESS_INTERVAL < len(completed):
+                elapsed = time.perf_counter() - start_time
+                print(f"📊 {processed}/{len(pending_paths)}개 처리, {processed / elapsed:.2f} images/s")
+
+    elapsed = time.perf_counter() - start_time
+    print("\n========== OCR 패스 결과 ==========")
+    print(f"처리: {processed}개 (실패 {failed}개), 소요 {elapsed:.1f}초")
+    print(f"처리량: {processed / max(elapsed, 1e-6):.2f} images/s")
+    print(f"💾 결과 저장: {output_path}")
+
+
+async def _extract_titles(gpt_service, records: list) -> list:
+    """OCR 결과 묶음의 책 제목을 동시에 추출"""
+    async def extract(record: dict) -> dict:
+        if not record.get("extracted_text"):
+            return {"path": record["path"], "title": "", "tokens_used": 0}
+        try:
+            result = await gpt_service.extract_book_title(record["extracted_text"])
+            return {"path": record["path"], "title": result.gpt_response, "tokens_used": result.tokens_used}
+        except Exception as e:
+            return {"path": record["path"], "error": str(getattr(e, "detail", e))}
+
+    return await asyncio.gather(*(extract(record) for record in records))
+
+
+def run_gpt_pass(ocr_output_path: str, titles_path: str, batch_size: int):
+    """GPT 패스: OCR JSONL을 읽어 책 제목을 batch_size개씩 동시에 추출하여 JSONL에 이어쓰기"""
+    from app.services.gpt_service import GPTService
+
+    done = _load_done(titles_path)
+    with open(ocr_output_path, "r", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    records = [r for r in records if "error" not in r and r["path"] not in done]
+    print(f"🤖 GPT 제목 추출 대상 {len(records)}개 (완료 {len(done)}개)")
+    if not records:
+        return
+
+    gpt_service = GPTService()
+    start_time = time.perf_counter()
+    tokens = 0
+    with open(titles_path, "a", encoding="utf-8") as output:
+        for offset in range(0, len(records), batch_size):
+            batch = records[offset:offset + batch_size]
+            for title in asyncio.run(_extract_titles(gpt_service, batch)):
+                output.write(json.dumps(title, ensure_ascii=False) + "\n")
+                tokens += title.get("tokens_used", 0)
+            output.flush()
+            print(f"📊 제목 {min(offset + batch_size, len(records))}/{len(records)}개 처리")
+
+    elapsed = time.perf_counter() - start_time
+    print(f"\n🤖 GPT 패스 완료: {len(records)}개, {elapsed:.1f}초, 토큰 {tokens}개")
+    print(f"💾 제목 저장: {titles_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이미지 디렉토리 대량 OCR (JSONL 출력, 중단 후 이어서 실행 가능)")
+    parser.add_argument("images", nargs="?", help="이미지 디렉토리 또는 glob 패턴")
+    parser.add_argument("--output", required=True, help="OCR 결과 JSONL 파일 경로 (체크포인트 겸용)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="OCR 프로세스 수")
+    parser.add_argument("--prefetch", type=int, default=16, help="미리 디코딩해 둘 이미지 수")
+    parser.add_argument("--gpt-pass", action="store_true", help="OCR 후 GPT 책 제목 추출 패스 실행")
+    parser.add_argument("--gpt-only", action="store_true", help="OCR 없이 기존 결과로 GPT 패스만 실행")
+    parser.add_argument("--gpt-batch-size", type=int, default=8, help="GPT 동시 요청 수")
+    parser.add_argument("--titles", help="제목 결과 JSONL 경로 (기본: <output>.titles.jsonl)")
+    args = parser.parse_args()
+
+    if not args.gpt_only:
+        if not args.images:
+            parser.error("이미지 디렉토리 또는 glob 패턴이 필요합니다.")
+        image_paths = _collect_images(args.images)
+        if not image_paths:
+            print(f"❌ 처리할 이미지가 없습니다: {args.images}")
+            return
+        run_ocr_pass(image_paths, args.output, max(1, args.workers), max(1, args.prefetch))
+
+    if args.gpt_pass or args.gpt_only:
+        titles_path = args.titles or f"{os.path.splitext(args.output)[0]}.titles.jsonl"
+        run_gpt_pass(args.output, titles_path, max(1, args.gpt_batch_size))
+
+
+if __name__ == "__main__":
+    main()
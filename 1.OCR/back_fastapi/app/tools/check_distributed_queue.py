@@ -0,0 +1,151 @@
+"""
+Redis Streams 분산 OCR 큐 동작 검사 도구
+
+API 노드 역할과 워커 노드 역할의 DistributedOCRQueue를 같은 Redis에 연결하고, OCR 대신 고정 결과를 돌려주는
+처리 함수로 작업을 주고받아 app.services.distributed_queue를 확인합니다.
+--redis-url을 주지 않으면 fakeredis(메모리 안의 Redis 대체 구현)를 사용하므로 Redis 서버 없이 실행할 수 있습니다
+(pip install fakeredis). 검사마다 새 스트림 이름을 쓰고 끝나면 삭제합니다. 실패한 항목이 있으면 종료 코드 1로 끝납니다.
+
+검사 항목:
+- 제출한 작업을 워커가 처리하여 결과가 그대로 돌아오고, 작업 이미지 키는 삭제됨
+- ACK하지 않고 죽은 워커의 작업을 OCR_QUEUE_CLAIM_IDLE_MS 이후 다른 워커가 가져와 처리 (XAUTOCLAIM)
+- OCR_QUEUE_MAX_DELIVERIES번 넘게 전달된 작업은 실패로 응답하고 dead-letter 스트림으로 이동
+
+사용법:
+    python -m app.tools.check_distributed_queue
+    python -m app.tools.check_distributed_queue --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+
+from app.config.settings import settings
+from app.core.exceptions import OCRException
+from app.services.distributed_queue import DistributedOCRQueue, aioredis
+
+# 작업 처리 함수가 돌려주는 고정 결과
+RESULTS = [([[0.0, 0.0], [120.0, 0.0], [120.0, 30.0], [0.0, 30.0]], "경험의 멸종", 0.93)]
+FILENAME = "check.jpg"
+
+
+def _connect(redis_url: str):
+    """검사용 Redis 연결 생성 함수 (호출할 때마다 같은 Redis에 새로 연결)"""
+    if redis_url:
+        if aioredis is None:
+            raise SystemExit("❌ redis 패키지가 필요합니다 (pip install redis).")
+        return lambda: aioredis.from_url(redis_url)
+    try:
+        import fakeredis
+    except ImportError:
+        raise SystemExit("❌ fakeredis가 설치되어 있지 않습니다 (pip install fakeredis) --redis-url로 Redis를 지정하세요.")
+    server = fakeredis.FakeServer()
+    return lambda: fakeredis.aioredis.FakeRedis(server=server)
+
+
+async def _run_case(connect, name: str, case):
+    """새 스트림 이름으로 API 노드/워커 큐를 만들어 검사 하나 실행 후 정리"""
+    settings.OCR_QUEUE_STREAM = f"ocr:check:{name}:{uuid.uuid4().hex[:8]}"
+    api_node, worker = DistributedOCRQueue(connect()), DistributedOCRQueue(connect())
+    stop_event = asyncio.Event()
+    try:
+        await case(api_node, worker, stop_event)
+    finally:
+        stop_event.set()
+        await worker.client.delete(worker.stream, worker.dead_letter_stream, api_node.reply_stream)
+        await api_node.aclose()
+        await worker.aclose()
+
+
+async def run_checks(connect) -> list:
+    """검사 실행 후 실패한 항목 이름 목록 반환"""
+    failures = []
+    handled = []
+
+    def expect(name: str, condition: bool, detail=""):
+        print(f"{'✅' if condition else '❌'} {name}{f' ({detail})' if detail and not condition else ''}")
+        if not condition:
+            failures.append(name)
+
+    async def handler(contents: bytes):
+        handled.append(contents)
+        return RESULTS, FILENAME
+
+    async def consume(worker: DistributedOCRQueue, consumer: str, stop_event: asyncio.Event):
+        task = asyncio.ensure_future(worker.consume(handler, consumer, stop_event))
+        task.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return task
+
+    async def abandon(worker: DistributedOCRQueue):
+        """워커가 작업을 가져간 뒤 ACK하지 않고 죽은 상황"""
+        await worker.ensure_group()
+        for _ in range(50):
+            response = await worker.client.xreadgroup(worker.group, "crashed", {worker.stream: ">"}, count=1)
+            if response and response[0][1]:
+                return
+            await asyncio.sleep(0.05)
+
+    # 왕복: 제출 → 처리 → 결과 수신
+    async def round_trip(api_node, worker, stop_event):
+        task = await consume(worker, "worker-a", stop_event)
+        results, filename = await api_node.submit(b"image-1")
+        expect("작업 결과 왕복", filename == FILENAME and [text for _, text, _ in results] == ["경험의 멸종"]
+               and results[0][0] == RESULTS[0][0], (results, filename))
+        expect("처리 함수가 이미지 내용 수신", handled[-1:] == [b"image-1"], handled)
+        expect("작업 이미지 키 삭제", not await worker.client.keys("ocr:payload:*"))
+        stop_event.set()
+        await asyncio.wait_for(task, settings.OCR_QUEUE_BLOCK_MS / 1000 + 5)
+
+    # 재전달: 죽은 워커의 작업을 다른 워커가 처리
+    async def redelivery(api_node, worker, stop_event):
+        settings.OCR_QUEUE_MAX_DELIVERIES = 3
+        submitted = asyncio.ensure_future(api_node.submit(b"image-2"))
+        await abandon(worker)
+        await consume(worker, "worker-b", stop_event)
+        results, filename = await submitted
+        expect("ACK되지 않은 작업을 다른 워커가 재처리", filename == FILENAME and handled[-1:] == [b"image-2"], handled)
+        pending = await worker.client.xpending(worker.stream, worker.group)
+        expect("재처리 후 대기 작업 없음", pending["pending"] == 0, pending)
+
+    # dead-letter: 전달 횟수 초과
+    async def dead_letter(api_node, worker, stop_event):
+        settings.OCR_QUEUE_MAX_DELIVERIES = 1
+        handled.clear()
+        submitted = asyncio.ensure_future(api_node.submit(b"image-3"))
+        await abandon(worker)
+        await consume(worker, "worker-c", stop_event)
+        try:
+            await submitted
+            error = None
+        except OCRException as e:
+            error = str(e.detail)
+        expect("전달 횟수 초과 작업은 실패 응답", error is not None and "전달" in error, error)
+        expect("dead-letter 스트림으로 이동", await worker.client.xlen(worker.dead_letter_stream) == 1)
+        expect("dead-letter 작업은 처리하지 않음", not handled, handled)
+
+    for name, case in (("round-trip", round_trip), ("redelivery", redelivery), ("dead-letter", dead_letter)):
+        await _run_case(connect, name, case)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis Streams 분산 OCR 큐 동작 검사")
+    parser.add_argument("--redis-url", default="", help="Redis 주소 (비어 있으면 fakeredis 사용)")
+    args = parser.parse_args()
+
+    connect = _connect(args.redis_url)
+    # 재전달을 몇 초 안에 확인하도록 대기 시간 단축
+    settings.OCR_QUEUE_BLOCK_MS = 100
+    settings.OCR_QUEUE_CLAIM_IDLE_MS = 300
+    settings.OCR_QUEUE_RESULT_TIMEOUT = 10
+    failures = asyncio.run(run_checks(connect))
+
+    if failures:
+        print(f"❌ 분산 OCR 큐 검사 실패: {len(failures)}개")
+        sys.exit(1)
+    print("✅ 분산 OCR 큐 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+도서관 정보나루 API 프록시 동작 검사 도구
+
+로컬에 정보나루 대체 서버(http.server)를 띄우고 LIBRARY_API_BASE_URL을 그 주소로 바꾼 뒤,
+/api/library/{endpoint} 라우트를 ASGI로 직접 호출하여 캐시 동작을 확인합니다.
+실제 data4library.kr이나 인증키 없이 몇 초 안에 끝나며, 실패한 항목이 있으면 종료 코드 1로 끝납니다.
+
+검사 항목:
+- 같은 이름의 반복 쿼리 파라미터가 모두 원본에 전달되고, authKey는 서버 설정값으로 교체
+- 같은 요청을 다시 보내면 원본 호출 없이 캐시 응답 (X-Cache: HIT)
+- TTL이 지나면 오래된 응답을 바로 돌려주고 백그라운드에서 한 번만 갱신 (X-Cache: STALE)
+- 같은 요청이 동시에 여러 개 와도 원본은 한 번만 호출 (single-flight)
+- HTTP 200이어도 본문이 오류 응답이면 502로 응답하고 캐시하지 않음
+
+사용법:
+    python -m app.tools.check_library_proxy
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.routes import library
+from app.config.settings import settings
+from app.core.http_client import http_fetcher
+from app.services.library_service import library_service
+
+# 대체 서버 응답 지연 (single-flight 검사에서 동시 요청이 겹치도록)
+UPSTREAM_DELAY = 0.3
+SERVER_KEY = "server-key"
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """정보나루 대체 서버: 받은 쿼리를 기록하고 srchBooks JSON 형식으로 응답"""
+
+    calls = Counter()  # title -> 호출 수
+    queries = []  # 받은 쿼리 (이름, 값) 목록
+
+    def do_GET(self):
+        query = parse_qsl(urlparse(self.path).query)
+        title = dict(query).get("title", "")
+        type(self).calls[title] += 1
+        type(self).queries.append(query)
+        time.sleep(UPSTREAM_DELAY)
+
+        if title == "error":
+            body = {"response": {"error": "API 호출 한도를 초과했습니다."}}
+        else:
+            body = {"response": {"docs": [{"doc": {"bookname": title, "isbn13": "9780000000000"}}]}}
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def run_checks(base_url: str) -> list:
+    """검사 실행 후 실패한 항목 이름 목록 반환"""
+    failures = []
+    calls = _StandInHandler.calls
+
+    def expect(name: str, condition: bool, detail=""):
+        print(f"{'✅' if condition else '❌'} {name}{f' ({detail})' if detail and not condition else ''}")
+        if not condition:
+            failures.append(name)
+
+    settings.LIBRARY_API_BASE_URL = base_url
+    settings.LIBRARY_API_KEY = SERVER_KEY
+    app = FastAPI()
+    app.include_router(library.router, prefix="/api/library")
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://proxy") as client:
+        async def get(title: str, *extra) -> httpx.Response:
+            params = [("title", title), ("format", "json"), *extra]
+            return await client.get("/api/library/srchBooks", params=params)
+
+        # 반복 파라미터 전달 + authKey 교체
+        response = await get("반복", ("keyword", "경험"), ("keyword", "멸종"), ("authKey", "client-key"))
+        sent = _StandInHandler.queries[-1]
+        expect("첫 요청은 원본 호출", response.status_code == 200 and response.headers["X-Cache"] == "MISS",
+               (response.status_code, response.headers.get("X-Cache")))
+        expect("반복 파라미터 모두 전달", [v for k, v in sent if k == "keyword"] == ["경험", "멸종"], sent)
+        expect("authKey는 서버 설정값", [v for k, v in sent if k == "authKey"] == [SERVER_KEY], sent)
+
+        # 신선한 캐시
+        response = await get("반복", ("keyword", "경험"), ("keyword", "멸종"))
+        expect("같은 요청은 캐시 응답 (HIT)", response.headers["X-Cache"] == "HIT" and calls["반복"] == 1,
+               (response.headers["X-Cache"], calls["반복"]))
+
+        # stale-while-revalidate
+        library_service.cache.ttl = 0.2
+        await get("오래된")
+        await asyncio.sleep(0.3)
+        started = time.perf_counter()
+        response = await get("오래된")
+        elapsed = time.perf_counter() - started
+        expect("TTL 이후 오래된 응답 즉시 반환 (STALE)",
+               response.headers["X-Cache"] == "STALE" and elapsed < UPSTREAM_DELAY,
+               (response.headers["X-Cache"], f"{elapsed * 1000:.0f}ms"))
+        await get("오래된")
+        await asyncio.sleep(UPSTREAM_DELAY * 2)
+        expect("백그라운드 갱신은 한 번만", calls["오래된"] == 2, calls["오래된"])
+        library_service.cache.ttl = settings.LIBRARY_CACHE_TTL
+
+        # single-flight
+        responses = await asyncio.gather(*(get("동시") for _ in range(5)))
+        expect("동시 요청 5개 모두 성공", all(r.status_code == 200 for r in responses),
+               [r.status_code for r in responses])
+        expect("동시 요청은 원본 한 번만 호출", calls["동시"] == 1, calls["동시"])
+
+        # 오류 본문은 캐시하지 않음
+        statuses = [(await get("error")).status_code for _ in range(2)]
+        expect("오류 본문은 502", statuses == [502, 502], statuses)
+        expect("오류 응답은 캐시하지 않음", calls["error"] == 2, calls["error"])
+
+    await http_fetcher.aclose()
+    return failures
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        failures = asyncio.run(run_checks(f"http://127.0.0.1:{server.server_address[1]}/api"))
+    finally:
+        server.shutdown()
+
+    if failures:
+        print(f"❌ 도서관 API 프록시 검사 실패: {len(failures)}개")
+        sys.exit(1)
+    print("✅ 도서관 API 프록시 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
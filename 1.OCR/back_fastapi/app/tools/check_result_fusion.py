@@ -0,0 +1,86 @@
+"""
+다중 변형 OCR 결과 융합 회귀 검사 도구
+
+app.services.result_fusion.fuse_results를 작은 고정 입력으로 실행하여 클러스터링 결과를 확인합니다.
+EasyOCR 모델이나 이미지 없이 몇 밀리초 안에 끝나며, 실패한 항목이 있으면 종료 코드 1로 끝납니다.
+
+검사 항목:
+- 겹치는 같은 텍스트 검출은 하나로 합쳐지고, 떨어진 검출은 각각 유지
+- 확대 변형 좌표를 기준 좌표로 환산한 뒤 같은 영역으로 합쳐짐
+- 넓이가 0인 박스(점, 가로선, 세로선)끼리 하나의 클러스터로 묶여 사라지지 않음
+
+사용법:
+    python -m app.tools.check_result_fusion
+"""
+
+import sys
+
+from app.services.result_fusion import fuse_results, rescale_results
+
+
+def _box(x1: float, y1: float, x2: float, y2: float) -> list:
+    return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+
+
+def _texts(results: list) -> list:
+    return sorted(text for _, text, _ in results)
+
+
+def run_checks() -> list:
+    """검사 실행 후 실패한 항목 이름 목록 반환"""
+    failures = []
+
+    def expect(name: str, condition: bool, detail=""):
+        print(f"{'✅' if condition else '❌'} {name}{f' ({detail})' if detail and not condition else ''}")
+        if not condition:
+            failures.append(name)
+
+    # 같은 영역의 같은 텍스트는 하나로, 떨어진 영역은 각각 유지
+    results = fuse_results([
+        (_box(0, 0, 100, 30), "경험의 멸종", 0.9),
+        (_box(2, 1, 101, 31), "경험의 멸종", 0.7),
+        (_box(0, 200, 80, 230), "저자", 0.8),
+    ])
+    expect("겹치는 같은 텍스트 병합", _texts(results) == ["경험의 멸종", "저자"], _texts(results))
+
+    # 같은 영역에서 텍스트가 다르면 신뢰도 합이 큰 텍스트 선택
+    results = fuse_results([
+        (_box(0, 0, 100, 30), "경험의 멸종", 0.6),
+        (_box(0, 0, 100, 30), "경험의 멸종", 0.6),
+        (_box(1, 0, 100, 30), "겅험의 멸중", 0.9),
+    ])
+    expect("클러스터 내 다수 텍스트 선택", _texts(results) == ["경험의 멸종"], _texts(results))
+
+    # 1.5배 확대 변형의 박스를 기준 좌표로 환산하면 같은 영역으로 합쳐짐
+    scaled = rescale_results([(_box(0, 0, 150, 45), "제목", 0.8)], 1.5, 1.5)
+    results = fuse_results([(_box(0, 0, 100, 30), "제목", 0.7)] + scaled)
+    expect("확대 변형 좌표 환산 후 병합", len(results) == 1, len(results))
+
+    # 넓이가 0인 박스: 자기 자신과의 IoU가 0이어도 서로 다른 클러스터로 유지
+    results = fuse_results([
+        (_box(0, 0, 0, 0), "A", 0.9),
+        (_box(50, 50, 50, 50), "B", 0.8),
+        (_box(100, 100, 200, 130), "C", 0.7),
+    ])
+    expect("점 박스 유지", _texts(results) == ["A", "B", "C"], _texts(results))
+
+    results = fuse_results([
+        (_box(0, 10, 100, 10), "가로선", 0.9),
+        (_box(0, 60, 100, 60), "다른 가로선", 0.8),
+        (_box(300, 0, 300, 50), "세로선", 0.7),
+    ])
+    expect("선 박스 유지", _texts(results) == ["가로선", "다른 가로선", "세로선"], _texts(results))
+
+    return failures
+
+
+def main():
+    failures = run_checks()
+    if failures:
+        print(f"❌ 결과 융합 검사 실패: {len(failures)}개")
+        sys.exit(1)
+    print("✅ 결과 융합 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
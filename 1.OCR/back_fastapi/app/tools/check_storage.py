@@ -0,0 +1,163 @@
+"""
+S3 결과 저장소 동작 검사 도구
+
+S3 호환 서버에 결과 파일을 올리고 내려받아 app.services.storage.S3Storage를 확인합니다.
+--endpoint-url을 주지 않으면 moto의 로컬 S3 대체 서버(ThreadedMotoServer)를 띄워 사용하므로
+AWS 계정 없이 실행할 수 있습니다 (pip install "moto[server]" boto3).
+실패한 항목이 있으면 종료 코드 1로 끝납니다.
+
+검사 항목:
+- put 후 get으로 같은 내용을 읽고, 없는 키는 None
+- presigned URL로 스토리지에서 직접 다운로드 (Content-Type, immutable Cache-Control 포함), 없는 키는 404
+- proxy / public URL 형식
+- --route: /api/ocr/result/{파일명} 라우트가 저장소에서 읽어 전달하고 없는 키는 404, ETag가 같으면 304
+  (app.api.routes.ocr를 가져오면서 EasyOCR 모델을 로딩하므로 기본으로는 생략)
+
+사용법:
+    # moto 대체 서버
+    python -m app.tools.check_storage
+    python -m app.tools.check_storage --route
+
+    # 실제 S3 호환 서버 (MinIO 등, 버킷이 없으면 생성)
+    python -m app.tools.check_storage --endpoint-url http://localhost:9000 --bucket ocr-check \\
+        --access-key minioadmin --secret-key minioadmin
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import sys
+
+import httpx
+
+from app.config.settings import settings
+
+TEST_BODY = b"\x89PNG\r\n\x1a\n" + b"storage-check" * 64
+
+
+def _configure(args, endpoint_url: str):
+    """저장소 설정을 검사 대상으로 변경 (app.services.storage를 가져오기 전에 호출)"""
+    settings.RESULT_STORAGE_BACKEND = "s3"
+    settings.RESULT_STORAGE_URL_MODE = "proxy"
+    settings.S3_BUCKET = args.bucket
+    settings.S3_PREFIX = "check/"
+    settings.S3_ENDPOINT_URL = endpoint_url
+    settings.S3_REGION = args.region
+    settings.S3_ACCESS_KEY_ID = args.access_key
+    settings.S3_SECRET_ACCESS_KEY = args.secret_key
+    settings.S3_PUBLIC_BASE_URL = "https://cdn.example.com/results"
+
+
+def _ensure_bucket(client, bucket: str):
+    from botocore.exceptions import ClientError
+
+    try:
+        client.head_bucket(Bucket=bucket)
+    except ClientError:
+        client.create_bucket(Bucket=bucket)
+
+
+async def _check_route(expect, key: str, missing_key: str):
+    """결과 이미지 라우트를 ASGI로 호출 (EasyOCR 로딩)"""
+    from fastapi import FastAPI
+
+    from app.api.routes import ocr
+
+    app = FastAPI()
+    app.include_router(ocr.router, prefix="/api/ocr")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://node") as client:
+        response = await client.get(ocr.result_storage.url(key))
+        expect("proxy 라우트 다운로드", response.status_code == 200 and response.content == TEST_BODY,
+               response.status_code)
+        response = await client.get(f"/api/ocr/result/{key}", headers={"If-None-Match": f'"{key}"'})
+        expect("proxy 라우트 ETag 재검증 (304)", response.status_code == 304, response.status_code)
+        response = await client.get(f"/api/ocr/result/{missing_key}")
+        expect("proxy 라우트 없는 키는 404", response.status_code == 404, response.status_code)
+
+
+def run_checks(args) -> list:
+    """검사 실행 후 실패한 항목 이름 목록 반환"""
+    from app.services.storage import S3Storage, result_storage
+
+    failures = []
+
+    def expect(name: str, condition: bool, detail=""):
+        print(f"{'✅' if condition else '❌'} {name}{f' ({detail})' if detail and not condition else ''}")
+        if not condition:
+            failures.append(name)
+
+    _ensure_bucket(result_storage.client, result_storage.bucket)
+    key = f"{hashlib.sha256(TEST_BODY).hexdigest()[:16]}.png"
+    missing_key = "0000000000000000.png"
+
+    # put / get
+    result_storage.put(key, TEST_BODY)
+    expect("put 후 get", result_storage.get(key) == TEST_BODY)
+    expect("없는 키 get은 None", result_storage.get(missing_key) is None)
+    expect("로컬 경로 없음", result_storage.local_path(key) is None)
+
+    # presigned URL: 스토리지에서 직접 다운로드
+    presigned = S3Storage(url_mode="presigned", client=result_storage.client)
+    response = httpx.get(presigned.url(key))
+    expect("presigned URL 다운로드", response.status_code == 200 and response.content == TEST_BODY,
+           response.status_code)
+    expect("Content-Type 저장", response.headers.get("Content-Type") == "image/png",
+           response.headers.get("Content-Type"))
+    expect("immutable Cache-Control 저장", "immutable" in response.headers.get("Cache-Control", ""),
+           response.headers.get("Cache-Control"))
+    response = httpx.get(presigned.url(missing_key))
+    expect("presigned URL 없는 키는 404", response.status_code == 404, response.status_code)
+
+    # proxy / public URL 형식
+    expect("proxy URL", result_storage.url(key) == f"/api/ocr/result/{key}", result_storage.url(key))
+    public = S3Storage(url_mode="public", client=result_storage.client)
+    expect("public URL", public.url(key) == f"https://cdn.example.com/results/{settings.S3_PREFIX}{key}", public.url(key))
+
+    if args.route:
+        asyncio.run(_check_route(expect, key, missing_key))
+
+    result_storage.client.delete_object(Bucket=result_storage.bucket, Key=f"{settings.S3_PREFIX}{key}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="S3 결과 저장소 동작 검사")
+    parser.add_argument("--endpoint-url", default="", help="S3 호환 서버 주소 (비어 있으면 moto 대체 서버 실행)")
+    parser.add_argument("--bucket", default="ocr-storage-check", help="검사에 사용할 버킷 (없으면 생성)")
+    parser.add_argument("--region", default="us-east-1", help="리전")
+    parser.add_argument("--access-key", default="testing", help="접근 키")
+    parser.add_argument("--secret-key", default="testing", help="비밀 키")
+    parser.add_argument("--route", action="store_true", help="결과 이미지 라우트까지 검사 (EasyOCR 로딩)")
+    args = parser.parse_args()
+
+    server = None
+    endpoint_url = args.endpoint_url
+    if not endpoint_url:
+        try:
+            from moto.server import ThreadedMotoServer
+        except ImportError:
+            print('❌ moto가 설치되어 있지 않습니다 (pip install "moto[server]") --endpoint-url로 S3 호환 서버를 지정하세요.')
+            sys.exit(1)
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)  # 대체 서버 요청 로그 생략
+        server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+        server.start()
+        host, port = server.get_host_and_port()
+        endpoint_url = f"http://{host}:{port}"
+
+    _configure(args, endpoint_url)
+    print(f"🪣 S3 결과 저장소 검사: {endpoint_url} (버킷: {args.bucket})")
+    try:
+        failures = run_checks(args)
+    finally:
+        if server is not None:
+            server.stop()
+
+    if failures:
+        print(f"❌ 결과 저장소 검사 실패: {len(failures)}개")
+        sys.exit(1)
+    print("✅ 결과 저장소 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
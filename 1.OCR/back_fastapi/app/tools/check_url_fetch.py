@@ -0,0 +1,141 @@
+"""
+URL 이미지 수집(HTTPFetcher) 동작 검사 도구
+
+로컬에 HTTP 서버(http.server)를 띄우고 app.core.http_client.HTTPFetcher로 내려받아 확인합니다.
+로컬 서버는 루프백 주소이므로 SSRF 차단 검사 뒤에는 OCR_URL_ALLOW_PRIVATE을 켠 상태로 진행합니다.
+외부 네트워크 없이 몇 초 안에 끝나며, 실패한 항목이 있으면 종료 코드 1로 끝납니다.
+
+검사 항목:
+- 루프백 주소는 요청을 보내기 전에 400으로 거절 (OCR_URL_ALLOW_PRIVATE=false)
+- 조회한 IP로 연결하면서 Host 헤더는 원래 호스트 이름 유지 (localhost)
+- ETag 응답을 디스크에 캐시하고 다음 요청은 조건부 요청(304)으로 캐시 사용
+- 리다이렉트를 따라가고, 최대 횟수를 넘으면 실패
+- 최대 크기를 넘는 응답은 413
+- 다운로드가 끝나면 호스트별 세마포어가 남지 않음
+
+사용법:
+    python -m app.tools.check_url_fetch
+"""
+
+import asyncio
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.config.settings import settings
+from app.core.exceptions import URLFetchException
+from app.core.http_client import HTTPFetcher
+
+IMAGE_BODY = b"\x89PNG\r\n\x1a\n" + b"0" * 256
+MAX_BYTES = 1024
+
+
+class _ImageHandler(BaseHTTPRequestHandler):
+    """이미지 서버: 받은 요청의 경로와 헤더를 기록"""
+
+    requests = []  # (경로, Host 헤더, If-None-Match 헤더)
+
+    def do_GET(self):
+        type(self).requests.append((self.path, self.headers.get("Host"), self.headers.get("If-None-Match")))
+        if self.path == "/image":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._respond(304)
+            else:
+                self._respond(200, IMAGE_BODY, {"ETag": '"v1"', "Content-Type": "image/png"})
+        elif self.path == "/redirect":
+            self._respond(302, headers={"Location": "/image"})
+        elif self.path == "/loop":
+            self._respond(302, headers={"Location": "/loop"})
+        elif self.path == "/large":
+            self._respond(200, b"0" * (MAX_BYTES * 4), {"Content-Type": "image/png"})
+        else:
+            self._respond(404)
+
+    def _respond(self, status: int, body: bytes = b"", headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def _fetch_error(fetcher: HTTPFetcher, url: str):
+    """다운로드 실패 시 상태 코드 (성공하면 None)"""
+    try:
+        await fetcher.fetch(url)
+    except URLFetchException as e:
+        return e.status_code
+    return None
+
+
+async def run_checks(port: int, cache_dir: str) -> list:
+    """검사 실행 후 실패한 항목 이름 목록 반환"""
+    failures = []
+    requests = _ImageHandler.requests
+    fetcher = HTTPFetcher(max_bytes=MAX_BYTES, cache_dir=cache_dir)
+
+    def expect(name: str, condition: bool, detail=""):
+        print(f"{'✅' if condition else '❌'} {name}{f' ({detail})' if detail and not condition else ''}")
+        if not condition:
+            failures.append(name)
+
+    # SSRF 차단: 요청이 서버에 도달하지 않아야 함
+    settings.OCR_URL_ALLOW_PRIVATE = False
+    status = await _fetch_error(fetcher, f"http://localhost:{port}/image")
+    expect("루프백 주소 거절 (400)", status == 400 and not requests, (status, requests))
+
+    settings.OCR_URL_ALLOW_PRIVATE = True
+    try:
+        # 조회한 IP로 연결, Host 헤더는 원래 이름
+        body = await fetcher.fetch(f"http://localhost:{port}/image")
+        expect("이미지 다운로드", body == IMAGE_BODY, len(body))
+        expect("Host 헤더는 원래 호스트 이름", requests[-1][1] == f"localhost:{port}", requests[-1])
+
+        # 조건부 요청
+        body = await fetcher.fetch(f"http://localhost:{port}/image")
+        expect("두 번째 요청은 If-None-Match로 재검증", requests[-1][2] == '"v1"', requests[-1])
+        expect("304 응답이면 캐시 본문 반환", body == IMAGE_BODY, len(body))
+
+        # 리다이렉트
+        body = await fetcher.fetch(f"http://localhost:{port}/redirect")
+        expect("리다이렉트 따라감", body == IMAGE_BODY and requests[-1][0] == "/image", requests[-2:])
+        before = len(requests)
+        status = await _fetch_error(fetcher, f"http://localhost:{port}/loop")
+        expect("리다이렉트 횟수 제한", status is not None and len(requests) - before == settings.OCR_URL_MAX_REDIRECTS + 1,
+               (status, len(requests) - before))
+
+        # 크기 제한
+        status = await _fetch_error(fetcher, f"http://localhost:{port}/large")
+        expect("최대 크기 초과는 413", status == 413, status)
+
+        # 호스트별 세마포어 정리
+        await asyncio.gather(*(fetcher.fetch(f"http://localhost:{port}/image") for _ in range(10)))
+        expect("호스트별 세마포어 정리", not fetcher._host_limits, list(fetcher._host_limits))
+    finally:
+        settings.OCR_URL_ALLOW_PRIVATE = False
+        await fetcher.aclose()
+    return failures
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ImageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            failures = asyncio.run(run_checks(server.server_address[1], cache_dir))
+    finally:
+        server.shutdown()
+
+    if failures:
+        print(f"❌ URL 이미지 수집 검사 실패: {len(failures)}개")
+        sys.exit(1)
+    print("✅ URL 이미지 수집 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
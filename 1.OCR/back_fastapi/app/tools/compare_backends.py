@@ -0,0 +1,129 @@
+"""
+OCR 추론 백엔드 정확도/지연시간 비교 도구
+
+같은 이미지 집합에 대해 torch 백엔드와 ONNX Runtime 백엔드의 readtext 결과를 비교합니다.
+백엔드를 전환하기 전에 인식 결과가 유지되는지, 실제로 빨라지는지 검증하는 용도입니다.
+
+측정 항목:
+- 이미지별 지연시간 (반복 실행 중앙값)
+- 텍스트 유사도 (difflib 문자 단위 유사도, 1.0 = 동일)
+- 검출된 텍스트 박스 수
+
+사용법:
+    python -m app.tools.compare_backends test_images/
+    python -m app.tools.compare_backends test_images/ --runs 5 --no-quantize --json compare.json
+"""
+
+import argparse
+import difflib
+import glob
+import json
+import os
+import statistics
+import time
+
+import cv2
+import easyocr
+
+from app.config.settings import settings
+from app.services.image_service import ImageService
+from app.services.inference_backend import apply_backend
+
+# OCRService._resize_image와 같은 기준 (긴 변 1024px)
+MAX_IMAGE_SIZE = (1024, 1024)
+
+
+def _collect_images(target: str) -> list:
+    """디렉토리 또는 glob 패턴에서 이미지 경로 수집"""
+    if os.path.isdir(target):
+        paths = [os.path.join(target, f) for f in sorted(os.listdir(target))]
+    else:
+        paths = sorted(glob.glob(target))
+    return [p for p in paths if os.path.splitext(p)[1].lower() in settings.ALLOWED_EXTENSIONS]
+
+
+def _run(reader: easyocr.Reader, image, runs: int):
+    """readtext를 반복 실행하여 (마지막 결과, 지연시간 중앙값 ms) 반환"""
+    timings = []
+    results = []
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        results = reader.readtext(image)
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return results, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="torch / ONNX Runtime OCR 백엔드 비교")
+    parser.add_argument("images", help="이미지 디렉토리 또는 glob 패턴")
+    parser.add_argument("--languages", nargs="+", default=settings.OCR_LANGUAGES, help="인식 언어 목록")
+    parser.add_argument("--runs", type=int, default=3, help="이미지별 반복 실행 횟수")
+    parser.add_argument("--no-quantize", action="store_true", help="fp32 ONNX 모델로 비교")
+    parser.add_argument("--json", help="이미지별 결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    image_paths = _collect_images(args.images)
+    if not image_paths:
+        print(f"❌ 비교할 이미지가 없습니다: {args.images}")
+        return
+
+    print("🔧 torch 백엔드 리더 초기화...")
+    torch_reader = easyocr.Reader(args.languages, gpu=False, verbose=False)
+    print("🔧 ONNX 백엔드 리더 초기화...")
+    onnx_reader = apply_backend(
+        easyocr.Reader(args.languages, gpu=False, verbose=False),
+        args.languages,
+        backend="onnx",
+        quantize=not args.no_quantize,
+    )
+
+    rows = []
+    for path in image_paths:
+        image = cv2.imread(path)
+        if image is None:
+            print(f"⚠️ 이미지를 읽을 수 없습니다: {path}")
+            continue
+        image = ImageService.resize_image(image, MAX_IMAGE_SIZE)
+
+        # 워밍업 (첫 실행의 세션/메모리 초기화 비용 제외)
+        torch_reader.readtext(image)
+        onnx_reader.readtext(image)
+
+        torch_results, torch_ms = _run(torch_reader, image, args.runs)
+        onnx_results, onnx_ms = _run(onnx_reader, image, args.runs)
+
+        torch_text = " ".join(text for _, text, _ in torch_results)
+        onnx_text = " ".join(text for _, text, _ in onnx_results)
+        similarity = difflib.SequenceMatcher(None, torch_text, onnx_text).ratio()
+
+        rows.append({
+            "image": os.path.basename(path),
+            "torch_ms": round(torch_ms, 1),
+            "onnx_ms": round(onnx_ms, 1),
+            "torch_boxes": len(torch_results),
+            "onnx_boxes": len(onnx_results),
+            "similarity": round(similarity, 4),
+            "torch_text": torch_text,
+            "onnx_text": onnx_text,
+        })
+        print(f"📊 {os.path.basename(path)}: torch {torch_ms:.0f}ms / onnx {onnx_ms:.0f}ms, 유사도 {similarity:.3f}")
+
+    if not rows:
+        return
+
+    torch_mean = statistics.mean(r["torch_ms"] for r in rows)
+    onnx_mean = statistics.mean(r["onnx_ms"] for r in rows)
+    print("\n========== 비교 결과 ==========")
+    print(f"이미지 수: {len(rows)}")
+    print(f"평균 지연시간: torch {torch_mean:.1f}ms / onnx {onnx_mean:.1f}ms (x{torch_mean / max(onnx_mean, 1e-6):.2f})")
+    print(f"평균 텍스트 유사도: {statistics.mean(r['similarity'] for r in rows):.4f}")
+    print(f"완전 일치 비율: {sum(r['torch_text'] == r['onnx_text'] for r in rows) / len(rows):.1%}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
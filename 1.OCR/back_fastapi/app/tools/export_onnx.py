@@ -0,0 +1,30 @@
+"""
+EasyOCR → ONNX 모델 변환 도구
+
+검출기(CRAFT)와 인식기를 ONNX로 변환하고, 선택적으로 int8 동적 양자화 모델을 생성합니다.
+생성된 모델은 settings.OCR_ONNX_DIR에 저장되며 OCR_BACKEND=onnx일 때 사용됩니다.
+
+사용법:
+    python -m app.tools.export_onnx --languages ko en
+    python -m app.tools.export_onnx --languages ko en --no-quantize
+"""
+
+import argparse
+
+from app.config.settings import settings
+from app.services.inference_backend import export_onnx_models
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EasyOCR 검출기/인식기 ONNX 변환")
+    parser.add_argument("--languages", nargs="+", default=settings.OCR_LANGUAGES, help="인식기 언어 목록 (예: ko en)")
+    parser.add_argument("--no-quantize", action="store_true", help="int8 동적 양자화 모델을 만들지 않음")
+    args = parser.parse_args()
+
+    detector_path, recognizer_path = export_onnx_models(args.languages, quantize=not args.no_quantize)
+    print(f"📦 검출기: {detector_path}")
+    print(f"📦 인식기: {recognizer_path}")
+
+
+if __name__ == "__main__":
+    main()
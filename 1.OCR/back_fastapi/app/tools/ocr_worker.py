@@ -0,0 +1,71 @@
+"""
+분산 OCR 워커 노드 실행 도구
+
+OCR_QUEUE_BACKEND=redis로 실행한 API 노드들이 Redis Stream에 넣은 OCR 작업을 가져와 처리합니다.
+워커 노드를 늘리면 API 노드 수와 관계없이 OCR 처리량을 늘릴 수 있습니다.
+
+동작 방식:
+- 컨슈머 그룹(OCR_QUEUE_GROUP)의 컨슈머로 참여하여 작업을 다른 워커와 나누어 가져감
+- --concurrency개의 작업을 동시에 처리 (OCR 실행은 OCR 스케줄러의 스레드 예산 안에서 수행)
+- 결과 이미지는 결과 저장소(RESULT_STORAGE_BACKEND)에 저장하므로 여러 노드 구성에서는 s3 사용
+- SIGINT/SIGTERM을 받으면 진행 중인 작업을 마치고 종료
+  (강제 종료로 ACK하지 못한 작업은 OCR_QUEUE_CLAIM_IDLE_MS 이후 다른 워커가 다시 처리)
+
+사용법:
+    REDIS_URL=redis://redis:6379/0 RESULT_STORAGE_BACKEND=s3 python -m app.tools.ocr_worker
+    python -m app.tools.ocr_worker --concurrency 4 --consumer worker-a
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+
+from app.services import reader_registry
+from app.services.distributed_queue import aioredis, distributed_queue
+from app.services.ocr_scheduler import ocr_scheduler
+
+
+async def run_worker(concurrency: int, consumer: str):
+    """작업 처리 루프 concurrency개 실행 (종료 신호까지)"""
+    from app.services.ocr_service import OCRService
+
+    ocr_service = OCRService()
+
+    async def handler(contents: bytes):
+        return await ocr_scheduler.run(ocr_service._process_upload, contents)
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    await distributed_queue.ensure_group()
+    print(f"👷 분산 OCR 워커 시작: {consumer} (스트림: {distributed_queue.stream}, 동시 작업: {concurrency})")
+    try:
+        await asyncio.gather(*[
+            distributed_queue.consume(handler, consumer, stop_event) for _ in range(concurrency)
+        ])
+    finally:
+        await distributed_queue.aclose()
+        print(f"👋 분산 OCR 워커 종료: {consumer}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis Streams 분산 OCR 워커")
+    parser.add_argument("--concurrency", type=int, default=max(1, ocr_scheduler.max_jobs), help="동시에 처리할 작업 수")
+    parser.add_argument("--consumer", default=f"{socket.gethostname()}-{os.getpid()}", help="컨슈머 이름 (워커마다 고유)")
+    args = parser.parse_args()
+
+    if aioredis is None:
+        raise SystemExit("❌ redis 패키지가 필요합니다 (pip install redis).")
+    reader_registry.configure_worker_threads()
+    asyncio.run(run_worker(args.concurrency, args.consumer))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+gunicorn 멀티 워커 실행 설정
+
+마스터 프로세스가 EasyOCR 모델을 미리 로딩한 뒤 워커를 fork하여
+워커들이 읽기 전용 가중치 메모리를 공유(copy-on-write)하도록 합니다.
+
+실행 방법:
+    gunicorn -c gunicorn.conf.py app.main:app
+
+관련 환경변수:
+- OCR_WORKERS: 워커 프로세스 수
+- OCR_PRELOAD_MODELS: fork 전 모델 선로딩 여부 (기본값 true)
+- OCR_TORCH_THREADS: 워커당 torch 스레드 수 (0 = 코어 수 / 워커 수)
+- OCR_PIN_CORES: 워커별로 겹치지 않는 코어 집합에 고정할지 여부
+"""
+
+from app.config.settings import settings
+
+# ==================== 서버 설정 ====================
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = settings.OCR_WORKERS
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = 120  # OCR 다중 전처리 시도가 오래 걸릴 수 있으므로 여유 있게 설정
+
+# ==================== 모델 공유 설정 ====================
+# preload_app=True: 마스터에서 app.main을 import하여 EasyOCR 리더를 fork 전에 생성
+preload_app = settings.OCR_PRELOAD_MODELS
+
+
+def when_ready(server):
+    """앱 로딩이 끝난 뒤(워커 fork 직전) 마스터에서 실행"""
+    if preload_app:
+        from app.services import reader_registry
+        reader_registry.preload_models()
+
+
+def pre_fork(server, worker):
+    """워커 fork 직전 마스터에서 실행: 살아있는 워커와 겹치지 않는 코어 슬롯 배정"""
+    used_slots = {getattr(w, "cpu_slot", None) for w in server.WORKERS.values()}
+    worker.cpu_slot = next(slot for slot in range(workers + 1) if slot not in used_slots)
+
+
+def post_fork(server, worker):
+    """워커 fork 직후 워커 프로세스에서 실행"""
+    if settings.OCR_PIN_CORES:
+        from app.services import reader_registry
+        reader_registry.pin_process_to_cores(worker.cpu_slot, workers)